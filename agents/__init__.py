@@ -5,11 +5,13 @@ from .job_analyzer_agent import create_job_analyzer_agent
 from .skill_gap_agent import create_skill_gap_agent
 from .recommendation_agent import create_recommendation_agent
 from .coordinator_agent import create_coordinator_agent
+from .pipeline import run_analysis_pipeline
 
 __all__ = [
     'create_resume_parser_agent',
     'create_job_analyzer_agent',
     'create_skill_gap_agent',
     'create_recommendation_agent',
-    'create_coordinator_agent'
+    'create_coordinator_agent',
+    'run_analysis_pipeline'
 ]
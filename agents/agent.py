@@ -1,7 +1,16 @@
 # 1. Import the function that creates agents
 from .coordinator_agent import create_coordinator_agent
 
-# 2. Create ONE instance at module level
-root_agent = create_coordinator_agent()
+_root_agent = None
+
+
+# 2. Build ONE instance the first time `root_agent` is looked up, not at import
+def __getattr__(name):
+    global _root_agent
+    if name == "root_agent":
+        if _root_agent is None:
+            _root_agent = create_coordinator_agent()
+        return _root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Now ADK Web can find it and use it!
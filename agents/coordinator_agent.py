@@ -1,18 +1,21 @@
 """Coordinator Agent - Pure ADK Root Agent"""
-from google.adk.agents import Agent
+from typing import TYPE_CHECKING
 from agents.resume_parser_agent import create_resume_parser_agent
 from agents.job_analyzer_agent import create_job_analyzer_agent
 from agents.skill_gap_agent import create_skill_gap_agent
 from agents.recommendation_agent import create_recommendation_agent
 from config import Config
 
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
+
 
 config = Config()
 # genai.configure(api_key=config.GEMINI_API_KEY)
 # model = genai.GenerativeModel(config.GEMINI_MODEL)
 
 
-def create_coordinator_agent() -> Agent:
+def create_coordinator_agent() -> "Agent":
     """
     Create Coordinator Agent.
 
@@ -28,6 +31,8 @@ def create_coordinator_agent() -> Agent:
         Root coordinator agent
     """
 
+    from google.adk.agents import Agent
+
     # Create all sub-agents
     parser_agent = create_resume_parser_agent()
     analyzer_agent = create_job_analyzer_agent()
@@ -1,15 +1,34 @@
 """Job Analyzer Agent - Pure ADK"""
-from google.adk.agents import Agent
-from google.adk.tools import FunctionTool
-import google.generativeai as genai
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from tools.skill_tools import extract_skills
+from tools.fast_job_analyzer import analyze_job_fast
+from tools.job_dedup import deduplicate_postings
+from tools.llm_cache import LLMCache, get_llm_cache
+from tools.prompt_compaction import compact_text, estimate_tokens
+from tools.tracing import traced_tool, traced_generate, traced_generate_async, record_cache, span
 
 from config import Config
+import asyncio
+import copy
 import json
+import time
+
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
 
 config = Config()
-genai.configure(api_key=config.GEMINI_API_KEY)
-model = genai.GenerativeModel(config.GEMINI_MODEL)
+_shared_model = None
+
+
+def _get_model():
+    """Gemini client, configured on first use rather than at import time."""
+    global _shared_model
+    if _shared_model is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=Config.GEMINI_API_KEY)
+        _shared_model = genai.GenerativeModel(Config.GEMINI_MODEL)
+    return _shared_model
 
 
 # @agent(name="job_analyzer_agent")
@@ -30,10 +49,13 @@ async def job_analyzer_agent_v1(job_description: str)-> dict:
         Structured job requirements
     """
 
+    job_text = compact_text(
+        job_description, config.PROMPT_TOKEN_BUDGETS["analyze_job.job_description"], name="job_description"
+    )
     prompt = f"""
     
        Job Description:
-       {job_description[:2500]}
+       {job_text}
     
        Return ONLY a JSON object with these keys:
        {{
@@ -44,9 +66,23 @@ async def job_analyzer_agent_v1(job_description: str)-> dict:
        }}
        """
 
+    cache = get_llm_cache()
+    cache_key = LLMCache.make_key(
+        "job_analyzer_agent_v1",
+        job_description,
+        config.GEMINI_MODEL,
+        config.JOB_ANALYSIS_PROMPT_VERSION
+    )
+    if cache is not None:
+        cached = cache.get(cache_key)
+        record_cache(cached is not None)
+        if cached is not None:
+            return cached
+
     try:
-        response = model.generate_content(prompt)
+        response = traced_generate(_get_model(), prompt, "gemini.job_analyzer_v1")
         result = _parse_json(response.text)
+        parsed = bool(result)
 
         # Also extract skills using keyword tool
         extracted_skills = extract_skills(
@@ -56,11 +92,14 @@ async def job_analyzer_agent_v1(job_description: str)-> dict:
 
         # Combine
         all_skills = list(set(
-            result.get("required_technical_skills", []) + extracted_skills
+            result.get("required_technical_skills", []) + extracted_skills["skills"]
         ))
         result["required_technical_skills"] = all_skills
         result["status"] = "analyzed_successfully"
 
+        if cache is not None and parsed:
+            cache.put(cache_key, result)
+
         return result
 
     except Exception as e:
@@ -89,24 +128,21 @@ def _parse_json(text: str)-> dict:
         return {}
 
 
-def analyze_job_with_gemini(job_description: str) -> dict:
-    """
-    Use Gemini to analyze job description.
+def _compact_job_description(job_description: str) -> str:
+    # Requirements at the end of long postings survive; benefits and EEO text go first
+    return compact_text(
+        job_description, Config.PROMPT_TOKEN_BUDGETS["analyze_job.job_description"], name="job_description"
+    )
 
-    Args:
-        job_description: Raw job description text
 
-    Returns:
-        Structured job requirements
-    """
-    genai.configure(api_key=Config.GEMINI_API_KEY)
-    model = genai.GenerativeModel(Config.GEMINI_MODEL)
+def _job_analysis_prompt(job_description: str) -> str:
+    job_text = _compact_job_description(job_description)
 
-    prompt = f"""
+    return f"""
     Analyze this job description and extract key information.
 
     Job Description:
-    {job_description[:2500]}
+    {job_text}
 
     Return ONLY a JSON object with these exact keys:
     {{
@@ -120,31 +156,440 @@ def analyze_job_with_gemini(job_description: str) -> dict:
     Be specific and extract actual skills mentioned in the job description.
     """
 
+
+def _job_analysis_cache_key(job_description: str) -> str:
+    return LLMCache.make_key(
+        "analyze_job_with_gemini",
+        job_description,
+        Config.GEMINI_MODEL,
+        Config.JOB_ANALYSIS_PROMPT_VERSION
+    )
+
+
+def _cached_job_analysis(cache: Optional[LLMCache], cache_key: str) -> Optional[dict]:
+    if cache is None:
+        return None
+    cached = cache.get(cache_key)
+    record_cache(cached is not None)
+    return cached
+
+
+def _finish_job_analysis(job_description: str,
+                         result: dict,
+                         cache: Optional[LLMCache],
+                         cache_key: str) -> dict:
+    """Merge the parsed Gemini answer with keyword-extracted skills and cache it."""
+    parsed = bool(result)
+
+    # Also extract skills using keyword tool
+    extracted_skills = extract_skills(job_description, Config.SKILL_DATABASE)
+
+    # Combine
+    all_technical = list(set(
+        result.get("required_technical_skills", []) +
+        extracted_skills.get("skills", [])
+    ))
+    result["required_technical_skills"] = all_technical
+
+    # Only cache answers that actually parsed
+    if cache is not None and parsed:
+        cache.put(cache_key, result)
+
+    return result
+
+
+def _job_analysis_error(e: Exception) -> dict:
+    return {
+        "required_technical_skills": [],
+        "required_soft_skills": [],
+        "experience_level": "Not specified",
+        "key_responsibilities": [],
+        "salary_range": "",
+        "error": str(e)
+    }
+
+
+def _job_analysis_fallback(job_description: str, e: Exception) -> dict:
+    """Fast-tier analysis marked as degraded, or the empty error result when fallback is off."""
+    if not Config.JOB_ANALYSIS_FALLBACK:
+        return _job_analysis_error(e)
+    result = analyze_job_fast(job_description)
+    result["degraded"] = True
+    result["fallback_reason"] = str(e) or type(e).__name__
+    return result
+
+
+def _parsed_job_analysis(response_text: str) -> dict:
+    result = _parse_json_response(response_text)
+    if not isinstance(result, dict) or not result:
+        raise ValueError("Unparseable job analysis response")
+    return result
+
+
+def analyze_job_with_gemini(job_description: str) -> dict:
+    """
+    Use Gemini to analyze job description.
+
+    With Config.JOB_ANALYSIS_TIER = "fast" the local rule-based analyzer
+    answers instead. When Gemini fails, exceeds JOB_ANALYSIS_TIMEOUT or
+    returns unparseable output, the fast analyzer's result is returned
+    with "degraded": True (unless JOB_ANALYSIS_FALLBACK is off).
+
+    Args:
+        job_description: Raw job description text
+
+    Returns:
+        Structured job requirements
+    """
+    if Config.JOB_ANALYSIS_TIER == "fast":
+        return analyze_job_fast(job_description)
+
+    # Identical postings are analyzed against many applicants, reuse the answer
+    cache = get_llm_cache()
+    cache_key = _job_analysis_cache_key(job_description)
+    cached = _cached_job_analysis(cache, cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        response = model.generate_content(prompt)
-        result = _parse_json_response(response.text)
+        response = traced_generate(
+            _get_model(), _job_analysis_prompt(job_description), "gemini.analyze_job",
+            request_options={"timeout": Config.JOB_ANALYSIS_TIMEOUT}
+        )
+        return _finish_job_analysis(job_description, _parsed_job_analysis(response.text), cache, cache_key)
 
-        # Also extract skills using keyword tool
-        extracted_skills = extract_skills(job_description, Config.SKILL_DATABASE)
+    except Exception as e:
+        return _job_analysis_fallback(job_description, e)
 
-        # Combine
-        all_technical = list(set(
-            result.get("required_technical_skills", []) +
-            extracted_skills.get("skills", [])
-        ))
-        result["required_technical_skills"] = all_technical
 
-        return result
+async def analyze_job_with_gemini_async(job_description: str) -> dict:
+    """
+    Async counterpart of analyze_job_with_gemini.
+
+    Args:
+        job_description: Raw job description text
+
+    Returns:
+        Structured job requirements
+    """
+    if Config.JOB_ANALYSIS_TIER == "fast":
+        return analyze_job_fast(job_description)
+
+    cache = get_llm_cache()
+    cache_key = _job_analysis_cache_key(job_description)
+    cached = _cached_job_analysis(cache, cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await asyncio.wait_for(
+            traced_generate_async(_get_model(), _job_analysis_prompt(job_description), "gemini.analyze_job"),
+            Config.JOB_ANALYSIS_TIMEOUT
+        )
+        return _finish_job_analysis(job_description, _parsed_job_analysis(response.text), cache, cache_key)
 
     except Exception as e:
-        return {
+        return _job_analysis_fallback(job_description, e)
+
+
+# Per-posting wrapper tokens in the batch prompt
+_BATCH_POSTING_OVERHEAD = 12
+
+_BATCH_UNPARSED = "No valid analysis for this posting in the batch response"
+
+
+def _pack_job_batches(items: List[Tuple[str, str, str]],
+                      budget_tokens: int,
+                      max_postings: int) -> List[List[Tuple[str, str, str]]]:
+    """
+    Group (cache_key, description, compacted_text) items into batches
+    whose compacted text fits budget_tokens, in input order.
+    """
+    batches: List[List[Tuple[str, str, str]]] = []
+    current: List[Tuple[str, str, str]] = []
+    used = 0
+    for item in items:
+        cost = estimate_tokens(item[2]) + _BATCH_POSTING_OVERHEAD
+        if current and (used + cost > budget_tokens or len(current) >= max_postings):
+            batches.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _job_batch_prompt(batch: List[Tuple[str, str, str]]) -> str:
+    # Batch-local ids are short and safe to echo back, unlike feed ids
+    postings = "\n\n".join(
+        f'<posting id="{i}">\n{job_text}\n</posting>'
+        for i, (_, _, job_text) in enumerate(batch)
+    )
+
+    return f"""
+    Analyze each of these job descriptions and extract key information.
+
+    {postings}
+
+    Return ONLY a JSON array with one object per posting, each with these exact keys:
+    [
+        {{
+            "id": "",
             "required_technical_skills": [],
             "required_soft_skills": [],
-            "experience_level": "Not specified",
+            "experience_level": "",
             "key_responsibilities": [],
-            "salary_range": "",
-            "error": str(e)
-        }
+            "salary_range": ""
+        }}
+    ]
+
+    Use each posting's id exactly as given. Be specific and extract actual
+    skills mentioned in each job description.
+    """
+
+
+def _parse_job_batch(text: str, size: int) -> Dict[int, dict]:
+    """Answers by batch position; entries with unknown ids or the wrong shape are dropped."""
+    answers = _parse_json_response(text)
+    if not isinstance(answers, list):
+        return {}
+
+    parsed: Dict[int, dict] = {}
+    for answer in answers:
+        if not isinstance(answer, dict) or not isinstance(answer.get("required_technical_skills"), list):
+            continue
+        try:
+            index = int(answer.pop("id"))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= index < size:
+            parsed[index] = answer
+    return parsed
+
+
+def _collect_job_batch(batch: List[Tuple[str, str, str]],
+                       response_text: str,
+                       cache: Optional[LLMCache],
+                       results: Dict[str, dict]) -> List[Tuple[str, str, str]]:
+    """Store parsed answers in results and return the postings still unanswered."""
+    answers = _parse_job_batch(response_text, len(batch))
+    for index, (cache_key, description, _) in enumerate(batch):
+        if index in answers:
+            results[cache_key] = _finish_job_analysis(description, answers[index], cache, cache_key)
+    return [item for index, item in enumerate(batch) if index not in answers]
+
+
+def _retry_batches(batch: List[Tuple[str, str, str]],
+                   failed: List[Tuple[str, str, str]]) -> List[List[Tuple[str, str, str]]]:
+    """
+    Retry postings missing from a parsed answer: a partial failure as one
+    smaller batch, a total failure as two halves.
+    """
+    if len(failed) < len(batch):
+        return [failed]
+    middle = len(failed) // 2
+    return [failed[:middle], failed[middle:]]
+
+
+def _batch_backoff(attempt: int) -> float:
+    """Seconds to wait before retrying a batch whose call raised."""
+    return Config.JOB_BATCH_BACKOFF_SECONDS * 2 ** attempt
+
+
+def _fall_back_job_batch(batch: List[Tuple[str, str, str]],
+                         error: Exception,
+                         results: Dict[str, dict]) -> None:
+    for cache_key, description, _ in batch:
+        results[cache_key] = _job_analysis_fallback(description, error)
+
+
+def _prepare_job_batches(postings: Dict[str, str],
+                         cache: Optional[LLMCache],
+                         results: Dict[str, dict]) -> Tuple[Dict[str, str], List[List[Tuple[str, str, str]]]]:
+    """Resolve cached postings, then pack the rest (each distinct text once)."""
+    keys: Dict[str, str] = {}
+    pending: Dict[str, Tuple[str, str, str]] = {}
+    for posting_id, description in postings.items():
+        cache_key = _job_analysis_cache_key(description)
+        keys[posting_id] = cache_key
+        if cache_key in results or cache_key in pending:
+            continue
+        cached = _cached_job_analysis(cache, cache_key)
+        if cached is not None:
+            results[cache_key] = cached
+        else:
+            pending[cache_key] = (cache_key, description, _compact_job_description(description))
+
+    batches = _pack_job_batches(
+        list(pending.values()), Config.JOB_BATCH_TOKEN_BUDGET, Config.JOB_BATCH_MAX_POSTINGS
+    )
+    return keys, batches
+
+
+def _dedup_postings(postings: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Canonical postings to analyze, and duplicate id -> canonical id for the rest."""
+    if not Config.JOB_DEDUP_ENABLED or len(postings) < 2:
+        return postings, {}
+    duplicate_of = deduplicate_postings(postings)["duplicate_of"]
+    unique = {posting_id: text for posting_id, text in postings.items() if posting_id not in duplicate_of}
+    return unique, duplicate_of
+
+
+def _job_batch_result(postings: Dict[str, str],
+                      keys: Dict[str, str],
+                      results: Dict[str, dict],
+                      llm_calls: int,
+                      duplicate_of: Dict[str, str]) -> dict:
+    # Near-duplicates reuse their canonical posting's analysis, each as its
+    # own copy so editing one posting's result leaves the others alone
+    analyses: Dict[str, dict] = {}
+    handed_out = set()
+    for posting_id in postings:
+        cache_key = keys[duplicate_of.get(posting_id, posting_id)]
+        analysis = results[cache_key]
+        analyses[posting_id] = copy.deepcopy(analysis) if cache_key in handed_out else analysis
+        handed_out.add(cache_key)
+    return {
+        "success": True,
+        "analyses": analyses,
+        "failed": [posting_id for posting_id, analysis in analyses.items() if "error" in analysis],
+        "degraded": [posting_id for posting_id, analysis in analyses.items() if analysis.get("degraded")],
+        "duplicate_of": duplicate_of,
+        "llm_calls": llm_calls
+    }
+
+
+def _fast_job_batch(postings: Dict[str, str]) -> dict:
+    return {
+        "success": True,
+        "analyses": {posting_id: analyze_job_fast(description) for posting_id, description in postings.items()},
+        "failed": [],
+        "degraded": [],
+        "duplicate_of": {},
+        "llm_calls": 0
+    }
+
+
+def analyze_jobs_batch(postings: Dict[str, str]) -> dict:
+    """
+    Analyze many job postings with as few Gemini calls as possible.
+
+    Uncached postings are compacted and packed into prompts of up to
+    Config.JOB_BATCH_TOKEN_BUDGET tokens (and JOB_BATCH_MAX_POSTINGS
+    postings), and Gemini answers each batch with a JSON array keyed by
+    posting id. Postings missing from a malformed answer are retried on
+    their own batch, splitting in half when nothing parsed, so one bad
+    posting costs a few extra calls rather than the whole batch. A posting
+    that still fails alone falls back like analyze_job_with_gemini, and
+    answers share its cache.
+
+    A call that raises (rate limit, quota, timeout) says nothing about
+    the postings, so its batch is retried whole after a backoff, up to
+    Config.JOB_BATCH_RETRIES times, and then every posting in it falls
+    back.
+
+    Args:
+        postings: Job description text by posting id
+
+    Returns:
+        Dictionary with analyses by posting id, failed and degraded
+        posting ids and the number of Gemini calls made
+    """
+    if Config.JOB_ANALYSIS_TIER == "fast":
+        return _fast_job_batch(postings)
+
+    unique, duplicate_of = _dedup_postings(postings)
+    cache = get_llm_cache()
+    results: Dict[str, dict] = {}
+    keys, batches = _prepare_job_batches(unique, cache, results)
+    queue = [(batch, 0) for batch in batches]
+    llm_calls = 0
+
+    with span("analyze_jobs_batch", kind="batch", postings=len(postings)) as active:
+        while queue:
+            batch, attempt = queue.pop()
+            llm_calls += 1
+            try:
+                response = traced_generate(
+                    _get_model(), _job_batch_prompt(batch), "gemini.analyze_job_batch",
+                    request_options={"timeout": Config.JOB_ANALYSIS_TIMEOUT}
+                )
+                failed = _collect_job_batch(batch, response.text, cache, results)
+            except Exception as e:
+                if attempt < Config.JOB_BATCH_RETRIES:
+                    time.sleep(_batch_backoff(attempt))
+                    queue.append((batch, attempt + 1))
+                else:
+                    _fall_back_job_batch(batch, e, results)
+                continue
+
+            if len(batch) == 1 and failed:
+                results[batch[0][0]] = _job_analysis_fallback(batch[0][1], ValueError(_BATCH_UNPARSED))
+            elif failed:
+                queue.extend((retry, 0) for retry in _retry_batches(batch, failed))
+        active.set(llm_calls=llm_calls)
+
+    return _job_batch_result(postings, keys, results, llm_calls, duplicate_of)
+
+
+async def analyze_jobs_batch_async(postings: Dict[str, str]) -> dict:
+    """
+    Async counterpart of analyze_jobs_batch.
+
+    Batches run concurrently, at most Config.LLM_MAX_CONCURRENCY at once,
+    and each call is bounded by Config.JOB_ANALYSIS_TIMEOUT.
+
+    Args:
+        postings: Job description text by posting id
+
+    Returns:
+        Dictionary with analyses by posting id, failed and degraded
+        posting ids, duplicate -> canonical ids and the number of Gemini
+        calls made
+    """
+    if Config.JOB_ANALYSIS_TIER == "fast":
+        return _fast_job_batch(postings)
+
+    unique, duplicate_of = _dedup_postings(postings)
+    cache = get_llm_cache()
+    results: Dict[str, dict] = {}
+    keys, batches = _prepare_job_batches(unique, cache, results)
+    semaphore = asyncio.Semaphore(Config.LLM_MAX_CONCURRENCY)
+    llm_calls = 0
+
+    async def run(batch: List[Tuple[str, str, str]], attempt: int = 0) -> None:
+        nonlocal llm_calls
+        async with semaphore:
+            llm_calls += 1
+            try:
+                response = await asyncio.wait_for(
+                    traced_generate_async(_get_model(), _job_batch_prompt(batch), "gemini.analyze_job_batch"),
+                    Config.JOB_ANALYSIS_TIMEOUT
+                )
+                failed = _collect_job_batch(batch, response.text, cache, results)
+                error = None
+            except Exception as e:
+                error = e
+
+        if error is not None:
+            # Back off without holding a concurrency slot
+            if attempt < Config.JOB_BATCH_RETRIES:
+                await asyncio.sleep(_batch_backoff(attempt))
+                await run(batch, attempt + 1)
+            else:
+                _fall_back_job_batch(batch, error, results)
+        elif len(batch) == 1 and failed:
+            results[batch[0][0]] = _job_analysis_fallback(batch[0][1], ValueError(_BATCH_UNPARSED))
+        elif failed:
+            await asyncio.gather(*(run(retry) for retry in _retry_batches(batch, failed)))
+
+    with span("analyze_jobs_batch", kind="batch", postings=len(postings)) as active:
+        await asyncio.gather(*(run(batch) for batch in batches))
+        active.set(llm_calls=llm_calls)
+
+    return _job_batch_result(postings, keys, results, llm_calls, duplicate_of)
+
 
 def _parse_json_response(text: str) -> dict:
     """Parse JSON from Gemini response"""
@@ -160,7 +605,7 @@ def _parse_json_response(text: str) -> dict:
     except:
         return {}
 
-def create_job_analyzer_agent() -> Agent:
+def create_job_analyzer_agent() -> "Agent":
     """
     Create Job Analyzer Agent.
 
@@ -174,8 +619,11 @@ def create_job_analyzer_agent() -> Agent:
         Agent object for analyzing jobs
     """
 
+    from google.adk.agents import Agent
+    from google.adk.tools import FunctionTool
+
     # Create tool
-    job_analyzer_tool = FunctionTool(analyze_job_with_gemini)
+    job_analyzer_tool = FunctionTool(traced_tool(analyze_job_with_gemini))
 
     # Create Agent
     agent = Agent(
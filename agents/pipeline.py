@@ -0,0 +1,190 @@
+"""Analysis Pipeline - deterministic DAG executor without LLM routing"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from agents.job_analyzer_agent import analyze_job_with_gemini_async
+from agents.skill_gap_agent import analyze_skill_gap
+from agents.recommendation_agent import generate_recommendations_async
+from tools.pdf_tools import extract_resume_sections, extract_contact_info
+from tools.skill_tools import extract_skills
+from tools.document_cache import cached_extract_text
+from tools.tracing import span, request_context
+from config import Config
+import asyncio
+import time
+
+
+# A stage takes the results of its dependencies and returns its own result
+Stage = Tuple[List[str], Callable[[Dict[str, Any]], Awaitable[Any]]]
+
+
+async def run_dag(stages: Dict[str, Stage],
+                  timeouts: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Run stages as a dependency graph.
+
+    Every stage starts as soon as all of its dependencies have finished, so
+    independent stages run concurrently. Each stage runs under its own
+    timeout; a failed stage skips everything downstream of it.
+
+    Args:
+        stages: name -> (dependency names, async function of dependency results)
+        timeouts: name -> seconds (stages without an entry have no timeout)
+
+    Returns:
+        Dictionary with results, errors, skipped stages and per-stage timings
+    """
+    timeouts = timeouts or {}
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    timings: Dict[str, float] = {}
+    skipped: List[str] = []
+
+    remaining = dict(stages)
+    running: Dict[asyncio.Task, str] = {}
+
+    async def run_stage(name: str, func, inputs: Dict[str, Any]):
+        start = time.perf_counter()
+        try:
+            with span(f"stage.{name}", kind="stage"):
+                return await asyncio.wait_for(func(inputs), timeouts.get(name))
+        finally:
+            timings[name] = round(time.perf_counter() - start, 4)
+
+    while remaining or running:
+        # Skip stages whose dependencies failed
+        for name, (deps, _) in list(remaining.items()):
+            if any(dep in errors or dep in skipped for dep in deps):
+                skipped.append(name)
+                del remaining[name]
+
+        # Start every stage whose dependencies are all done
+        for name, (deps, func) in list(remaining.items()):
+            if all(dep in results for dep in deps):
+                inputs = {dep: results[dep] for dep in deps}
+                running[asyncio.ensure_future(run_stage(name, func, inputs))] = name
+                del remaining[name]
+
+        if not running:
+            # Nothing can make progress (unknown dependency or cycle)
+            skipped.extend(remaining)
+            break
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            name = running.pop(task)
+            try:
+                results[name] = task.result()
+            except asyncio.TimeoutError:
+                errors[name] = f"Stage timed out after {timeouts.get(name)}s"
+            except Exception as e:
+                errors[name] = str(e)
+
+    return {
+        "results": results,
+        "errors": errors,
+        "skipped": skipped,
+        "timings": timings
+    }
+
+
+def _parse_resume(resume_path: Optional[str], resume_text: Optional[str]) -> dict:
+    """CPU-bound resume parsing (runs in a worker thread)."""
+    if resume_text is None:
+        extracted = cached_extract_text(resume_path)
+        if not extracted.get("success", False):
+            raise ValueError(f"Failed to parse resume: {extracted.get('error', 'Unknown error')}")
+        resume_text = extracted["text"]
+
+    return {
+        "text": resume_text,
+        "sections": extract_resume_sections(resume_text),
+        "contact": extract_contact_info(resume_text),
+        "skills": extract_skills(resume_text, Config.SKILL_DATABASE)["skills"]
+    }
+
+
+async def run_analysis_pipeline(job_description: str,
+                                resume_path: Optional[str] = None,
+                                resume_text: Optional[str] = None,
+                                company_name: str = "",
+                                include_recommendations: bool = True,
+                                timeouts: Optional[Dict[str, float]] = None,
+                                request_id: Optional[str] = None) -> dict:
+    """
+    Run the full resume/job analysis without LLM routing.
+
+    Resume parsing and job analysis run concurrently, then gap scoring,
+    then recommendations. This is the fast deterministic path for batch and
+    API callers; the ADK coordinator remains the conversational front end.
+
+    Args:
+        job_description: Raw job description text
+        resume_path: Path to resume file (PDF or DOCX), if resume_text is not given
+        resume_text: Already extracted resume text
+        company_name: Company for the cover letter
+        include_recommendations: Run the recommendation stage
+        timeouts: Per-stage timeouts (defaults to Config.PIPELINE_STAGE_TIMEOUTS)
+        request_id: Trace id for every span of this run (generated if omitted)
+
+    Returns:
+        Dictionary with resume, job_analysis, gap_analysis and recommendations
+    """
+    if resume_path is None and resume_text is None:
+        raise ValueError("Either resume_path or resume_text is required")
+
+    async def parse_resume(_):
+        return await asyncio.to_thread(_parse_resume, resume_path, resume_text)
+
+    async def analyze_job(_):
+        result = await analyze_job_with_gemini_async(job_description)
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        return result
+
+    async def skill_gap(inputs):
+        # TF-IDF scoring is CPU-bound, keep it off the event loop
+        resume = inputs["parse_resume"]
+        return await asyncio.to_thread(
+            analyze_skill_gap,
+            resume,
+            inputs["analyze_job"],
+            resume["text"],
+            job_description
+        )
+
+    async def recommend(inputs):
+        resume = inputs["parse_resume"]
+        result = await generate_recommendations_async(
+            resume["sections"].get("experience") or resume["text"],
+            resume["text"],
+            job_description,
+            inputs["skill_gap"]["skills_analysis"]["missing_skills"],
+            company_name
+        )
+        if not result["success"]:
+            raise RuntimeError(f"{result['failed_stage']}: {result['error']}")
+        return result
+
+    stages: Dict[str, Stage] = {
+        "parse_resume": ([], parse_resume),
+        "analyze_job": ([], analyze_job),
+        "skill_gap": (["parse_resume", "analyze_job"], skill_gap),
+    }
+    if include_recommendations:
+        stages["recommend"] = (["parse_resume", "skill_gap"], recommend)
+
+    with request_context(request_id) as request_id:
+        with span("pipeline", kind="request"):
+            run = await run_dag(stages, timeouts or Config.PIPELINE_STAGE_TIMEOUTS)
+    results = run["results"]
+
+    return {
+        "request_id": request_id,
+        "resume": results.get("parse_resume"),
+        "job_analysis": results.get("analyze_job"),
+        "gap_analysis": results.get("skill_gap"),
+        "recommendations": results.get("recommend"),
+        "errors": run["errors"],
+        "skipped": run["skipped"],
+        "timings": run["timings"],
+        "status": "pipeline_complete" if not run["errors"] and not run["skipped"] else "pipeline_partial"
+    }
@@ -1,28 +1,66 @@
 """Recommendation Agent - Correct ADK Pattern"""
 
-from google.adk.agents import Agent
-from google.adk.tools import FunctionTool
-import google.generativeai as genai
 from config import Config
-from typing import List
-
-
-def generate_tailored_section(original_section: str,
-                              job_description: str,
-                              missing_skills: List[str]) -> dict:
-    """Generate tailored resume section using Gemini"""
-    genai.configure(api_key=Config.GEMINI_API_KEY)
-    model = genai.GenerativeModel(Config.GEMINI_MODEL)
-
-    prompt = f"""
+from tools.prompt_compaction import compact_text
+from tools.tracing import (
+    traced_tool,
+    traced_generate,
+    traced_generate_async,
+    traced_stream,
+    traced_stream_async
+)
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List
+import asyncio
+import weakref
+
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
+
+
+_shared_model = None
+# One concurrency limiter per event loop
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _get_model():
+    """Long-lived Gemini client shared by every recommendation call."""
+    global _shared_model
+    if _shared_model is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=Config.GEMINI_API_KEY)
+        _shared_model = genai.GenerativeModel(Config.GEMINI_MODEL)
+    return _shared_model
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(Config.LLM_MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+def _tailored_section_prompt(original_section: str,
+                             job_description: str,
+                             missing_skills: List[str]) -> str:
+    budgets = Config.PROMPT_TOKEN_BUDGETS
+    original_section = compact_text(original_section, budgets["tailored_section.original_section"],
+                                    job_description, "original_section")
+    job_description = compact_text(job_description, budgets["tailored_section.job_description"],
+                                   original_section, "job_description")
+
+    return f"""
     Rewrite this resume section to better match the job requirements.
     Use action verbs, quantify achievements, and make it ATS-friendly.
 
     Original Section:
-    {original_section[:800]}
+    {original_section}
 
     Target Job Description:
-    {job_description[:1000]}
+    {job_description}
 
     Skills to emphasize: {', '.join(missing_skills[:5])}
 
@@ -36,34 +74,24 @@ def generate_tailored_section(original_section: str,
     Return ONLY the rewritten section.
     """
 
-    try:
-        response = model.generate_content(prompt)
-        return {
-            "success": True,
-            "tailored_section": response.text.strip()
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
 
-def generate_cover_letter(resume_text: str,
-                          job_description: str,
-                          company_name: str = "") -> dict:
-    """Generate personalized cover letter"""
-    genai.configure(api_key=Config.GEMINI_API_KEY)
-    model = genai.GenerativeModel(Config.GEMINI_MODEL)
+def _cover_letter_prompt(resume_text: str,
+                         job_description: str,
+                         company_name: str = "") -> str:
+    budgets = Config.PROMPT_TOKEN_BUDGETS
+    resume_text = compact_text(resume_text, budgets["cover_letter.resume_text"],
+                               job_description, "resume_text")
+    job_description = compact_text(job_description, budgets["cover_letter.job_description"],
+                                   resume_text, "job_description")
 
-    prompt = f"""
+    return f"""
     Write a professional cover letter (3 paragraphs).
 
     Resume Content:
-    {resume_text[:1000]}
+    {resume_text}
 
     Job Description:
-    {job_description[:1000]}
+    {job_description}
 
     Company: {company_name or '[Company Name]'}
 
@@ -76,11 +104,40 @@ def generate_cover_letter(resume_text: str,
     Return the complete cover letter.
     """
 
+
+def _learning_resources_prompt(missing_skills: List[str]) -> str:
+    skills_str = ', '.join(missing_skills[:5])
+
+    return f"""
+    For each of these skills: {skills_str}
+
+    Suggest:
+    1. Free online courses (Coursera, edX, Udemy, YouTube)
+    2. Practice projects
+    3. Estimated learning time
+    4. Industry certifications (if applicable)
+
+    Be specific with course names and links where possible.
+    Format as a practical learning roadmap.
+    """
+
+
+def generate_tailored_section(original_section: str,
+                              job_description: str,
+                              missing_skills: List[str]) -> dict:
+    """
+    Generate tailored resume section using Gemini.
+
+    Returns the whole section at once; this is what the ADK tool calls.
+    Use stream_tailored_section to show text as it is generated.
+    """
+    prompt = _tailored_section_prompt(original_section, job_description, missing_skills)
+
     try:
-        response = model.generate_content(prompt)
+        response = traced_generate(_get_model(), prompt, "gemini.tailored_section")
         return {
             "success": True,
-            "cover_letter": response.text.strip()
+            "tailored_section": response.text.strip()
         }
     except Exception as e:
         return {
@@ -89,34 +146,78 @@ def generate_cover_letter(resume_text: str,
         }
 
 
-def suggest_learning_resources(missing_skills: List[str]) -> dict:
-    """Suggest learning resources for skill gaps"""
-    genai.configure(api_key=Config.GEMINI_API_KEY)
-    model = genai.GenerativeModel(Config.GEMINI_MODEL)
+def generate_cover_letter(resume_text: str,
+                          job_description: str,
+                          company_name: str = "") -> dict:
+    """
+    Generate personalized cover letter.
 
-    if not missing_skills:
+    Returns the whole letter at once; this is what the ADK tool calls.
+    Use stream_cover_letter to show text as it is generated.
+    """
+    prompt = _cover_letter_prompt(resume_text, job_description, company_name)
+
+    try:
+        response = traced_generate(_get_model(), prompt, "gemini.cover_letter")
         return {
             "success": True,
-            "resources": "No skill gaps identified!"
+            "cover_letter": response.text.strip()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
         }
 
-    skills_str = ', '.join(missing_skills[:5])
 
-    prompt = f"""
-    For each of these skills: {skills_str}
+def stream_tailored_section(original_section: str,
+                            job_description: str,
+                            missing_skills: List[str]) -> Iterator[str]:
+    """
+    Stream a tailored resume section as Gemini generates it.
 
-    Suggest:
-    1. Free online courses (Coursera, edX, Udemy, YouTube)
-    2. Practice projects
-    3. Estimated learning time
-    4. Industry certifications (if applicable)
+    Args:
+        original_section: Resume section to rewrite
+        job_description: Target job description
+        missing_skills: Skills to emphasize
 
-    Be specific with course names and links where possible.
-    Format as a practical learning roadmap.
+    Yields:
+        Text chunks
     """
+    prompt = _tailored_section_prompt(original_section, job_description, missing_skills)
+    yield from traced_stream(_get_model(), prompt, "gemini.tailored_section")
+
+
+def stream_cover_letter(resume_text: str,
+                        job_description: str,
+                        company_name: str = "") -> Iterator[str]:
+    """
+    Stream a cover letter as Gemini generates it.
+
+    Args:
+        resume_text: Full resume text
+        job_description: Target job description
+        company_name: Company for the cover letter
+
+    Yields:
+        Text chunks
+    """
+    prompt = _cover_letter_prompt(resume_text, job_description, company_name)
+    yield from traced_stream(_get_model(), prompt, "gemini.cover_letter")
+
+
+def suggest_learning_resources(missing_skills: List[str]) -> dict:
+    """Suggest learning resources for skill gaps"""
+    if not missing_skills:
+        return {
+            "success": True,
+            "resources": "No skill gaps identified!"
+        }
+
+    prompt = _learning_resources_prompt(missing_skills)
 
     try:
-        response = model.generate_content(prompt)
+        response = traced_generate(_get_model(), prompt, "gemini.learning_resources")
         return {
             "success": True,
             "resources": response.text.strip()
@@ -128,7 +229,102 @@ def suggest_learning_resources(missing_skills: List[str]) -> dict:
         }
 
 
-def create_recommendation_agent() -> Agent:
+async def _generate_async(prompt: str, stage: str) -> str:
+    """Run one generation under the shared concurrency limit."""
+    async with _get_semaphore():
+        response = await traced_generate_async(_get_model(), prompt, stage)
+    return response.text.strip()
+
+
+async def _stream_async(prompt: str, stage: str) -> AsyncIterator[str]:
+    """Stream one generation under the shared concurrency limit."""
+    async with _get_semaphore():
+        async for text in traced_stream_async(_get_model(), prompt, stage):
+            yield text
+
+
+def stream_tailored_section_async(original_section: str,
+                                  job_description: str,
+                                  missing_skills: List[str]) -> AsyncIterator[str]:
+    """Async counterpart of stream_tailored_section."""
+    return _stream_async(
+        _tailored_section_prompt(original_section, job_description, missing_skills),
+        "gemini.tailored_section"
+    )
+
+
+def stream_cover_letter_async(resume_text: str,
+                              job_description: str,
+                              company_name: str = "") -> AsyncIterator[str]:
+    """Async counterpart of stream_cover_letter."""
+    return _stream_async(
+        _cover_letter_prompt(resume_text, job_description, company_name),
+        "gemini.cover_letter"
+    )
+
+
+async def _no_gap_resources() -> str:
+    return "No skill gaps identified!"
+
+
+async def generate_recommendations_async(original_section: str,
+                                         resume_text: str,
+                                         job_description: str,
+                                         missing_skills: List[str],
+                                         company_name: str = "") -> dict:
+    """
+    Generate tailored section, cover letter and learning resources concurrently.
+
+    The three generations share one client and run under
+    Config.LLM_MAX_CONCURRENCY, so latency is the slowest call rather than
+    the sum. If any generation fails the others are cancelled.
+
+    Args:
+        original_section: Resume section to rewrite
+        resume_text: Full resume text
+        job_description: Target job description
+        missing_skills: Skills to emphasize and learn
+        company_name: Company for the cover letter
+
+    Returns:
+        Dictionary with tailored_section, cover_letter and resources
+    """
+    stages = {
+        "tailored_section": _generate_async(
+            _tailored_section_prompt(original_section, job_description, missing_skills),
+            "gemini.tailored_section"
+        ),
+        "cover_letter": _generate_async(
+            _cover_letter_prompt(resume_text, job_description, company_name),
+            "gemini.cover_letter"
+        ),
+        "resources": _generate_async(
+            _learning_resources_prompt(missing_skills),
+            "gemini.learning_resources"
+        ) if missing_skills else _no_gap_resources()
+    }
+    tasks = {name: asyncio.ensure_future(coro) for name, coro in stages.items()}
+
+    done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    for name, task in tasks.items():
+        if task in done and task.exception() is not None:
+            return {
+                "success": False,
+                "failed_stage": name,
+                "error": str(task.exception())
+            }
+
+    result = {name: task.result() for name, task in tasks.items()}
+    result["success"] = True
+    return result
+
+
+def create_recommendation_agent() -> "Agent":
     """
     Create Recommendation Agent.
 
@@ -138,14 +334,25 @@ def create_recommendation_agent() -> Agent:
     3. Learning resources
     4. Action plans
 
+    The tools return complete results: ADK only streams tool output from
+    async-generator tools in live (bidirectional) sessions, not in the
+    run_async flow main.py uses. With SSE streaming only the agent's own
+    reply arrives in chunks; a tailored section or cover letter appears
+    once the tool returns. Callers that need chunks should use
+    stream_tailored_section / stream_cover_letter (or the server's
+    /recommend/*/stream endpoints) directly.
+
     Returns:
         Agent object for recommendations
     """
 
+    from google.adk.agents import Agent
+    from google.adk.tools import FunctionTool
+
     # Create tools
-    tailor_tool = FunctionTool(generate_tailored_section)
-    letter_tool = FunctionTool(generate_cover_letter)
-    resources_tool = FunctionTool(suggest_learning_resources)
+    tailor_tool = FunctionTool(traced_tool(generate_tailored_section))
+    letter_tool = FunctionTool(traced_tool(generate_cover_letter))
+    resources_tool = FunctionTool(traced_tool(suggest_learning_resources))
 
     # Create Agent
     agent = Agent(
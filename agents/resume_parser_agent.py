@@ -1,6 +1,5 @@
 """Resume Parser Agent - Pure ADK"""
-from google.adk.agents import Agent
-from google.adk.tools import FunctionTool
+from typing import TYPE_CHECKING
 from tools.pdf_tools import (
     extract_text_from_pdf,
     extract_text_from_docx,
@@ -8,15 +7,18 @@ from tools.pdf_tools import (
     extract_contact_info,
 )
 from tools.skill_tools import extract_skills
-from google.genai import types
 # from tools.pdf_tools import parse_pdf_tool, parse_docx_tool, extract_sections_tool
 from tools.skill_tools import extract_skills_tool
+from tools.tracing import traced_tool
 from config import Config
 
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
+
 config = Config()
 
 
-def create_resume_parser_agent() -> Agent:
+def create_resume_parser_agent() -> "Agent":
     """
     Create Resume Parser Agent.
 
@@ -31,17 +33,20 @@ def create_resume_parser_agent() -> Agent:
         Agent object for parsing resumes
     """
 
+    from google.adk.agents import Agent
+    from google.adk.tools import FunctionTool
+
     # Create tools (no file parsing tools since we parse locally)
-    section_extractor_tool = FunctionTool(extract_resume_sections)
-    contact_extractor_tool = FunctionTool(extract_contact_info)
+    section_extractor_tool = FunctionTool(traced_tool(extract_resume_sections))
+    contact_extractor_tool = FunctionTool(traced_tool(extract_contact_info))
 
     # Get skill database for the skill extraction tool
     def extract_skills_with_db(text: str):
         return extract_skills(text, Config.SKILL_DATABASE)
 
-    skill_extractor_tool = FunctionTool(extract_skills_with_db)
-    extract_text_from_pdf_tool = FunctionTool(extract_text_from_pdf)
-    extract_text_from_docx_tool = FunctionTool(extract_text_from_docx)
+    skill_extractor_tool = FunctionTool(traced_tool(extract_skills_with_db, "extract_skills"))
+    extract_text_from_pdf_tool = FunctionTool(traced_tool(extract_text_from_pdf))
+    extract_text_from_docx_tool = FunctionTool(traced_tool(extract_text_from_docx))
 
     # Create Agent with all tools
     agent = Agent(
@@ -50,7 +55,7 @@ def create_resume_parser_agent() -> Agent:
         description="Parses resume text and extracts structured data",
         instruction="""You are a resume parsing agent. Your job is to:
             1. Identify and extract resume sections (experience, education, skills)
-            2. Extract contact information (emails, phones)
+            2. Extract contact information (emails, phones, LinkedIn/GitHub/portfolio links)
             3. Identify technical and soft skills
 
             When a user provides resume text, extract sections, contact info, and skills.
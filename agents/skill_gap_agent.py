@@ -1,14 +1,16 @@
 """Skill Gap Agent - Pure ADK"""
-from google.adk.agents import Agent
-from google.adk.tools import FunctionTool
 from tools.scoring_tools import (
     calculate_tfidf_similarity,
     calculate_keyword_match,
     calculate_final_score
 )
 from tools.skill_tools import identify_missing_skills
+from tools.tracing import traced_tool
 from config import Config
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
 
 config = Config()
 
@@ -38,16 +40,38 @@ async def skill_gap_agent_v1(resume_data: dict,
         Comprehensive gap analysis
     """
 
+    return analyze_skill_gap(resume_data, job_data, resume_text, job_desc)
+
+
+def analyze_skill_gap(resume_data: dict,
+                      job_data: dict,
+                      resume_text: str,
+                      job_desc: str) -> dict:
+    """
+    Score a resume against a job and list matched and missing skills.
+
+    Synchronous and CPU-only, so it can run in a worker process.
+
+    Args:
+        resume_data: Parsed resume (uses "skills")
+        job_data: Analyzed job (uses "required_technical_skills")
+        resume_text: Raw resume text
+        job_desc: Raw job description
+
+    Returns:
+        Comprehensive gap analysis
+    """
+
     # Extract skills
     resume_skills = resume_data.get("skills", [])
     job_skills = job_data.get("required_technical_skills", [])
 
     # Calculate TF-IDF score
-    tfidf_score = calculate_tfidf_similarity(resume_text, job_desc)
+    tfidf_score = calculate_tfidf_similarity(resume_text, job_desc)["tfidf_score"]
 
     # Calculate keyword match
     keyword_result = calculate_keyword_match(resume_skills, job_skills)
-    keyword_score = keyword_result["score"]
+    keyword_score = keyword_result["keyword_score"]
 
     # Calculate final score
     final_score = calculate_final_score(
@@ -55,14 +79,12 @@ async def skill_gap_agent_v1(resume_data: dict,
         keyword_score,
         config.TFIDF_WEIGHT,
         config.KEYWORD_WEIGHT
-    )
+    )["final_score"]
 
-    # Identify missing skills
-    missing_skills = identify_missing_skills(resume_skills, job_skills)
-
-    # Identify matched skills
-    matched_skills = [s for s in resume_skills
-                      if s.lower() in [j.lower() for j in job_skills]]
+    # Identify missing and matched skills
+    gap_result = identify_missing_skills(resume_skills, job_skills)
+    missing_skills = gap_result["missing_skills"]
+    matched_skills = gap_result["matched_skills"]
 
     return {
         "scores": {
@@ -80,7 +102,7 @@ async def skill_gap_agent_v1(resume_data: dict,
     }
 
 
-def create_skill_gap_agent() -> Agent:
+def create_skill_gap_agent() -> "Agent":
     """
     Create Skill Gap Agent.
 
@@ -94,11 +116,14 @@ def create_skill_gap_agent() -> Agent:
         Agent object for gap analysis
     """
 
+    from google.adk.agents import Agent
+    from google.adk.tools import FunctionTool
+
     # Create tools
-    tfidf_tool = FunctionTool(calculate_tfidf_similarity)
-    keyword_tool = FunctionTool(calculate_keyword_match)
-    final_score_tool = FunctionTool(calculate_final_score)
-    gap_tool = FunctionTool(identify_missing_skills)
+    tfidf_tool = FunctionTool(traced_tool(calculate_tfidf_similarity))
+    keyword_tool = FunctionTool(traced_tool(calculate_keyword_match))
+    final_score_tool = FunctionTool(traced_tool(calculate_final_score))
+    gap_tool = FunctionTool(traced_tool(identify_missing_skills))
 
     # Create Agent
     agent = Agent(
@@ -0,0 +1,56 @@
+"""Bulk job analysis - analyze a feed of job postings in batched Gemini calls"""
+
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from agents.job_analyzer_agent import analyze_jobs_batch_async
+
+
+def load_job_feed(path: str) -> Dict[str, str]:
+    """
+    Read job postings from a JSON Lines feed.
+
+    Args:
+        path: File with one {"id", "description"} object per line
+
+    Returns:
+        Job description text by posting id (line number when id is missing)
+    """
+    postings: Dict[str, str] = {}
+    with open(path, encoding='utf-8') as feed:
+        for line_number, line in enumerate(feed, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            postings[str(record.get("id", line_number))] = record["description"]
+    return postings
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("feed", help='JSON Lines file of {"id", "description"} objects')
+    parser.add_argument("--output", default="job_analyses.jsonl", help="JSONL output path")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.feed):
+        print(f"❌ Error: {args.feed} not found")
+        sys.exit(1)
+
+    postings = load_job_feed(args.feed)
+    result = asyncio.run(analyze_jobs_batch_async(postings))
+
+    with open(args.output, 'w', encoding='utf-8') as output:
+        for posting_id, analysis in result["analyses"].items():
+            output.write(json.dumps({"id": posting_id, **analysis}, ensure_ascii=False) + "\n")
+
+    print(f"✓ Analyzed {len(postings)} postings ({len(result['duplicate_of'])} near-duplicates) "
+          f"in {result['llm_calls']} Gemini calls ({len(result['failed'])} failed) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Offline benchmarks for tools and the analysis pipeline"""
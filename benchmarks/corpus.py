@@ -0,0 +1,162 @@
+"""Synthetic resume and job description corpora for benchmarks"""
+from typing import List
+from config import Config
+import docx
+import os
+import random
+
+
+_FIRST_NAMES = ["Alex", "Jordan", "Sam", "Taylor", "Morgan", "Casey", "Riley", "Jamie"]
+_LAST_NAMES = ["Lee", "Patel", "Garcia", "Kim", "Nguyen", "Smith", "Okafor", "Rossi"]
+_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+_VERBS = ["Built", "Led", "Designed", "Migrated", "Optimized", "Automated", "Shipped", "Scaled"]
+_OBJECTS = ["data pipelines", "REST APIs", "microservices", "ML models", "dashboards",
+            "CI/CD workflows", "search infrastructure", "billing systems"]
+_FILLER = ["improving latency by {n}%", "serving {n}k daily users", "cutting costs by {n}%",
+           "across {n} teams", "reducing incidents by {n}%"]
+
+
+def make_resume_text(rng: random.Random, bullets: int = 12) -> str:
+    """One synthetic resume with contact info, sections and skills."""
+    first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+    skills = rng.sample(Config.SKILL_DATABASE, 10)
+
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +1 415-555-{rng.randint(1000, 9999)}",
+        "",
+        "Summary",
+        f"Engineer with {rng.randint(2, 15)} years of experience in {', '.join(skills[:3])}.",
+        "",
+        "Professional Experience",
+        # dd.mm.yyyy dates must not be read as a phone number
+        f"{rng.choice(_COMPANIES)}, {rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(2010, 2018)}"
+        f" {rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(2019, 2024)}",
+    ]
+    for i in range(bullets):
+        lines.append(
+            f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} with {rng.choice(skills)} "
+            f"at {rng.choice(_COMPANIES)}, {rng.choice(_FILLER).format(n=rng.randint(5, 90))}"
+        )
+        if i == bullets // 2:
+            # Per-job skills line: repeats a section header inside Experience
+            lines.append(f"Skills: {', '.join(rng.sample(skills, 2))}")
+    lines += [
+        "",
+        "Education",
+        "B.S. Computer Science, State University, 2015",
+        "",
+        "Skills",
+        ", ".join(skills),
+    ]
+    return "\n".join(lines)
+
+
+def make_job_text(rng: random.Random) -> str:
+    """One synthetic job description."""
+    skills = rng.sample(Config.SKILL_DATABASE, 8)
+    lines = [
+        f"Senior Software Engineer - {rng.choice(_COMPANIES)}",
+        "",
+        "Responsibilities:",
+    ]
+    for _ in range(6):
+        lines.append(f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} using {rng.choice(skills)}")
+    lines += [
+        "",
+        "Requirements:",
+        f"- {rng.randint(3, 10)}+ years of experience",
+    ]
+    lines += [f"- Experience with {skill}" for skill in skills]
+    lines += [
+        "",
+        "Benefits: health insurance, 401k matching, flexible hours.",
+        "We are an equal opportunity employer.",
+    ]
+    return "\n".join(lines)
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: str, text: str, lines_per_page: int = 45) -> None:
+    """Write text as a minimal multi-page PDF using the built-in Helvetica font."""
+    lines = text.split("\n")
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    font_ref = 3 + 2 * len(pages)
+
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [{}] /Count {} >>".format(
+            " ".join(f"{3 + 2 * i} 0 R" for i in range(len(pages))), len(pages)
+        ),
+    ]
+    for i, page_lines in enumerate(pages):
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_ref} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        )
+        stream = "BT /F1 10 Tf 50 750 Td 14 TL " + " ".join(
+            f"({_pdf_escape(line)}) '" for line in page_lines
+        ) + " ET"
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    body = "%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body.encode('latin-1')))
+        body += f"{number} 0 obj\n{obj}\nendobj\n"
+    xref = len(body.encode('latin-1'))
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+
+    with open(path, "wb") as f:
+        f.write(body.encode('latin-1', errors='replace'))
+
+
+def write_docx(path: str, text: str) -> None:
+    """Write text as a DOCX file, one paragraph per line."""
+    document = docx.Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def build_corpus(directory: str, size: int, seed: int = 0) -> dict:
+    """
+    Generate `size` resumes (as text, PDF and DOCX) and `size` job descriptions.
+
+    Args:
+        directory: Where to write the PDF/DOCX files
+        size: Number of resumes and of job descriptions
+        seed: Random seed, so runs are comparable
+
+    Returns:
+        Dictionary with resume_texts, job_texts, pdf_paths and docx_paths
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+
+    resume_texts: List[str] = []
+    pdf_paths: List[str] = []
+    docx_paths: List[str] = []
+    for i in range(size):
+        text = make_resume_text(rng)
+        resume_texts.append(text)
+
+        pdf_path = os.path.join(directory, f"resume_{i}.pdf")
+        docx_path = os.path.join(directory, f"resume_{i}.docx")
+        write_pdf(pdf_path, text)
+        write_docx(docx_path, text)
+        pdf_paths.append(pdf_path)
+        docx_paths.append(docx_path)
+
+    return {
+        "resume_texts": resume_texts,
+        "job_texts": [make_job_text(rng) for _ in range(size)],
+        "pdf_paths": pdf_paths,
+        "docx_paths": docx_paths
+    }
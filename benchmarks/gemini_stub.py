@@ -0,0 +1,83 @@
+"""Local Gemini stand-in with configurable latency"""
+import asyncio
+import json
+import re
+import time
+
+
+_JOB_ANALYSIS = {
+    "required_technical_skills": ["Python", "AWS", "Docker"],
+    "required_soft_skills": ["Communication"],
+    "experience_level": "Senior",
+    "key_responsibilities": ["Build services"],
+    "salary_range": ""
+}
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+
+
+def _answer(prompt: str) -> str:
+    if "Return ONLY a JSON array" in prompt:
+        ids = re.findall(r'<posting id="([^"]+)">', prompt)
+        return json.dumps([{"id": posting_id, **_JOB_ANALYSIS} for posting_id in ids])
+    if "Return ONLY a JSON object" in prompt:
+        return "```json\n" + json.dumps(_JOB_ANALYSIS) + "\n```"
+    return "Stub response. " * 40
+
+
+def _chunks(text: str, size: int = 16):
+    return [_Response(text[i:i + size]) for i in range(0, len(text), size)]
+
+
+class _AsyncStream:
+    def __init__(self, chunks, latency: float):
+        self._chunks = chunks
+        self._latency = latency
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(self._latency)
+            yield chunk
+
+
+class StubGenerativeModel:
+    """Drop-in for genai.GenerativeModel that sleeps instead of calling the API."""
+
+    latency = 0.0
+
+    def __init__(self, model_name: str = "", **kwargs):
+        self.model_name = model_name
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        time.sleep(self.latency)
+        if stream:
+            return iter(_chunks(_answer(str(prompt))))
+        return _Response(_answer(str(prompt)))
+
+    async def generate_content_async(self, prompt, stream=False, **kwargs):
+        if stream:
+            # Chunks trickle in over the configured latency
+            chunks = _chunks(_answer(str(prompt)))
+            return _AsyncStream(chunks, self.latency / max(len(chunks), 1))
+        await asyncio.sleep(self.latency)
+        return _Response(_answer(str(prompt)))
+
+
+def install(latency: float = 0.0) -> None:
+    """
+    Route every google.generativeai call to the stub.
+
+    Must run before the first model call: agent modules build their
+    client lazily on first use and then keep it for the process.
+
+    Args:
+        latency: Simulated seconds per generation
+    """
+    import google.generativeai as genai
+
+    StubGenerativeModel.latency = latency
+    genai.GenerativeModel = StubGenerativeModel
+    genai.configure = lambda **kwargs: None
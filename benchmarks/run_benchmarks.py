@@ -0,0 +1,200 @@
+"""Run the offline benchmark suite and write machine-readable JSON results"""
+
+from typing import Callable, Dict, List
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from benchmarks import gemini_stub
+from benchmarks.corpus import build_corpus
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(name: str, size: int, latencies: List[float], wall_seconds: float) -> Dict:
+    """Throughput and latency percentiles for one benchmark."""
+    ordered = sorted(latencies)
+    return {
+        "benchmark": name,
+        "size": size,
+        "calls": len(latencies),
+        "total_seconds": round(wall_seconds, 6),
+        "throughput_per_sec": round(len(latencies) / wall_seconds, 3) if wall_seconds else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3)
+    }
+
+
+# Unrecorded calls per benchmark before timing starts, so lazy imports,
+# model loads and compiled caches are not billed to the first call
+WARMUP_CALLS = 1
+
+
+def measure(name: str, size: int, func: Callable, inputs: List) -> Dict:
+    """Call func once per input and record per-call latency, after a warmup."""
+    for args in inputs[:WARMUP_CALLS]:
+        func(*args)
+
+    latencies = []
+    start = time.perf_counter()
+    for args in inputs:
+        call_start = time.perf_counter()
+        func(*args)
+        latencies.append(time.perf_counter() - call_start)
+    return summarize(name, size, latencies, time.perf_counter() - start)
+
+
+def check_sections(texts: List[str]) -> None:
+    """Fail when segmentation drops text: past the contact block, sections must cover every resume."""
+    from tools.pdf_tools import segment_resume
+
+    for text in texts:
+        sections = segment_resume(text)
+        first = min(sections.heading_starts.values(), default=len(text))
+        covered = [False] * len(text)
+        for name, (_, end) in sections.spans.items():
+            covered[sections.heading_starts[name]:end] = [True] * (end - sections.heading_starts[name])
+        dropped = "".join(char for char, hit in zip(text[first:], covered[first:]) if not hit).strip()
+        if dropped:
+            raise RuntimeError(f"extract_resume_sections dropped text: {dropped[:80]!r}")
+
+
+def check_contacts(texts: List[str]) -> None:
+    """Fail when contact extraction finds anything but the one phone each resume has."""
+    from tools.pdf_tools import extract_contact_info
+
+    for text in texts:
+        phones = extract_contact_info(text)["phones"]
+        if len(phones) != 1:
+            raise RuntimeError(f"extract_contact_info found phones {phones}")
+
+
+async def _measure_pipeline(size: int, resume_texts: List[str], job_texts: List[str]) -> Dict:
+    from agents.pipeline import run_analysis_pipeline
+
+    for resume_text, job_text in list(zip(resume_texts, job_texts))[:WARMUP_CALLS]:
+        await run_analysis_pipeline(job_text, resume_text=resume_text)
+
+    latencies = []
+    start = time.perf_counter()
+    for resume_text, job_text in zip(resume_texts, job_texts):
+        call_start = time.perf_counter()
+        result = await run_analysis_pipeline(job_text, resume_text=resume_text)
+        if result["errors"]:
+            raise RuntimeError(f"Pipeline failed: {result['errors']}")
+        latencies.append(time.perf_counter() - call_start)
+    return summarize("pipeline_end_to_end", size, latencies, time.perf_counter() - start)
+
+
+def run_suite(sizes: List[int], latency: float, pipeline_runs: int, work_dir: str) -> Dict:
+    """
+    Run every benchmark at every corpus size.
+
+    Args:
+        sizes: Corpus sizes (number of resumes and job descriptions)
+        latency: Simulated Gemini latency in seconds
+        pipeline_runs: Maximum end-to-end pipeline runs per size
+        work_dir: Where generated PDF/DOCX files are written
+
+    Returns:
+        Dictionary with run metadata and per-benchmark results
+    """
+    # The stub must be in place before any agent module builds a client
+    gemini_stub.install(latency)
+    Config.LLM_CACHE_ENABLED = False
+
+    from tools.pdf_tools import (
+        extract_text_from_pdf,
+        extract_text_from_docx,
+        extract_resume_sections,
+        extract_contact_info
+    )
+    from tools.skill_tools import extract_skills
+    from tools.scoring_tools import calculate_tfidf_similarity
+
+    results = []
+    for size in sizes:
+        corpus = build_corpus(os.path.join(work_dir, f"size_{size}"), size)
+        resumes = corpus["resume_texts"]
+        jobs = corpus["job_texts"]
+
+        results.append(measure("extract_text_from_pdf", size, extract_text_from_pdf,
+                               [(path,) for path in corpus["pdf_paths"]]))
+        results.append(measure("extract_text_from_docx", size, extract_text_from_docx,
+                               [(path,) for path in corpus["docx_paths"]]))
+        check_sections(resumes)
+        results.append(measure("extract_resume_sections", size, extract_resume_sections,
+                               [(text,) for text in resumes]))
+        check_contacts(resumes)
+        results.append(measure("extract_contact_info", size, extract_contact_info,
+                               [(text,) for text in resumes]))
+        results.append(measure("extract_skills", size, extract_skills,
+                               [(text, Config.SKILL_DATABASE) for text in resumes]))
+        results.append(measure("calculate_tfidf_similarity", size, calculate_tfidf_similarity,
+                               list(zip(resumes, jobs))))
+
+        runs = min(size, pipeline_runs)
+        results.append(asyncio.run(_measure_pipeline(size, resumes[:runs], jobs[:runs])))
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "stub_latency_seconds": latency,
+            "pipeline_runs": pipeline_runs
+        },
+        "results": results
+    }
+
+
+def main(argv: List[str] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10,100,500",
+                        help="Comma-separated corpus sizes")
+    parser.add_argument("--latency", type=float, default=0.2,
+                        help="Simulated Gemini latency in seconds")
+    parser.add_argument("--pipeline-runs", type=int, default=20,
+                        help="Maximum end-to-end pipeline runs per size")
+    parser.add_argument("--output", default="-",
+                        help="JSON output path ('-' for stdout)")
+    parser.add_argument("--work-dir", default=None,
+                        help="Directory for generated files (default: temporary)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    if args.work_dir:
+        report = run_suite(sizes, args.latency, args.pipeline_runs, args.work_dir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="resume_bench_") as work_dir:
+            report = run_suite(sizes, args.latency, args.pipeline_runs, work_dir)
+
+    output = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
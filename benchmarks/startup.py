@@ -0,0 +1,149 @@
+"""Startup budget check based on `python -X importtime`"""
+
+from typing import Dict, List
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budget per entry module, in milliseconds
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "tools": 100.0,
+    "agents": 250.0,
+    "agents.pipeline": 250.0,
+    "ingest": 150.0,
+    "main": 250.0,
+}
+
+# Heavy dependencies that must only load when a tool first needs them
+DEFERRED_MODULES = (
+    "sklearn",
+    "scipy",
+    "numpy",
+    "PyPDF2",
+    "docx",
+    "google.generativeai",
+    "google.adk",
+)
+
+
+def measure_import(module: str) -> Dict:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Modules the bare interpreter already loads at startup (site, encodings,
+    .pth hooks) are left out of the total.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        Dictionary with total cumulative microseconds and every module loaded
+    """
+    baseline = _loaded_modules("pass")
+    loaded = _loaded_modules(f"import {module}")
+    total_us = sum(
+        us for name, (us, top_level) in loaded.items()
+        if top_level and name not in baseline
+    )
+    return {
+        "total_us": total_us,
+        "loaded": {name: us for name, (us, _) in loaded.items() if name not in baseline}
+    }
+
+
+def _loaded_modules(code: str) -> Dict[str, tuple]:
+    """name -> (cumulative microseconds, is top-level) for one interpreter run."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    loaded: Dict[str, tuple] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        # Top-level entries (no extra indentation) add up to the whole import
+        loaded[name.strip()] = (int(cumulative), not name.startswith("   "))
+
+    return loaded
+
+
+def check_startup(budgets: Dict[str, float], runs: int = 5) -> Dict:
+    """
+    Measure each entry module and compare against its budget.
+
+    Args:
+        budgets: module -> budget in milliseconds
+        runs: Fresh-interpreter runs per module (the median is used)
+
+    Returns:
+        Dictionary with per-module results and an overall pass flag
+    """
+    results: List[Dict] = []
+    for module, budget_ms in budgets.items():
+        samples = [measure_import(module) for _ in range(runs)]
+        median_ms = statistics.median(s["total_us"] for s in samples) / 1000
+        loaded = samples[-1]["loaded"]
+        eager = [
+            heavy for heavy in DEFERRED_MODULES
+            if any(name == heavy or name.startswith(heavy + ".") for name in loaded)
+        ]
+        slowest = sorted(loaded.items(), key=lambda item: item[1], reverse=True)[:10]
+
+        results.append({
+            "module": module,
+            "median_ms": round(median_ms, 2),
+            "budget_ms": budget_ms,
+            "eager_heavy_imports": eager,
+            "slowest_imports": [{"module": name, "cumulative_ms": round(us / 1000, 2)} for name, us in slowest],
+            "passed": median_ms <= budget_ms and not eager
+        })
+
+    return {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "results": results,
+        "passed": all(r["passed"] for r in results)
+    }
+
+
+def main(argv: List[str] = None):
+    """Command-line entry point (exits 1 when a budget is exceeded)"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per module")
+    parser.add_argument("--budget", action="append", default=[],
+                        metavar="MODULE=MS", help="Override a module budget")
+    parser.add_argument("--output", default="-", help="JSON output path ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for override in args.budget:
+        module, _, value = override.partition("=")
+        budgets[module] = float(value)
+
+    report = check_startup(budgets, args.runs)
+
+    output = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+
+    sys.exit(0 if report["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
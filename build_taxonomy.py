@@ -0,0 +1,29 @@
+"""Compile a skill taxonomy into the memory-mapped format used by SKILL_TAXONOMY_PATH"""
+
+import argparse
+import sys
+
+from config import Config
+from tools.skill_taxonomy import DEFAULT_TAXONOMY_PATH, build_taxonomy
+
+
+def main():
+    """Compile and save the taxonomy"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source",
+                        help='JSON Lines file of {"name", "aliases", "parents"} objects (or a .json list)')
+    parser.add_argument("--output", default=Config.SKILL_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH,
+                        help="Where to write the compiled taxonomy")
+    args = parser.parse_args()
+
+    result = build_taxonomy(args.source, args.output)
+    if not result["success"]:
+        print(f"❌ Error: {result['error']}")
+        sys.exit(1)
+
+    print(f"✓ Compiled {result['skill_count']} skills ({result['key_count']} keys, "
+          f"{result['size_bytes']} bytes) -> {result['taxonomy_path']}")
+
+
+if __name__ == "__main__":
+    main()
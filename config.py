@@ -1,6 +1,6 @@
 """Configuration for Pure ADK Resume Optimizer"""
 import os
-from typing import List
+from typing import Dict, List
 class Config:
     """Application configuration"""
     # Gemini API
@@ -8,8 +8,14 @@ class Config:
     GEMINI_MODEL = "gemini-2.0-flash-lite"
     # ADK Settings
     APP_NAME = "resume_optimizer"
-    SESSION_ID = "resume_session_123"
-    USER_ID = "user_123"
+    # Default user for the local CLI; every run gets its own session id
+    USER_ID = os.getenv("USER_ID", "local_user")
+
+    # Persistent ADK sessions: events kept per session and idle expiry
+    SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "data/sessions.sqlite")
+    SESSION_MAX_EVENTS = int(os.getenv("SESSION_MAX_EVENTS", "200"))
+    SESSION_IDLE_TTL_SECONDS = int(os.getenv("SESSION_IDLE_TTL_SECONDS", str(24 * 3600)))
+    SESSION_EVICT_INTERVAL_SECONDS = int(os.getenv("SESSION_EVICT_INTERVAL_SECONDS", "300"))
     # Skill Database
     SKILL_DATABASE: List[str] = [
         # Programming Languages
@@ -37,7 +43,149 @@ class Config:
         "Communication", "Problem Solving", "Team Collaboration"
 
     ]
+    # Alternate spellings of SKILL_DATABASE entries
+    SKILL_ALIASES: Dict[str, List[str]] = {
+        "JavaScript": ["JS", "ECMAScript"],
+        "Go": ["Golang"],
+        "Kubernetes": ["k8s"],
+        "PostgreSQL": ["Postgres"],
+        "Google Cloud": ["GCP", "Google Cloud Platform"],
+        "AWS": ["Amazon Web Services"],
+        "Machine Learning": ["ML"],
+        "NLP": ["Natural Language Processing"],
+        "Scikit-learn": ["sklearn"],
+        "Vue.js": ["Vue", "VueJS"],
+        "Node.js": ["NodeJS"],
+        "React": ["React.js", "ReactJS"],
+        "Next.js": ["NextJS"],
+        "Express.js": ["ExpressJS"],
+        "CI/CD": ["Continuous Integration", "Continuous Delivery"],
+        "C++": ["cpp"],
+    }
+
+    # Broader skills implied by a more specific one
+    SKILL_PARENTS: Dict[str, List[str]] = {
+        "Deep Learning": ["Machine Learning"],
+        "NLP": ["Machine Learning"],
+        "Computer Vision": ["Machine Learning"],
+        "TensorFlow": ["Deep Learning"],
+        "PyTorch": ["Deep Learning"],
+        "Scikit-learn": ["Machine Learning"],
+        "PostgreSQL": ["SQL"],
+        "MySQL": ["SQL"],
+        "Scrum": ["Agile"],
+        "GitHub Actions": ["CI/CD"],
+        "Jenkins": ["CI/CD"],
+    }
+
+    # Soft skills the fast job analyzer looks for, with signalling phrases
+    SOFT_SKILLS: Dict[str, List[str]] = {
+        "Communication": ["communication skills", "communicator", "written and verbal"],
+        "Leadership": ["leading teams", "mentoring", "mentor"],
+        "Team Collaboration": ["collaboration", "collaborative", "teamwork", "team player",
+                               "cross-functional"],
+        "Problem Solving": ["problem-solving", "analytical thinking", "troubleshooting"],
+        "Project Management": ["stakeholder management", "prioritization"],
+        "Ownership": ["self-starter", "self-motivated", "proactive", "autonomy"],
+        "Adaptability": ["fast-paced", "adaptable", "ambiguity"],
+        "Attention to Detail": ["detail-oriented", "detail oriented"],
+    }
+
+    # Compiled taxonomy (see build_taxonomy.py); replaces SKILL_DATABASE when set
+    SKILL_TAXONOMY_PATH = os.getenv("SKILL_TAXONOMY_PATH", "")
+
     # Scoring Weights
     TFIDF_WEIGHT = 0.6
     KEYWORD_WEIGHT = 0.4
 
+    # TF-IDF scoring mode: "pairwise" fits per comparison, "fitted" uses the
+    # corpus-fitted vectorizer saved at TFIDF_MODEL_PATH
+    TFIDF_MODE = os.getenv("TFIDF_MODE", "pairwise")
+    TFIDF_MODEL_PATH = os.getenv("TFIDF_MODEL_PATH", "models/tfidf_vectorizer.joblib")
+
+    # BM25 resume index
+    RESUME_INDEX_PATH = os.getenv("RESUME_INDEX_PATH", "data/resume_index.sqlite")
+
+    # Bulk ingestion (0 = one worker per CPU)
+    INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "0"))
+
+    # Maximum concurrent Gemini calls per event loop
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "3"))
+
+    # Per-stage timeouts (seconds) for the direct pipeline
+    PIPELINE_STAGE_TIMEOUTS = {
+        "parse_resume": 30.0,
+        "analyze_job": 60.0,
+        "skill_gap": 30.0,
+        "recommend": 120.0
+    }
+
+    # HTTP service (server.py)
+    SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+    SERVER_PORT = int(os.getenv("SERVER_PORT", "8080"))
+    # CPU worker processes (0 = one per CPU) and queued CPU jobs before 503 (0 = 4x workers)
+    SERVER_CPU_WORKERS = int(os.getenv("SERVER_CPU_WORKERS", "0"))
+    SERVER_MAX_PENDING = int(os.getenv("SERVER_MAX_PENDING", "0"))
+    # How CPU workers are started: "forkserver" or "spawn" ("" = forkserver where available).
+    # Workers never fork the running event loop, its threads or open connections
+    SERVER_WORKER_START_METHOD = os.getenv("SERVER_WORKER_START_METHOD", "")
+    SERVER_MAX_BODY_BYTES = int(os.getenv("SERVER_MAX_BODY_BYTES", str(10 * 1024 * 1024)))
+    SERVER_MAX_TEXT_CHARS = int(os.getenv("SERVER_MAX_TEXT_CHARS", "100000"))
+    # Seconds to let in-flight requests finish on shutdown
+    SERVER_SHUTDOWN_TIMEOUT = float(os.getenv("SERVER_SHUTDOWN_TIMEOUT", "30"))
+
+    # Tracing and metrics
+    TRACING_ENABLED = os.getenv("TRACING_ENABLED", "1") == "1"
+    TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "10000"))
+    # Append finished request traces as JSON lines (empty to disable)
+    TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "")
+
+    # Persistent LLM response cache
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/llm_cache.sqlite")
+    LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+    # Job analysis tier: "llm" (Gemini) or "fast" (local rules, no API call)
+    JOB_ANALYSIS_TIER = os.getenv("JOB_ANALYSIS_TIER", "llm")
+    # Fall back to the fast analyzer when Gemini fails, times out or returns
+    # unparseable output (results are marked "degraded")
+    JOB_ANALYSIS_FALLBACK = os.getenv("JOB_ANALYSIS_FALLBACK", "1") == "1"
+    JOB_ANALYSIS_TIMEOUT = float(os.getenv("JOB_ANALYSIS_TIMEOUT", "20"))
+    # Bump when the job analysis prompt changes so cached answers are not reused
+    JOB_ANALYSIS_PROMPT_VERSION = "2"
+
+    # Approximate token budget per prompt input; longer inputs are compacted
+    # to their most relevant sentences
+    PROMPT_TOKEN_BUDGETS = {
+        "analyze_job.job_description": 700,
+        "tailored_section.original_section": 300,
+        "tailored_section.job_description": 300,
+        "cover_letter.resume_text": 300,
+        "cover_letter.job_description": 300,
+    }
+
+    # Bulk job analysis: postings packed into one Gemini call, up to this many
+    # prompt tokens and postings (the answer grows with the posting count)
+    JOB_BATCH_TOKEN_BUDGET = int(os.getenv("JOB_BATCH_TOKEN_BUDGET", "6000"))
+    JOB_BATCH_MAX_POSTINGS = int(os.getenv("JOB_BATCH_MAX_POSTINGS", "20"))
+    # A batch call that raises (rate limit, quota, timeout) is retried whole
+    # this many times with exponential backoff, then falls back per posting
+    JOB_BATCH_RETRIES = int(os.getenv("JOB_BATCH_RETRIES", "2"))
+    JOB_BATCH_BACKOFF_SECONDS = float(os.getenv("JOB_BATCH_BACKOFF_SECONDS", "1"))
+
+    # Near-duplicate postings (MinHash/LSH) are analyzed once per cluster:
+    # Jaccard similarity of word shingles that counts as a duplicate
+    JOB_DEDUP_ENABLED = os.getenv("JOB_DEDUP_ENABLED", "1") == "1"
+    JOB_DEDUP_THRESHOLD = float(os.getenv("JOB_DEDUP_THRESHOLD", "0.8"))
+    JOB_DEDUP_NUM_PERM = int(os.getenv("JOB_DEDUP_NUM_PERM", "128"))
+    JOB_DEDUP_SHINGLE_SIZE = int(os.getenv("JOB_DEDUP_SHINGLE_SIZE", "3"))
+
+    # PDF extraction budgets (stop reading oversized documents early; 0 = no limit)
+    PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "10"))
+    PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "30000"))
+
+    # Extracted-text cache shared by all worker processes
+    DOCUMENT_CACHE_ENABLED = os.getenv("DOCUMENT_CACHE_ENABLED", "1") == "1"
+    DOCUMENT_CACHE_PATH = os.getenv("DOCUMENT_CACHE_PATH", "data/document_cache.sqlite")
+    DOCUMENT_CACHE_MAX_BYTES = int(os.getenv("DOCUMENT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
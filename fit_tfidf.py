@@ -0,0 +1,73 @@
+"""Fit the corpus-level TF-IDF model used by TFIDF_MODE=fitted"""
+
+import argparse
+import os
+import sys
+
+from config import Config
+from tools.pdf_tools import extract_text_from_pdf, extract_text_from_docx
+from tools.scoring_tools import fit_tfidf_model
+
+
+def load_corpus(paths):
+    """
+    Read reference documents from files and directories.
+
+    Args:
+        paths: Files or directories containing .txt, .pdf or .docx documents
+
+    Returns:
+        List of document texts
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names))
+        else:
+            files.append(path)
+
+    corpus = []
+    for file_path in files:
+        file_extension = file_path.lower().split('.')[-1]
+
+        if file_extension == 'pdf':
+            result = extract_text_from_pdf(file_path)
+        elif file_extension == 'docx':
+            result = extract_text_from_docx(file_path)
+        elif file_extension == 'txt':
+            with open(file_path, encoding='utf-8', errors='ignore') as f:
+                result = {"success": True, "text": f.read()}
+        else:
+            continue
+
+        if result.get("success") and result["text"].strip():
+            corpus.append(result["text"])
+
+    return corpus
+
+
+def main():
+    """Fit and save the TF-IDF model"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="+", help="Corpus files or directories")
+    parser.add_argument("--output", default=Config.TFIDF_MODEL_PATH,
+                        help="Where to save the fitted vectorizer")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.paths)
+    if not corpus:
+        print("❌ Error: no .txt, .pdf or .docx documents found")
+        sys.exit(1)
+
+    result = fit_tfidf_model(corpus, args.output)
+    if not result["success"]:
+        print(f"❌ Error: {result['error']}")
+        sys.exit(1)
+
+    print(f"✓ Fitted on {result['document_count']} documents "
+          f"({result['vocabulary_size']} terms) -> {result['model_path']}")
+
+
+if __name__ == "__main__":
+    main()
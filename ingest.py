@@ -0,0 +1,166 @@
+"""Bulk resume ingestion - parse PDF/DOCX dumps in a process pool"""
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterator, List, Optional
+import argparse
+import json
+import os
+import sys
+
+from config import Config
+from tools.pdf_tools import (
+    extract_text_from_pdf,
+    extract_text_from_docx,
+    extract_resume_sections,
+    extract_contact_info
+)
+from tools.skill_tools import extract_skills
+from tools.document_cache import cached_extract_text
+
+
+SUPPORTED_EXTENSIONS = ('pdf', 'docx', 'doc')
+
+
+def iter_resume_files(source: str) -> Iterator[str]:
+    """
+    List resume files from a directory or a manifest.
+
+    Args:
+        source: Directory to walk, or a manifest file with one path per line
+
+    Yields:
+        Paths of PDF/DOCX files
+    """
+    if os.path.isdir(source):
+        for root, dirs, names in os.walk(source):
+            dirs.sort()
+            for name in sorted(names):
+                if name.lower().split('.')[-1] in SUPPORTED_EXTENSIONS:
+                    yield os.path.join(root, name)
+    else:
+        with open(source, encoding='utf-8') as manifest:
+            for line in manifest:
+                path = line.strip()
+                if path and not path.startswith('#'):
+                    yield path
+
+
+def process_resume(file_path: str) -> Dict:
+    """
+    Parse one resume file (runs inside a worker process).
+
+    Args:
+        file_path: Path to resume file (PDF or DOCX)
+
+    Returns:
+        Dictionary with text, sections, contact info and skills
+    """
+    file_extension = file_path.lower().split('.')[-1]
+
+    if Config.DOCUMENT_CACHE_ENABLED and file_extension in SUPPORTED_EXTENSIONS:
+        result = cached_extract_text(file_path)
+    elif file_extension == 'pdf':
+        result = extract_text_from_pdf(file_path)
+    elif file_extension in ['docx', 'doc']:
+        result = extract_text_from_docx(file_path)
+    else:
+        return {"file_path": file_path, "success": False,
+                "error": f"Unsupported file type: {file_extension}"}
+
+    if not result.get("success", False):
+        return {"file_path": file_path, "success": False,
+                "error": result.get("error", "Unknown error")}
+
+    text = result["text"]
+    return {
+        "file_path": file_path,
+        "success": True,
+        "text": text,
+        "word_count": result.get("word_count", len(text.split())),
+        "sections": extract_resume_sections(text),
+        "contact": extract_contact_info(text),
+        "skills": extract_skills(text, Config.SKILL_DATABASE)["skills"]
+    }
+
+
+def ingest_resumes(source: str,
+                   output_path: str,
+                   workers: Optional[int] = None,
+                   max_in_flight: Optional[int] = None) -> Dict:
+    """
+    Parse every resume in source and stream results to JSONL.
+
+    Results are written as they finish (not in input order). At most
+    max_in_flight files are queued at once, so memory stays flat on
+    dumps of any size.
+
+    Args:
+        source: Directory or manifest of PDF/DOCX files
+        output_path: JSONL file to write, one record per resume
+        workers: Worker process count (defaults to Config.INGEST_WORKERS or CPU count)
+        max_in_flight: Submitted-but-unfinished limit (defaults to 4x workers)
+
+    Returns:
+        Dictionary with processed and failed counts
+    """
+    workers = workers or Config.INGEST_WORKERS or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+
+    processed = failed = 0
+    pending = set()
+
+    def drain():
+        nonlocal processed, failed, pending
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                record = future.result()
+            except Exception as e:
+                record = {"file_path": future.file_path, "success": False, "error": str(e)}
+            if record["success"]:
+                processed += 1
+            else:
+                failed += 1
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    with open(output_path, 'w', encoding='utf-8') as output, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        for file_path in iter_resume_files(source):
+            if len(pending) >= max_in_flight:
+                drain()
+            future = pool.submit(process_resume, file_path)
+            future.file_path = file_path
+            pending.add(future)
+
+        while pending:
+            drain()
+
+    return {
+        "success": True,
+        "processed": processed,
+        "failed": failed,
+        "output_path": output_path
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", help="Directory of resumes or manifest file (one path per line)")
+    parser.add_argument("--output", default="resumes.jsonl", help="JSONL output path")
+    parser.add_argument("--workers", type=int, default=None, help="Worker process count")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Maximum files queued at once (default: 4x workers)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.source):
+        print(f"❌ Error: {args.source} not found")
+        sys.exit(1)
+
+    result = ingest_resumes(args.source, args.output, args.workers, args.max_in_flight)
+    print(f"✓ Parsed {result['processed']} resumes ({result['failed']} failed) -> {result['output_path']}")
+
+
+if __name__ == "__main__":
+    main()
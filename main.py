@@ -1,12 +1,12 @@
 """Main Application - Using Correct ADK Pattern"""
 
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.adk.memory import InMemoryMemoryService
-from google.genai import types
+# ADK and the GenAI SDK are imported inside the entry points that need them,
+# so `parse` and other local commands start without loading them
 from agents.coordinator_agent import create_coordinator_agent
+from agents.recommendation_agent import stream_cover_letter
 from config import Config
 from tools.pdf_tools import extract_text_from_pdf, extract_text_from_docx
+from tools.document_cache import cached_extract_text
 import asyncio
 import os
 
@@ -26,7 +26,9 @@ def parse_resume_locally(file_path: str) -> str:
 
     file_extension = file_path.lower().split('.')[-1]
 
-    if file_extension == 'pdf':
+    if Config.DOCUMENT_CACHE_ENABLED and file_extension in ['pdf', 'docx', 'doc']:
+        result = cached_extract_text(file_path)
+    elif file_extension == 'pdf':
         result = extract_text_from_pdf(file_path)
     elif file_extension in ['docx', 'doc']:
         result = extract_text_from_docx(file_path)
@@ -41,6 +43,10 @@ def parse_resume_locally(file_path: str) -> str:
 
 async def main():
     """Main application entry point"""
+    from google.adk.agents.run_config import RunConfig, StreamingMode
+    from google.adk.runners import Runner
+    from google.genai import types
+    from tools.session_store import get_session_service
 
     print("=" * 60)
     print("🚀 AI Resume Optimizer - Google ADK")
@@ -52,11 +58,11 @@ async def main():
 
     # Create ADK Runner
     print("✓ Initializing ADK Runner...")
+    session_service = get_session_service()
     runner = Runner(
         agent=coordinator_agent,
         app_name=Config.APP_NAME,
-        session_service=InMemorySessionService(),
-        memory_service=InMemoryMemoryService()
+        session_service=session_service
     )
 
     # Example query
@@ -83,7 +89,7 @@ async def main():
     print(f"\nQuery: {query[:200]}...")
 
     # Create content
-    content = types.Content.from_parts(types.Part.from_text(query))
+    content = types.Content(role="user", parts=[types.Part(text=query)])
 
     # Run the agent
     print("\n" + "-" * 60)
@@ -91,18 +97,37 @@ async def main():
     print("-" * 60)
 
     try:
-        # Note: Actual implementation depends on ADK Runner API
-        # This is a conceptual example
+        # A fresh session per run, so no context carries over between requests
+        session = await session_service.create_session(
+            app_name=Config.APP_NAME,
+            user_id=Config.USER_ID
+        )
 
-        result = await runner.run(
+        print("\nResult:")
+        streamed = False
+        # SSE mode emits partial events with text as the coordinator produces
+        # it; tool results (tailored sections, cover letters) arrive whole,
+        # see the "letter" interactive command for a streamed cover letter
+        async for event in runner.run_async(
             user_id=Config.USER_ID,
-            session_id=Config.SESSION_ID,
-            content=content
-        )
+            session_id=session.id,
+            new_message=content,
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE)
+        ):
+            if not (event.content and event.content.parts):
+                continue
+            text = "".join(part.text or "" for part in event.content.parts)
+            if event.partial:
+                print(text, end="", flush=True)
+                streamed = True
+            elif streamed:
+                # The aggregated event repeats text already printed in chunks
+                print()
+                streamed = False
+            elif event.is_final_response():
+                print(text)
 
         print("\n✓ Analysis Complete!")
-        print("\nResult:")
-        print(result)
 
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
@@ -114,6 +139,9 @@ async def main():
 
 def run_interactive_mode():
     """Run in interactive CLI mode"""
+    from google.adk.runners import Runner
+    from tools.session_store import get_session_service
+
     print("\n" + "=" * 60)
     print("📝 Interactive Mode")
     print("=" * 60)
@@ -125,14 +153,15 @@ def run_interactive_mode():
     runner = Runner(
         agent=coordinator_agent,
         app_name=Config.APP_NAME,
-        session_service=InMemorySessionService()
+        session_service=get_session_service()
     )
 
     print("\nAvailable commands:")
     print("1. parse <file_path>              - Parse resume locally")
     print("2. analyze <job_description>      - Analyze job")
     print("3. compare <resume_path> <job>    - Full analysis")
-    print("4. exit                           - Quit")
+    print("4. letter <resume_path> <job>     - Stream a cover letter")
+    print("5. exit                           - Quit")
 
     while True:
         try:
@@ -177,8 +206,25 @@ def run_interactive_mode():
                 except Exception as e:
                     print(f"❌ Failed to parse resume: {e}")
 
+            elif user_input.startswith("letter"):
+                parts = user_input.split(" ", 2)
+                if len(parts) < 3:
+                    print("Usage: letter <resume_path> <job_description>")
+                    continue
+
+                try:
+                    resume_text = parse_resume_locally(parts[1].strip())
+                except Exception as e:
+                    print(f"❌ Failed to parse resume: {e}")
+                    continue
+
+                # Print chunks as they arrive instead of waiting for the whole letter
+                for chunk in stream_cover_letter(resume_text, parts[2].strip()):
+                    print(chunk, end="", flush=True)
+                print()
+
             else:
-                print("Unknown command. Try: parse, analyze, compare, or exit")
+                print("Unknown command. Try: parse, analyze, compare, letter, or exit")
 
         except KeyboardInterrupt:
             print("\nInterrupted. Goodbye! 👋")
@@ -1,12 +1,17 @@
-"""Simple launch script for ADK Web"""
+"""Simple launch script for ADK Web or the HTTP service"""
 
+import argparse
 import subprocess
 import os
 import sys
 
 
 def main():
-    """Launch ADK web interface"""
+    """Launch ADK web interface, or the HTTP service with --serve"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--serve", action="store_true",
+                        help="Run the HTTP service (server.py) instead of the ADK dev UI")
+    args, server_args = parser.parse_known_args()
 
     # Check if GEMINI_API_KEY is set
     if not os.getenv("GEMINI_API_KEY"):
@@ -18,6 +23,12 @@ def main():
     print("🚀 Starting ADK Resume Optimizer...")
     print("=" * 60)
 
+    if args.serve:
+        import server
+
+        server.main(server_args)
+        return
+
     try:
         # Launch ADK web
         subprocess.run(["adk", "web", "."], check=True)
@@ -0,0 +1,431 @@
+"""HTTP service for the resume optimizer"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from agents.job_analyzer_agent import analyze_job_with_gemini_async
+from agents.recommendation_agent import (
+    generate_recommendations_async,
+    stream_cover_letter_async,
+    stream_tailored_section_async
+)
+from agents.skill_gap_agent import analyze_skill_gap
+from config import Config
+from tools.document_cache import cached_extract_text
+from tools.pdf_tools import (
+    extract_text_from_pdf,
+    extract_text_from_docx,
+    extract_resume_sections,
+    extract_contact_info
+)
+from tools.scoring_tools import load_tfidf_model
+from tools.skill_taxonomy import get_skill_taxonomy
+from tools.skill_tools import extract_skills
+from tools.tracing import current_request_id, current_span, request_context, span, tracer, worker_context
+
+
+MAX_TEXT = Config.SERVER_MAX_TEXT_CHARS
+
+
+def parse_resume_upload(data: bytes, filename: str) -> dict:
+    """
+    Extract text, sections, contact info and skills from an uploaded resume.
+
+    Args:
+        data: File content
+        filename: Original file name (its extension picks the parser)
+
+    Returns:
+        Parsed resume
+    """
+    file_extension = filename.lower().split('.')[-1]
+    if file_extension not in ['pdf', 'docx', 'doc']:
+        return {"success": False, "error": f"Unsupported file type: {file_extension}"}
+
+    fd, path = tempfile.mkstemp(suffix=f".{file_extension}")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+
+        if Config.DOCUMENT_CACHE_ENABLED:
+            result = cached_extract_text(path)
+        elif file_extension == 'pdf':
+            result = extract_text_from_pdf(path)
+        else:
+            result = extract_text_from_docx(path)
+    finally:
+        os.unlink(path)
+
+    if not result.get("success", False):
+        return {"success": False, "error": result.get("error", "Unknown error")}
+
+    text = result["text"]
+    return {
+        "success": True,
+        "text": text,
+        "word_count": result.get("word_count", len(text.split())),
+        "sections": extract_resume_sections(text),
+        "contact": extract_contact_info(text),
+        "skills": extract_skills(text, Config.SKILL_DATABASE)["skills"]
+    }
+
+
+def score_gap(resume_text: str,
+              job_description: str,
+              resume_skills: Optional[List[str]],
+              job_skills: Optional[List[str]]) -> dict:
+    """Gap analysis, extracting skills from the texts when they are not given."""
+    if resume_skills is None:
+        resume_skills = extract_skills(resume_text, Config.SKILL_DATABASE)["skills"]
+    if job_skills is None:
+        job_skills = extract_skills(job_description, Config.SKILL_DATABASE)["skills"]
+
+    return analyze_skill_gap(
+        {"skills": resume_skills},
+        {"required_technical_skills": job_skills},
+        resume_text,
+        job_description
+    )
+
+
+class AnalyzeJobRequest(BaseModel):
+    job_description: str = Field(min_length=1, max_length=MAX_TEXT)
+
+
+class GapScoreRequest(BaseModel):
+    resume_text: str = Field(min_length=1, max_length=MAX_TEXT)
+    job_description: str = Field(min_length=1, max_length=MAX_TEXT)
+    resume_skills: Optional[List[str]] = Field(default=None, max_length=1000)
+    job_skills: Optional[List[str]] = Field(default=None, max_length=1000)
+
+
+async def sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Server-sent events for a text stream.
+
+    Each chunk is a JSON-encoded `data:` event; the stream ends with a
+    `done` event, or an `error` event if generation fails part way (the
+    status code has already been sent by then).
+    """
+    try:
+        async for chunk in chunks:
+            yield f"data: {json.dumps(chunk)}\n\n"
+    except Exception as e:
+        yield f"event: error\ndata: {json.dumps(str(e))}\n\n"
+        return
+    yield "event: done\ndata: \"\"\n\n"
+
+
+class RecommendRequest(BaseModel):
+    resume_text: str = Field(min_length=1, max_length=MAX_TEXT)
+    job_description: str = Field(min_length=1, max_length=MAX_TEXT)
+    missing_skills: List[str] = Field(default_factory=list, max_length=1000)
+    original_section: str = Field(default="", max_length=MAX_TEXT)
+    company_name: str = Field(default="", max_length=200)
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies over max_bytes with 413, even without
+    Content-Length, and a malformed Content-Length with 400.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None:
+            try:
+                declared = int(content_length)
+            except ValueError:
+                declared = -1
+            if declared < 0:
+                response = JSONResponse({"detail": "Invalid Content-Length header"}, status_code=400)
+                return await response(scope, receive, send)
+            if declared > self.max_bytes:
+                response = JSONResponse({"detail": self._detail()}, status_code=413)
+                return await response(scope, receive, send)
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Surfaces as a 413 wherever the body is being read
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        return f"Request body exceeds {self.max_bytes} bytes"
+
+
+class RequestScopeMiddleware:
+    """
+    Per-request trace scope, in-flight accounting and shutdown draining.
+
+    While draining, new requests get 503 so a load balancer moves them to
+    another instance.
+    """
+
+    def __init__(self, app, state: dict):
+        self.app = app
+        self.state = state
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        if self.state["draining"]:
+            response = JSONResponse({"detail": "Server is shutting down"}, status_code=503)
+            return await response(scope, receive, send)
+
+        headers = dict(scope["headers"])
+        request_id_header = headers.get(b"x-request-id", b"").decode("latin-1") or None
+
+        self.state["in_flight"] += 1
+        try:
+            with request_context(request_id_header) as request_id:
+                with span(f"http.{scope['path'].strip('/') or 'root'}", kind="request",
+                          method=scope["method"]) as active:
+
+                    async def send_with_id(message):
+                        if message["type"] == "http.response.start":
+                            message["headers"] = list(message.get("headers", [])) + [
+                                (b"x-request-id", request_id.encode("latin-1"))
+                            ]
+                            # Handled errors (413, HTTPException) still complete the request
+                            active.set(status_code=message["status"])
+                            if message["status"] >= 400:
+                                active.error = f"HTTP {message['status']}"
+                        await send(message)
+
+                    try:
+                        await self.app(scope, receive, send_with_id)
+                    except Exception:
+                        active.attributes.setdefault("status_code", 500)
+                        raise
+        finally:
+            self.state["in_flight"] -= 1
+
+
+def _init_worker() -> None:
+    """Load the TF-IDF model and skill taxonomy once per worker, before the first request."""
+    load_tfidf_model()
+    get_skill_taxonomy()
+
+
+def _run_in_worker(request_id: Optional[str], parent_id: Optional[str], func, *args):
+    """Run func under the caller's trace and return (result, error, spans)."""
+    with worker_context(request_id, parent_id) as spans:
+        try:
+            with span(f"worker.{func.__name__}", kind="worker", pid=os.getpid()):
+                result = func(*args)
+        except Exception as e:
+            return None, e, spans
+    return result, None, spans
+
+
+class WorkerPool:
+    """
+    Process pool for CPU stages with a cap on queued work.
+
+    When max_pending jobs are already queued or running, new work is
+    rejected (HTTP 503) instead of queueing without bound, so latency
+    under overload stays predictable. Workers are started with forkserver
+    or spawn rather than forked from the serving process, and load the
+    TF-IDF model and skill taxonomy up front. Spans recorded in a worker
+    are sent back with the result, so they show up in /metrics and in
+    the request's trace.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        start_method = Config.SERVER_WORKER_START_METHOD or (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker
+        )
+
+    async def run(self, func, *args):
+        if self.pending >= self.max_pending:
+            raise HTTPException(status_code=503, detail="Server busy, retry later")
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            parent = current_span()
+            result, error, spans = await loop.run_in_executor(
+                self._executor, _run_in_worker,
+                current_request_id(), parent.span_id if parent else None, func, *args
+            )
+        finally:
+            self.pending -= 1
+
+        for worker_span in spans:
+            tracer.record(worker_span)
+        if error is not None:
+            raise error
+        return result
+
+    def shutdown(self) -> None:
+        """Let queued work finish, then stop the workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def create_app(workers: Optional[int] = None) -> FastAPI:
+    """
+    Build the HTTP application.
+
+    CPU stages (parsing, scoring) run in a bounded process pool; LLM stages
+    run as coroutines on the event loop, limited by LLM_MAX_CONCURRENCY.
+    On shutdown the service stops accepting requests, lets in-flight ones
+    finish and then stops the pool.
+
+    Args:
+        workers: CPU worker processes (defaults to Config.SERVER_CPU_WORKERS or CPU count)
+
+    Returns:
+        FastAPI application
+    """
+    workers = workers or Config.SERVER_CPU_WORKERS or os.cpu_count() or 1
+    pool = WorkerPool(workers, Config.SERVER_MAX_PENDING or workers * 4)
+    state = {"draining": False, "in_flight": 0}
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        pool.start()
+        try:
+            yield
+        finally:
+            state["draining"] = True
+            # Uvicorn has already waited for open connections; this covers
+            # handlers still finishing background awaits
+            deadline = asyncio.get_running_loop().time() + Config.SERVER_SHUTDOWN_TIMEOUT
+            while state["in_flight"] and asyncio.get_running_loop().time() < deadline:
+                await asyncio.sleep(0.05)
+            pool.shutdown()
+
+    app = FastAPI(title=Config.APP_NAME, lifespan=lifespan)
+
+    @app.get("/health")
+    async def health():
+        return {
+            "status": "ok",
+            "cpu_workers": pool.workers,
+            "cpu_pending": pool.pending,
+            "in_flight": state["in_flight"]
+        }
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        return tracer.prometheus_text()
+
+    @app.post("/parse")
+    async def parse(file: UploadFile = File(...)):
+        data = await file.read()
+        result = await pool.run(parse_resume_upload, data, file.filename or "")
+        if not result["success"]:
+            raise HTTPException(status_code=422, detail=result["error"])
+        return result
+
+    @app.post("/analyze-job")
+    async def analyze_job(body: AnalyzeJobRequest):
+        result = await analyze_job_with_gemini_async(body.job_description)
+        if "error" in result:
+            raise HTTPException(status_code=502, detail=result["error"])
+        return result
+
+    @app.post("/gap-score")
+    async def gap_score(body: GapScoreRequest):
+        return await pool.run(
+            score_gap,
+            body.resume_text,
+            body.job_description,
+            body.resume_skills,
+            body.job_skills
+        )
+
+    @app.post("/recommend")
+    async def recommend(body: RecommendRequest):
+        result = await generate_recommendations_async(
+            body.original_section or body.resume_text,
+            body.resume_text,
+            body.job_description,
+            body.missing_skills,
+            body.company_name
+        )
+        if not result["success"]:
+            raise HTTPException(status_code=502, detail=f"{result['failed_stage']}: {result['error']}")
+        return result
+
+    @app.post("/recommend/cover-letter/stream")
+    async def stream_cover_letter(body: RecommendRequest):
+        chunks = stream_cover_letter_async(body.resume_text, body.job_description, body.company_name)
+        return StreamingResponse(sse_events(chunks), media_type="text/event-stream")
+
+    @app.post("/recommend/tailored-section/stream")
+    async def stream_tailored_section(body: RecommendRequest):
+        chunks = stream_tailored_section_async(
+            body.original_section or body.resume_text,
+            body.job_description,
+            body.missing_skills
+        )
+        return StreamingResponse(sse_events(chunks), media_type="text/event-stream")
+
+    # Plain ASGI middleware (the last one added is the outermost)
+    app.add_middleware(BodySizeLimitMiddleware, max_bytes=Config.SERVER_MAX_BODY_BYTES)
+    app.add_middleware(RequestScopeMiddleware, state=state)
+    return app
+
+
+def main(argv: List[str] = None):
+    """Serve the HTTP API with uvicorn"""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=Config.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=Config.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="CPU worker processes")
+    args = parser.parse_args(argv)
+
+    uvicorn.run(
+        create_app(args.workers),
+        host=args.host,
+        port=args.port,
+        timeout_graceful_shutdown=Config.SERVER_SHUTDOWN_TIMEOUT
+    )
+
+
+if __name__ == "__main__":
+    main()
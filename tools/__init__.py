@@ -1,12 +1,17 @@
 """Tools Package - Export all tool functions"""
 
 from .pdf_tools import (
+    iter_pdf_pages,
     extract_text_from_pdf,
     extract_text_from_docx,
+    segment_resume,
     extract_resume_sections,
-    extract_contact_info
+    extract_contact_info,
+    extract_contact_info_batch
 )
 
+from .skill_taxonomy import SkillTaxonomy, build_taxonomy, get_skill_taxonomy
+
 from .skill_tools import (
     extract_skills,
     identify_missing_skills
@@ -14,18 +19,50 @@ from .skill_tools import (
 
 from .scoring_tools import (
     calculate_tfidf_similarity,
+    calculate_tfidf_similarity_fitted,
+    fit_tfidf_model,
+    load_tfidf_model,
     calculate_keyword_match,
-    calculate_final_score
+    calculate_final_score,
+    rank_resumes_for_job,
+    rank_jobs_for_resume
 )
 
+from .skill_overlap import SkillOverlap, calculate_skill_overlap
+from .scoring_session import ScoringSession
+from .job_dedup import JobDeduplicator, deduplicate_postings
+from .fast_job_analyzer import analyze_job_fast
+from .resume_index import ResumeIndex
+from .document_cache import DocumentCache, cached_extract_text
+
 __all__ = [
+    'iter_pdf_pages',
     'extract_text_from_pdf',
     'extract_text_from_docx',
+    'segment_resume',
     'extract_resume_sections',
     'extract_contact_info',
+    'extract_contact_info_batch',
+    'SkillTaxonomy',
+    'build_taxonomy',
+    'get_skill_taxonomy',
     'extract_skills',
     'identify_missing_skills',
     'calculate_tfidf_similarity',
+    'calculate_tfidf_similarity_fitted',
+    'fit_tfidf_model',
+    'load_tfidf_model',
     'calculate_keyword_match',
-    'calculate_final_score'
+    'calculate_final_score',
+    'rank_resumes_for_job',
+    'rank_jobs_for_resume',
+    'SkillOverlap',
+    'calculate_skill_overlap',
+    'ScoringSession',
+    'JobDeduplicator',
+    'deduplicate_postings',
+    'analyze_job_fast',
+    'ResumeIndex',
+    'DocumentCache',
+    'cached_extract_text'
 ]
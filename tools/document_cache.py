@@ -0,0 +1,236 @@
+"""Document Cache - content-addressed cache for extracted resume text"""
+from typing import Dict, Optional
+from config import Config
+from .pdf_tools import extract_text_from_pdf, extract_text_from_docx, EXTRACTOR_VERSION
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    page_count INTEGER,
+    word_count INTEGER NOT NULL,
+    pages_read INTEGER,
+    truncated INTEGER,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_last_access ON documents (last_access);
+"""
+
+# Columns added after the first release, for databases created before them
+_ADDED_COLUMNS = {"pages_read": "INTEGER", "truncated": "INTEGER"}
+
+
+class DocumentCache:
+    """
+    SQLite cache of extracted text keyed by file content hash.
+
+    The key combines the SHA-256 of the file bytes with the file type,
+    the extraction budgets and EXTRACTOR_VERSION, so re-uploads of the
+    same file hit regardless of name, while a budget or extractor change
+    invalidates old entries. The database
+    runs in WAL mode with a busy timeout so several worker processes can
+    share one file. When the stored text exceeds max_bytes the least
+    recently used entries are evicted. One connection is shared by all
+    threads of a process and serialized with a lock.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_path = cache_path or Config.DOCUMENT_CACHE_PATH
+        self.max_bytes = max_bytes or Config.DOCUMENT_CACHE_MAX_BYTES
+
+        cache_dir = os.path.dirname(self.cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.cache_path, timeout=30,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(documents)")}
+        for column, column_type in _ADDED_COLUMNS.items():
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE documents ADD COLUMN {column} {column_type}")
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    @staticmethod
+    def make_key(content: bytes,
+                 file_type: str,
+                 max_pages: Optional[int] = None,
+                 max_chars: Optional[int] = None) -> str:
+        """
+        Cache key for file content of the given type.
+
+        Args:
+            content: File bytes
+            file_type: File extension
+            max_pages: Page budget the text was extracted with (PDF only)
+            max_chars: Character budget the text was extracted with (PDF only)
+
+        Returns:
+            Cache key
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        return f"{digest}:{file_type}:{max_pages}:{max_chars}:{EXTRACTOR_VERSION}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up extracted text.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Dictionary with text, word_count and, for PDFs, page_count,
+            pages_read and truncated; None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, page_count, word_count, pages_read, truncated FROM documents WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE documents SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+
+        text, page_count, word_count, pages_read, truncated = row
+        result = {"text": text, "page_count": page_count, "word_count": word_count}
+        if pages_read is not None:
+            result["pages_read"] = pages_read
+            result["truncated"] = bool(truncated)
+        return result
+
+    def put(self,
+            key: str,
+            text: str,
+            word_count: int,
+            page_count: Optional[int] = None,
+            pages_read: Optional[int] = None,
+            truncated: Optional[bool] = None) -> None:
+        """
+        Store extracted text and evict least recently used entries over the size limit.
+
+        Args:
+            key: Key from make_key
+            text: Extracted text
+            word_count: Word count of the text
+            page_count: Page count (PDF only)
+            pages_read: Pages extracted within the budget (PDF only)
+            truncated: Whether the budget cut the text short (PDF only)
+        """
+        size = len(text.encode('utf-8'))
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """INSERT OR REPLACE INTO documents
+                       (key, text, page_count, word_count, pages_read, truncated, size, last_access)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (key, text, page_count, word_count, pages_read,
+                     None if truncated is None else int(truncated), size, time.time())
+                )
+
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM documents").fetchone()[0]
+                if total > self.max_bytes:
+                    excess = total - self.max_bytes
+                    # Oldest entries first until enough bytes are freed
+                    victims = []
+                    for victim_key, victim_size in self._conn.execute(
+                            "SELECT key, size FROM documents ORDER BY last_access"):
+                        if excess <= 0:
+                            break
+                        victims.append((victim_key,))
+                        excess -= victim_size
+                    self._conn.executemany("DELETE FROM documents WHERE key = ?", victims)
+
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def stats(self) -> Dict:
+        """Entry count and stored bytes."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM documents"
+            ).fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+
+_default_cache: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Process-wide DocumentCache at Config.DOCUMENT_CACHE_PATH."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DocumentCache()
+    return _default_cache
+
+
+def cached_extract_text(file_path: str, cache: Optional[DocumentCache] = None) -> Dict:
+    """
+    Extract text from a PDF/DOCX file, reusing the cached result for identical content.
+
+    Args:
+        file_path: Path to resume file (PDF or DOCX)
+        cache: Cache to use (defaults to the process-wide cache)
+
+    Returns:
+        Dictionary with extracted text and metadata, plus cache_hit
+    """
+    file_extension = file_path.lower().split('.')[-1]
+    max_pages = max_chars = None
+    if file_extension == 'pdf':
+        extractor = extract_text_from_pdf
+        max_pages, max_chars = Config.PDF_MAX_PAGES, Config.PDF_MAX_CHARS
+    elif file_extension in ['docx', 'doc']:
+        extractor = extract_text_from_docx
+    else:
+        return {
+            "success": False,
+            "error": f"Unsupported file type: {file_extension}",
+            "text": ""
+        }
+
+    try:
+        with open(file_path, 'rb') as file:
+            content = file.read()
+    except Exception as e:
+        return {"success": False, "error": str(e), "text": ""}
+
+    cache = cache or get_document_cache()
+    key = DocumentCache.make_key(content, file_extension, max_pages, max_chars)
+
+    try:
+        cached = cache.get(key)
+    except sqlite3.Error:
+        cached = None
+    if cached is not None:
+        return {"success": True, **cached, "cache_hit": True}
+
+    result = extractor(file_path)
+    if result.get("success", False):
+        try:
+            cache.put(key, result["text"], result["word_count"], result.get("page_count"),
+                      result.get("pages_read"), result.get("truncated"))
+        except sqlite3.Error:
+            pass
+
+    result["cache_hit"] = False
+    return result
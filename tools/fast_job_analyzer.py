@@ -0,0 +1,193 @@
+"""Fast Job Analyzer - deterministic job description analysis without an LLM"""
+from typing import Dict, List, Optional
+from config import Config
+from .skill_taxonomy import get_skill_taxonomy
+from .tracing import span
+import re
+
+
+# Soft skills and the phrases that signal them
+_SOFT_SKILL_NAMES: Dict[str, str] = {
+    phrase.lower(): skill
+    for skill, phrases in Config.SOFT_SKILLS.items()
+    for phrase in [skill] + phrases
+}
+_SOFT_SKILL_PATTERN = re.compile(
+    r"\b(?:" + "|".join(
+        re.escape(phrase) for phrase in sorted(_SOFT_SKILL_NAMES, key=len, reverse=True)
+    ) + r")\b",
+    re.IGNORECASE
+)
+
+# "5+ years of", "3-5 yrs experience", "at least 2 years", "7 to 10 years' Python experience".
+# Only requirement contexts count, not "founded 25 years ago" or "a 2 year contract"
+_YEARS_PATTERN = re.compile(
+    r"(?P<minimum>\b(?:at\s+least|(?:a\s+)?minimum(?:\s+of)?|min\.?)\s+)?"
+    r"\b(?P<low>\d{1,2})\s*\+?\s*(?:(?:-|–|to)\s*\d{1,2}\s*\+?\s*)?(?:years?|yrs?)\b['’]?"
+    r"(?P<context>\s+(?:of\b|(?:[\w+#./-]+\s+){0,3}?experience\b))?",
+    re.IGNORECASE
+)
+
+# Checked in order against the title, so "Senior Staff Engineer" is Lead and "Junior" beats "Engineer II"
+_SENIORITY_LEVELS = [
+    ("Lead", re.compile(r"\b(?:lead|staff|principal|architect|head of|director|manager)\b", re.IGNORECASE)),
+    ("Senior", re.compile(r"\b(?:senior|sr\.?|expert)\b", re.IGNORECASE)),
+    ("Entry", re.compile(r"\b(?:intern(?:ship)?|junior|jr\.?|entry[- ]level|graduate|new grad)\b",
+                         re.IGNORECASE)),
+    ("Mid", re.compile(r"\b(?:mid[- ]level|intermediate)\b", re.IGNORECASE)),
+]
+
+# In the body, a level only counts as part of a singular job title ("as a Senior
+# Backend Engineer", "Engineering Manager"), not "lead the team" or "mentor junior developers"
+_ROLE_NOUN = r"(?:engineer|developer|programmer|architect|scientist|analyst|designer|consultant|administrator|specialist)"
+_ROLE = _ROLE_NOUN + r"\b"
+# Up to two qualifiers ("Senior Backend Engineer"), but not "lead engineers and architect"
+_ROLE_WORDS = rf"(?:(?!{_ROLE_NOUN}|(?:and|or|of|to|the|a|an|with|for)\b)[\w/+#.-]+\s+){{0,2}}?"
+_TITLE_LEVELS = [
+    ("Lead", re.compile(
+        rf"\b(?:tech(?:nical)?\s+lead|lead|staff|principal)\s+{_ROLE_WORDS}{_ROLE}"
+        r"|\b(?:engineering|software|development|solutions?|enterprise|cloud|data|technical)\s+(?:manager|architect)\b"
+        r"|\b(?:head|director)\s+of\s+(?:engineering|technology|data|product|software)\b",
+        re.IGNORECASE)),
+    ("Senior", re.compile(rf"\b(?:senior|sr\.?)\s+{_ROLE_WORDS}{_ROLE}", re.IGNORECASE)),
+    ("Entry", re.compile(
+        rf"\b(?:junior|jr\.?|entry[- ]level|graduate)\s+{_ROLE_WORDS}{_ROLE}|\b(?:internship|new grad)\b",
+        re.IGNORECASE)),
+    ("Mid", re.compile(rf"\b(?:mid[- ]level|intermediate)\s+{_ROLE_WORDS}{_ROLE}", re.IGNORECASE)),
+]
+# Titles of the people around the role, not the role itself
+_COLLEAGUE_CONTEXT = re.compile(r"\b(?:report(?:s|ing)?\s+(?:in)?to|with|alongside|under)\s+(?:the|a|an|our|your)?\s*$",
+                                re.IGNORECASE)
+
+# (minimum years, level) from the most to the least experienced
+_YEARS_LEVELS = [(8, "Lead"), (5, "Senior"), (2, "Mid"), (0, "Entry")]
+
+# Heading lines that open the responsibilities list
+_RESPONSIBILITY_HEADER = re.compile(
+    r"^[ \t]*(?:key |your |core |main |primary |job )?"
+    r"(?:responsibilities|duties|what you(?:'|’)?ll do|what you will do|the role|role overview|"
+    r"in this role(?: you will)?|day[- ]to[- ]day)[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+# A heading-like line ends the list: short, no sentence punctuation, ends with a colon or is Title Case
+_NEXT_HEADER = re.compile(r"^[ \t]*[A-Z][^\n.;]{0,60}:[ \t]*$|^[ \t]*(?:[A-Z][\w'’&/-]*[ \t]*){1,6}$")
+_BULLET = re.compile(r"^[ \t]*(?:[-*•·▪◦]+|\d+[.)])[ \t]*(?P<item>\S.*)$")
+_ACTION_VERB = re.compile(
+    r"^(?:build|design|develop|lead|own|manage|maintain|implement|write|create|drive|"
+    r"collaborate|work|deliver|mentor|partner|support|architect|deploy|improve|define|"
+    r"analy[sz]e|ensure|participate|contribute|operate|monitor|optimi[sz]e)\w*\b",
+    re.IGNORECASE
+)
+
+_SALARY_PATTERN = re.compile(
+    r"[$€£]\s?\d[\d,]*(?:\.\d+)?\s?[kK]?\s*(?:-|–|to)\s*[$€£]?\s?\d[\d,]*(?:\.\d+)?\s?[kK]?"
+    r"(?:\s*(?:per|/)\s*(?:year|yr|annum|hour|hr))?"
+)
+
+MAX_RESPONSIBILITIES = 10
+
+
+def _required_years(text: str) -> Optional[int]:
+    """Largest lower bound among the experience requirements (the overall bar)."""
+    bounds = [
+        int(match.group("low")) for match in _YEARS_PATTERN.finditer(text)
+        if match.group("minimum") or match.group("context")
+    ]
+    bounds = [b for b in bounds if b <= 30]
+    return max(bounds) if bounds else None
+
+
+def _title_level(text: str) -> Optional[str]:
+    """Level of the first job title phrase in text that does not name a colleague."""
+    for level, pattern in _TITLE_LEVELS:
+        for match in pattern.finditer(text):
+            if not _COLLEAGUE_CONTEXT.search(text[max(0, match.start() - 30):match.start()]):
+                return level
+    return None
+
+
+def _seniority(text: str, years: Optional[int]) -> str:
+    # The title (first line) is the strongest signal, then the years asked for
+    title = text.strip().split("\n", 1)[0]
+    for level, pattern in _SENIORITY_LEVELS:
+        if pattern.search(title):
+            return level
+    if years is not None:
+        return next(level for minimum, level in _YEARS_LEVELS if years >= minimum)
+    return _title_level(text) or "Not specified"
+
+
+def _responsibilities(text: str) -> List[str]:
+    """Bullets under a responsibilities heading, else bullets that start with an action verb."""
+    header = _RESPONSIBILITY_HEADER.search(text)
+    items: List[str] = []
+    if header:
+        bulleted: Optional[bool] = None
+        for line in text[header.end():].split("\n"):
+            if not line.strip():
+                if items and bulleted is False:
+                    break
+                continue
+            bullet = _BULLET.match(line)
+            if bullet and bulleted is not False:
+                bulleted = True
+                items.append(bullet.group("item").strip())
+            elif bulleted or _NEXT_HEADER.match(line):
+                break
+            else:
+                # Unbulleted lists are one responsibility per line, up to a blank line
+                bulleted = False
+                items.append(line.strip())
+            if len(items) >= MAX_RESPONSIBILITIES:
+                break
+        if items:
+            return items
+
+    for line in text.split("\n"):
+        bullet = _BULLET.match(line)
+        if bullet and _ACTION_VERB.match(bullet.group("item")):
+            items.append(bullet.group("item").strip())
+            if len(items) >= MAX_RESPONSIBILITIES:
+                break
+    return items
+
+
+def analyze_job_fast(job_description: str) -> Dict:
+    """
+    Analyze a job description with compiled rules and the skill taxonomy.
+
+    Deterministic and local, so it takes milliseconds. Returns the same
+    keys as analyze_job_with_gemini, plus the years of experience asked
+    for, and is used as the "fast" tier and as the fallback when Gemini
+    fails.
+
+    Args:
+        job_description: Raw job description text
+
+    Returns:
+        Structured job requirements
+    """
+    with span("analyze_job_fast", kind="rules", input_size=len(job_description)):
+        taxonomy = get_skill_taxonomy()
+        soft_skills = list(dict.fromkeys(
+            _SOFT_SKILL_NAMES[match.group(0).lower()]
+            for match in _SOFT_SKILL_PATTERN.finditer(job_description)
+        ))
+        soft_keys = set(taxonomy.skill_keys(soft_skills))
+        technical = [
+            taxonomy.name(skill_id) for skill_id in taxonomy.find_ids(job_description)
+            if skill_id not in soft_keys
+        ]
+
+        years = _required_years(job_description)
+        salary = _SALARY_PATTERN.search(job_description)
+
+        return {
+            "required_technical_skills": technical,
+            "required_soft_skills": soft_skills,
+            "experience_level": _seniority(job_description, years),
+            "experience_years": years,
+            "key_responsibilities": _responsibilities(job_description),
+            "salary_range": salary.group(0).strip() if salary else "",
+            "analysis_tier": "fast"
+        }
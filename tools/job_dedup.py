@@ -0,0 +1,236 @@
+"""Job Deduplication - near-duplicate job postings with MinHash and LSH"""
+# NumPy is imported on first use, like in scoring_tools
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from config import Config
+from .tracing import span
+import re
+import zlib
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+_WORD = re.compile(r"\w+")
+
+# Postings hashed per vectorized MinHash pass (bounds the hash matrix size)
+SIGNATURE_CHUNK_SIZE = 256
+
+# Candidates checked per posting, so one huge bucket cannot go quadratic
+MAX_CANDIDATES = 64
+
+_SEED = 0x5EED
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Bands and rows per band for a Jaccard threshold.
+
+    Picks the split whose S-curve midpoint, (1/bands)^(1/rows), is the
+    highest one still at or below the threshold: near-duplicates almost
+    always share a bucket and candidates are verified afterwards.
+
+    Args:
+        num_perm: Signature length
+        threshold: Jaccard similarity that counts as a duplicate
+
+    Returns:
+        (bands, rows)
+    """
+    best = (num_perm, 1)
+    best_midpoint = 0.0
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        if best_midpoint < midpoint <= threshold:
+            best, best_midpoint = (bands, rows), midpoint
+    return best
+
+
+class JobDeduplicator:
+    """
+    Streaming near-duplicate detector for job postings.
+
+    Each posting becomes a set of word shingles summarized by a MinHash
+    signature. Only canonical postings (the first of each cluster) are
+    indexed in the LSH buckets, and a new posting joins the canonical
+    whose estimated Jaccard similarity is highest and at least the
+    threshold, so every duplicate is checked against its canonical
+    directly rather than chained through other duplicates. Work per
+    posting is bounded, so a feed is processed in linear time.
+    """
+
+    def __init__(self,
+                 threshold: Optional[float] = None,
+                 num_perm: Optional[int] = None,
+                 shingle_size: Optional[int] = None):
+        import numpy as np
+
+        self.threshold = threshold or Config.JOB_DEDUP_THRESHOLD
+        self.num_perm = num_perm or Config.JOB_DEDUP_NUM_PERM
+        self.shingle_size = shingle_size or Config.JOB_DEDUP_SHINGLE_SIZE
+        self.bands, self.rows = lsh_bands(self.num_perm, self.threshold)
+
+        # Multiply-shift hash family: (a * x + b) mod 2^64, top 32 bits
+        rng = np.random.default_rng(_SEED)
+        self._a = (rng.integers(1, 2 ** 63, self.num_perm, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, self.num_perm, dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._signatures: List["np.ndarray"] = []
+        self.canonical_ids: List[str] = []
+        self.duplicate_of: Dict[str, str] = {}
+
+    def _shingles(self, text: str) -> "np.ndarray":
+        """Distinct 64-bit hashes of the word n-grams of text."""
+        import numpy as np
+
+        # Hashed per call: a long-lived deduplicator keeps no vocabulary
+        tokens = _WORD.findall(text.lower())
+        hashes = {token: zlib.crc32(token.encode("utf-8")) for token in set(tokens)}
+
+        ids = np.fromiter((hashes[token] for token in tokens), dtype=np.uint64, count=len(tokens))
+        if len(ids) <= self.shingle_size:
+            return np.unique(ids)
+
+        # Polynomial combination of consecutive token hashes
+        shingles = np.zeros(len(ids) - self.shingle_size + 1, dtype=np.uint64)
+        for offset in range(self.shingle_size):
+            shingles = shingles * np.uint64(0x100000001B3) + ids[offset:len(ids) - self.shingle_size + 1 + offset]
+        return np.unique(shingles)
+
+    def signatures(self, texts: List[str]) -> List[Optional["np.ndarray"]]:
+        """
+        MinHash signatures of texts (None for texts without words).
+
+        Args:
+            texts: Job descriptions
+
+        Returns:
+            One uint32 array of num_perm values per text
+        """
+        import numpy as np
+
+        results: List[Optional[np.ndarray]] = []
+        for start in range(0, len(texts), SIGNATURE_CHUNK_SIZE):
+            shingle_sets = [self._shingles(text) for text in texts[start:start + SIGNATURE_CHUNK_SIZE]]
+            lengths = np.array([len(s) for s in shingle_sets])
+            if not lengths.any():
+                results.extend([None] * len(shingle_sets))
+                continue
+
+            flat = np.concatenate(shingle_sets)
+            # (num_perm, total shingles) hashed at once, then a min per posting;
+            # the top 32 bits of the minimum are the minimum of the top 32 bits
+            hashed = np.multiply(self._a[:, None], flat[None, :])
+            hashed += self._b[:, None]
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            nonempty = lengths > 0
+            mins = np.minimum.reduceat(hashed, offsets[nonempty], axis=1).T
+            mins = (mins >> np.uint64(32)).astype(np.uint32)
+
+            rows = iter(mins)
+            results.extend(next(rows) if has_words else None for has_words in nonempty)
+        return results
+
+    def _add_signature(self, posting_id: str, signature: Optional["np.ndarray"]) -> str:
+        import numpy as np
+
+        if signature is None:
+            self.canonical_ids.append(posting_id)
+            self._signatures.append(None)
+            return posting_id
+
+        keys = [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+        candidates: List[int] = []
+        seen = set()
+        for band, key in enumerate(keys):
+            for index in self._buckets[band].get(key, ()):
+                if index not in seen:
+                    seen.add(index)
+                    candidates.append(index)
+            if len(candidates) >= MAX_CANDIDATES:
+                break
+
+        best, best_similarity = None, self.threshold
+        for index in candidates[:MAX_CANDIDATES]:
+            similarity = float(np.mean(self._signatures[index] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = index, similarity
+
+        if best is not None:
+            canonical = self.canonical_ids[best]
+            self.duplicate_of[posting_id] = canonical
+            return canonical
+
+        index = len(self.canonical_ids)
+        self.canonical_ids.append(posting_id)
+        self._signatures.append(signature)
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, []).append(index)
+        return posting_id
+
+    def add(self, posting_id: str, text: str) -> str:
+        """
+        Add one posting.
+
+        Args:
+            posting_id: Posting identifier
+            text: Job description
+
+        Returns:
+            Id of the canonical posting (posting_id itself if it is new)
+        """
+        return self._add_signature(posting_id, self.signatures([text])[0])
+
+    def add_many(self, postings: Iterable[Tuple[str, str]]) -> None:
+        """Add (posting_id, text) pairs, hashing them in vectorized chunks."""
+        chunk: List[Tuple[str, str]] = []
+        for posting in postings:
+            chunk.append(posting)
+            if len(chunk) == SIGNATURE_CHUNK_SIZE:
+                self._add_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._add_chunk(chunk)
+
+    def _add_chunk(self, chunk: List[Tuple[str, str]]) -> None:
+        for (posting_id, _), signature in zip(chunk, self.signatures([text for _, text in chunk])):
+            self._add_signature(posting_id, signature)
+
+    def clusters(self) -> Dict[str, List[str]]:
+        """Duplicate ids by canonical id (canonicals without duplicates are omitted)."""
+        clusters: Dict[str, List[str]] = {}
+        for posting_id, canonical in self.duplicate_of.items():
+            clusters.setdefault(canonical, []).append(posting_id)
+        return clusters
+
+
+def deduplicate_postings(postings: Dict[str, str],
+                         threshold: Optional[float] = None) -> Dict:
+    """
+    Group near-duplicate job postings.
+
+    Args:
+        postings: Job description text by posting id
+        threshold: Jaccard similarity that counts as a duplicate
+            (defaults to Config.JOB_DEDUP_THRESHOLD)
+
+    Returns:
+        Dictionary with canonical ids, duplicate -> canonical mapping and clusters
+    """
+    with span("dedup.postings", kind="dedup", postings=len(postings)) as active:
+        deduplicator = JobDeduplicator(threshold)
+        deduplicator.add_many(postings.items())
+        active.set(unique=len(deduplicator.canonical_ids))
+
+    return {
+        "success": True,
+        "canonical_ids": deduplicator.canonical_ids,
+        "duplicate_of": deduplicator.duplicate_of,
+        "clusters": deduplicator.clusters(),
+        "unique_count": len(deduplicator.canonical_ids),
+        "duplicate_count": len(deduplicator.duplicate_of)
+    }
@@ -0,0 +1,132 @@
+"""LLM Cache - persistent TTL/LRU cache for Gemini responses"""
+from typing import Any, Optional
+from config import Config
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+CREATE INDEX IF NOT EXISTS responses_created ON responses (created);
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class LLMCache:
+    """
+    SQLite cache of parsed LLM results.
+
+    Entries expire ttl_seconds after they were written, and the least
+    recently used entries are evicted once there are more than
+    max_entries. The cache survives restarts and can be shared by several
+    processes.
+    """
+
+    def __init__(self,
+                 cache_path: Optional[str] = None,
+                 ttl_seconds: Optional[int] = None,
+                 max_entries: Optional[int] = None):
+        self.cache_path = cache_path or Config.LLM_CACHE_PATH
+        self.ttl_seconds = ttl_seconds or Config.LLM_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or Config.LLM_CACHE_MAX_ENTRIES
+
+        cache_dir = os.path.dirname(self.cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.cache_path, timeout=30,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    @staticmethod
+    def make_key(namespace: str, text: str, model: str, prompt_version: str) -> str:
+        """
+        Cache key for one prompt.
+
+        Args:
+            namespace: Prompt family, e.g. "analyze_job"
+            text: Prompt input (normalized before hashing)
+            model: Model name
+            prompt_version: Prompt template version
+
+        Returns:
+            Hex digest key
+        """
+        payload = "\x1f".join([namespace, model, prompt_version, normalize_text(text)])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serialisable value and evict past max_entries."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created, last_access) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now)
+                )
+                self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+                self._conn.execute(
+                    """DELETE FROM responses WHERE key IN (
+                           SELECT key FROM responses ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                       )""",
+                    (self.max_entries,)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+_default_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Process-wide LLMCache, or None when Config.LLM_CACHE_ENABLED is off."""
+    global _default_cache
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    if _default_cache is None:
+        _default_cache = LLMCache()
+    return _default_cache
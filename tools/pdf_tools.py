@@ -1,11 +1,104 @@
 """PDF Processing Tools - Pure ADK"""
 # from google.adk.tools import tool
-import PyPDF2
-import docx
-from typing import Dict
+# PyPDF2 and python-docx are imported inside the extractors so that
+# importing this module stays cheap for callers that only parse text
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from config import Config
 import re
 
 
+# Bump when extraction output changes so cached text is invalidated
+EXTRACTOR_VERSION = "2"
+
+
+def _budget(value: Optional[int], default: int) -> Optional[int]:
+    """Resolve a page/char budget: None means the Config default, 0 means no limit."""
+    if value is None:
+        value = default
+    return value if value > 0 else None
+
+
+def _iter_page_text(reader: "PyPDF2.PdfReader",
+                    max_pages: Optional[int] = None,
+                    max_chars: Optional[int] = None) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield (page text, cut short) lazily, stopping after max_pages pages or
+    once max_chars characters (counting a newline between pages) are used.
+    """
+    remaining = max_chars
+    for page_number, page in enumerate(reader.pages):
+        if max_pages is not None and page_number >= max_pages:
+            break
+        page_text = page.extract_text() or ""
+        if remaining is None:
+            yield page_text, False
+            continue
+
+        yield page_text[:remaining], len(page_text) > remaining
+        remaining -= len(page_text) + 1
+        if remaining <= 0:
+            break
+
+
+def iter_pdf_pages(file_path: str,
+                   max_pages: Optional[int] = None,
+                   max_chars: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of each PDF page as it is extracted.
+
+    Reading stops as soon as the page or character budget is used up;
+    the page that exhausts the character budget is cut to fit.
+
+    Args:
+        file_path: Path to PDF file
+        max_pages: Page budget (None for Config.PDF_MAX_PAGES, 0 for no limit)
+        max_chars: Character budget (None for Config.PDF_MAX_CHARS, 0 for no limit)
+
+    Yields:
+        Text of one page
+    """
+    import PyPDF2
+
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        pages = _iter_page_text(
+            reader,
+            _budget(max_pages, Config.PDF_MAX_PAGES),
+            _budget(max_chars, Config.PDF_MAX_CHARS)
+        )
+        for page_text, _ in pages:
+            yield page_text
+
+
+def _read_pdf(file_path: str,
+              max_pages: Optional[int],
+              max_chars: Optional[int]) -> Dict:
+    """Collect page text up to the page and character budgets (None or 0 for no limit)."""
+    import PyPDF2
+
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        parts = []
+        truncated = False
+
+        for page_text, cut in _iter_page_text(reader, max_pages or None, max_chars or None):
+            parts.append(page_text)
+            truncated = truncated or cut
+
+        page_count = len(reader.pages)
+        pages_read = len(parts)
+        truncated = truncated or pages_read < page_count
+
+    text = "\n".join(parts).strip()
+
+    return {
+        "text": text,
+        "page_count": page_count,
+        "pages_read": pages_read,
+        "truncated": truncated
+    }
+
+
 # @tool
 def parse_pdf_tool(file_path: str) -> Dict:
 
@@ -18,17 +111,13 @@ def parse_pdf_tool(file_path: str) -> Dict:
            Dictionary with extracted text and metadata
        """
     try:
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-
-            return {
-                "success": True,
-                "text": text.strip(),
-                "page_count": len(reader.pages)
-            }
+        pdf = _read_pdf(file_path, Config.PDF_MAX_PAGES, Config.PDF_MAX_CHARS)
+
+        return {
+            "success": True,
+            "text": pdf["text"],
+            "page_count": pdf["page_count"]
+        }
     except Exception as e:
         return {"success": False, "error": str(e), "text": ""}
 
@@ -45,6 +134,8 @@ def parse_docx_tool(file_path: str) -> Dict:
         Dictionary with extracted text
     """
     try:
+        import docx
+
         doc = docx.Document(file_path)
         text = "\n".join([para.text for para in doc.paragraphs])
 
@@ -68,65 +159,42 @@ def extract_sections_tool(text: str) -> Dict:
     Returns:
         Dictionary with extracted sections
     """
-    sections = {
-        "experience": "",
-        "education": "",
-        "skills": "",
-        "summary": ""
-    }
-
-    text_lower = text.lower()
-
-    # Experience
-    exp_keywords = ["experience", "work history", "employment"]
-    for kw in exp_keywords:
-        if kw in text_lower:
-            idx = text_lower.find(kw)
-            sections["experience"] = text[idx:idx + 1500]
-            break
-
-    # Education
-    edu_keywords = ["education", "academic", "degree"]
-    for kw in edu_keywords:
-        if kw in text_lower:
-            idx = text_lower.find(kw)
-            sections["education"] = text[idx:idx + 800]
-            break
-
-    # Skills
-    skill_keywords = ["skills", "technical skills", "competencies"]
-    for kw in skill_keywords:
-        if kw in text_lower:
-            idx = text_lower.find(kw)
-            sections["skills"] = text[idx:idx + 500]
-            break
-
-    return sections
+    sections = segment_resume(text)
+    return {name: sections[name] for name in ("experience", "education", "skills", "summary")}
 
 
-def extract_text_from_pdf(file_path: str) -> Dict:
+def extract_text_from_pdf(file_path: str,
+                          max_pages: Optional[int] = None,
+                          max_chars: Optional[int] = None) -> Dict:
     """
     Extract text from PDF file.
 
+    Pages are read lazily and extraction stops at the page or character
+    budget, so oversized documents do not tie up the worker.
+
     Args:
         file_path: Path to PDF file
+        max_pages: Page budget (None for Config.PDF_MAX_PAGES, 0 for no limit)
+        max_chars: Character budget (None for Config.PDF_MAX_CHARS, 0 for no limit)
 
     Returns:
         Dictionary with extracted text and metadata
     """
     try:
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-
-            return {
-                "success": True,
-                "text": text.strip(),
-                "page_count": len(reader.pages),
-                "word_count": len(text.split())
-            }
+        pdf = _read_pdf(
+            file_path,
+            _budget(max_pages, Config.PDF_MAX_PAGES),
+            _budget(max_chars, Config.PDF_MAX_CHARS)
+        )
+
+        return {
+            "success": True,
+            "text": pdf["text"],
+            "page_count": pdf["page_count"],
+            "pages_read": pdf["pages_read"],
+            "truncated": pdf["truncated"],
+            "word_count": len(pdf["text"].split())
+        }
     except Exception as e:
         return {
             "success": False,
@@ -146,6 +214,8 @@ def extract_text_from_docx(file_path: str) -> Dict:
         Dictionary with extracted text
     """
     try:
+        import docx
+
         doc = docx.Document(file_path)
         text = "\n".join([para.text for para in doc.paragraphs])
 
@@ -163,6 +233,131 @@ def extract_text_from_docx(file_path: str) -> Dict:
         }
 
 
+# Header phrases per section; longer phrases first so they win the alternation
+SECTION_HEADERS = {
+    "summary": ["professional summary", "career summary", "summary", "career objective",
+                "objective", "profile", "about me"],
+    "experience": ["professional experience", "work experience", "work history",
+                   "employment history", "experience", "employment"],
+    "education": ["academic background", "education", "academics", "qualifications"],
+    "skills": ["technical skills", "core competencies", "skills", "competencies", "expertise"],
+    "projects": ["personal projects", "projects"],
+    "certifications": ["certifications", "certificates", "licenses"],
+}
+
+# A header is a line that holds only a header phrase, or a phrase followed by
+# a colon and inline content ("Skills: Python, AWS")
+_HEADER_PATTERN = re.compile(
+    r"^[ \t]*(?:" + "|".join(
+        f"(?P<{name}>{'|'.join(re.escape(h) for h in headers)})"
+        for name, headers in SECTION_HEADERS.items()
+    ) + r")[ \t]*(?::|$)",
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _capitalized(phrase: str) -> str:
+    """Pattern for a phrase that starts with a capital letter ("Skills", "SKILLS", "Work experience")."""
+    return re.escape(phrase[0].upper()) + "(?i:" + re.escape(phrase[1:]) + ")"
+
+
+# Fallback for text whose line breaks were lost in extraction: a capitalized
+# header phrase anywhere, optionally followed by a colon ("... Skills: Python")
+_INLINE_HEADER_PATTERN = re.compile(
+    r"(?<![\w-])(?:" + "|".join(
+        f"(?P<{name}>{'|'.join(_capitalized(h) for h in headers)})"
+        for name, headers in SECTION_HEADERS.items()
+    ) + r")\b[ \t]*:?"
+)
+
+
+class ResumeSections:
+    """
+    Resume sections as (start, end) spans over the original text.
+
+    Section strings are only sliced out when first accessed. A section
+    runs from the end of its header to the start of the next section's
+    header, so sections never bleed into each other and, together with
+    their headers, cover the whole text. heading_starts holds where each
+    section's header begins (its content start when it has no header).
+    """
+
+    def __init__(self,
+                 text: str,
+                 spans: Dict[str, Tuple[int, int]],
+                 heading_starts: Optional[Dict[str, int]] = None):
+        self.text = text
+        self.spans = spans
+        self.heading_starts = heading_starts or {name: span[0] for name, span in spans.items()}
+        self._cache: Dict[str, str] = {}
+
+    def __getitem__(self, name: str) -> str:
+        if name not in self._cache:
+            span = self.spans.get(name)
+            self._cache[name] = self.text[span[0]:span[1]].strip() if span else ""
+        return self._cache[name]
+
+    def get(self, name: str, default: str = "") -> str:
+        return self[name] if name in self.spans else default
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.spans
+
+    def to_dict(self) -> Dict:
+        sections = {name: self[name] for name in ("experience", "education", "skills", "summary")}
+        sections.update({name: self[name] for name in self.spans if name not in sections})
+        sections["spans"] = {name: list(span) for name, span in self.spans.items()}
+        return sections
+
+
+def segment_resume(text: str) -> ResumeSections:
+    """
+    Split a resume into sections with one pass of the header pattern.
+
+    Headers are expected on their own line. When none are found (text
+    flattened by the extractor), capitalized header phrases are matched
+    inline instead. Text before the first header is the summary unless
+    the resume has a summary header of its own. A repeated header starts
+    its section only once, preferring an occurrence on a line of its own;
+    the others (a per-job "Skills:" line) stay in the section they appear
+    in, so no text is dropped.
+
+    Args:
+        text: Full resume text
+
+    Returns:
+        ResumeSections with a span per detected section
+    """
+    headers = [(match.lastgroup, match.start(), match.end()) for match in _HEADER_PATTERN.finditer(text)]
+    if not headers:
+        headers = [(match.lastgroup, match.start(), match.end()) for match in _INLINE_HEADER_PATTERN.finditer(text)]
+
+    # One occurrence of each header starts its section: the first that stands
+    # on its own line, else the first with inline content ("Skills: Python").
+    # The others stay in whichever section they appear in
+    kept: Dict[str, Tuple[str, int, int, bool]] = {}
+    for header in headers:
+        name, _, content_start = header
+        line_end = text.find("\n", content_start)
+        standalone = not text[content_start:line_end if line_end >= 0 else len(text)].strip()
+        if name not in kept or (standalone and not kept[name][3]):
+            kept[name] = header + (standalone,)
+    headers = sorted((header[:3] for header in kept.values()), key=lambda header: header[1])
+
+    spans: Dict[str, Tuple[int, int]] = {}
+    heading_starts: Dict[str, int] = {}
+    for i, (name, start, content_start) in enumerate(headers):
+        end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+        spans[name] = (content_start, end)
+        heading_starts[name] = start
+
+    if headers and "summary" not in spans and text[:headers[0][1]].strip():
+        spans["summary"] = (0, headers[0][1])
+        heading_starts["summary"] = 0
+
+    return ResumeSections(text, spans, heading_starts)
+
+
 def extract_resume_sections(text: str) -> Dict:
     """
     Extract common resume sections.
@@ -171,61 +366,140 @@ def extract_resume_sections(text: str) -> Dict:
         text: Full resume text
 
     Returns:
-        Dictionary with extracted sections
+        Dictionary with extracted sections and their (start, end) spans
     """
-    sections = {
-        "experience": "",
-        "education": "",
-        "skills": "",
-        "summary": ""
-    }
+    return segment_resume(text).to_dict()
 
-    text_lower = text.lower()
 
-    # Extract Experience
-    exp_keywords = ["experience", "work history", "employment", "professional experience"]
-    for keyword in exp_keywords:
-        if keyword in text_lower:
-            idx = text_lower.find(keyword)
-            sections["experience"] = text[idx:min(idx + 1500, len(text))]
-            break
+# One scanner for every contact field. Each alternative only starts at a
+# token boundary and uses bounded or non-overlapping repeats, so a scan is
+# linear in the text length even on long digit or word runs.
+_CONTACT_PATTERN = re.compile(
+    r"(?<![\w.+@/%-])(?:"
+    r"(?P<email>[A-Za-z0-9][A-Za-z0-9._%+-]*@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+)"
+    r"|(?P<phone>(?:\+\d{1,3}[ .-]?)?(?:\(\d{2,4}\)[ .-]?)?\d{2,15}(?:[ .-]\d{2,4}){0,4})(?![\w@]|\.[A-Za-z])"
+    r"|(?P<url>(?:https?://)?(?:www\.)?[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+(?:/[^\s<>()\[\]\"',;]*)?)"
+    r")"
+)
 
-    # Extract Education
-    edu_keywords = ["education", "academic", "qualification", "degree"]
-    for keyword in edu_keywords:
-        if keyword in text_lower:
-            idx = text_lower.find(keyword)
-            sections["education"] = text[idx:min(idx + 800, len(text))]
-            break
+_DIGITS = re.compile(r"\d+")
 
-    # Extract Skills
-    skill_keywords = ["skills", "technical skills", "competencies", "expertise"]
-    for keyword in skill_keywords:
-        if keyword in text_lower:
-            idx = text_lower.find(keyword)
-            sections["skills"] = text[idx:min(idx + 500, len(text))]
-            break
+# Hosts that count as a portfolio even without an explicit scheme
+PORTFOLIO_HOSTS = ("github.io", "gitlab.io", "netlify.app", "vercel.app", "about.me", "behance.net",
+                   "dribbble.com", "medium.com")
+
+
+def _is_year(group: str) -> bool:
+    return len(group) == 4 and group[:2] in ("19", "20")
 
-    return sections
+
+def _is_day_or_month(group: str) -> bool:
+    return len(group) <= 2 and 1 <= int(group) <= 31
+
+
+def _is_date_run(groups: List[str]) -> bool:
+    """
+    True when digit groups read as years and dates ("2019 2020",
+    "12.05.2019 15.06", "2019-05-12"). The last date may be cut short,
+    since the phone pattern stops after a few groups.
+    """
+    i = 0
+    while i < len(groups):
+        rest = groups[i:i + 3]
+        if _is_year(rest[0]):
+            # yyyy, yyyy-mm or yyyy-mm-dd
+            n = 1
+            while n < len(rest) and _is_day_or_month(rest[n]):
+                n += 1
+        elif len(rest) >= 2 and _is_day_or_month(rest[0]) and _is_day_or_month(rest[1]) \
+                and (len(rest) == 2 or _is_year(rest[2])):
+            # dd.mm.yyyy
+            n = len(rest)
+        else:
+            return False
+        i += n
+    return True
+
+
+def _normalize_phone(raw: str) -> Optional[str]:
+    """Digits-only phone (with leading + when given), or None for dates, years and ZIP codes."""
+    groups = _DIGITS.findall(raw)
+    digits = "".join(groups)
+    international = raw.startswith("+")
+
+    if not (8 if international else 10) <= len(digits) <= 15:
+        return None
+    # Runs of years and dates ("2019 2020", "12.05.2019 15.06.2020") are not phone numbers
+    if _is_date_run(groups):
+        return None
+    return ("+" if international else "") + digits
+
+
+def _classify_url(raw: str) -> Optional[Tuple[str, str, str]]:
+    """(field, dedup key, normalized url) for a profile or portfolio link."""
+    url = raw.rstrip(".")
+    lower = url.lower()
+    bare = lower.split("://", 1)[-1]
+    if bare.startswith("www."):
+        bare = bare[4:]
+    host = bare.split("/", 1)[0]
+
+    if host.endswith("linkedin.com"):
+        field = "linkedin"
+    elif host == "github.com":
+        field = "github"
+    elif "://" in lower or lower.startswith("www.") or host.endswith(PORTFOLIO_HOSTS):
+        field = "portfolio"
+    else:
+        return None  # "Node.js", "e.g." and other dotted words
+
+    if field != "portfolio" and "/" not in bare.rstrip("/"):
+        return None  # bare site without a profile path
+    return field, bare.rstrip("/"), url if "://" in lower else "https://" + url
 
 
 def extract_contact_info(text: str) -> Dict:
     """
-    Extract contact information from resume.
+    Extract contact information and profile links from resume.
 
     Args:
         text: Resume text
 
     Returns:
-        Dictionary with emails and phones
+        Dictionary with emails, phones, linkedin, github and portfolio
     """
-    email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-    phone_pattern = r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'
+    found = {"emails": {}, "phones": {}, "linkedin": {}, "github": {}, "portfolio": {}}
+
+    for match in _CONTACT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        raw = match.group(kind)
+
+        if kind == "email":
+            email = raw.rstrip(".")
+            if email.rsplit(".", 1)[-1].isalpha():
+                found["emails"].setdefault(email.lower(), email)
+        elif kind == "phone":
+            phone = _normalize_phone(raw)
+            if phone:
+                found["phones"].setdefault(phone, phone)
+        else:
+            link = _classify_url(raw)
+            if link:
+                field, key, url = link
+                found[field].setdefault(key, url)
+
+    # Dicts keep first-seen order and drop duplicates
+    return {field: list(values.values()) for field, values in found.items()}
+
+
+def extract_contact_info_batch(texts: Iterable[str]) -> List[Dict]:
+    """
+    Extract contact information from many resumes.
 
-    emails = list(set(re.findall(email_pattern, text)))
-    phones = list(set(re.findall(phone_pattern, text)))
+    Args:
+        texts: Resume texts
 
-    return {
-        "emails": emails,
-        "phones": phones
-    }
\ No newline at end of file
+    Returns:
+        One contact dictionary per text, in input order
+    """
+    return [extract_contact_info(text) for text in texts]
@@ -0,0 +1,123 @@
+"""Prompt Compaction - fit documents into a token budget by sentence relevance"""
+# scikit-learn is imported on first use, like in scoring_tools
+from typing import List
+from .skill_taxonomy import get_skill_taxonomy
+from .tracing import span
+import re
+
+
+# Rough Gemini tokenizer ratio for English prose
+CHARS_PER_TOKEN = 4
+
+# Sentence ends, line breaks and bullet markers all start a new unit
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])|\s*\n\s*")
+_BULLET = re.compile(r"^(?:[-*•·▪◦]+|\d+[.)])\s*")
+
+# Unpunctuated runs (common in extracted PDF text) are cut into units this long
+MAX_SENTENCE_CHARS = 400
+
+# Lines that state what the role needs
+_REQUIREMENT_CUES = re.compile(
+    r"\b(?:require[ds]?|requirements?|must|experience|proficien\w*|years?|"
+    r"qualifications?|responsib\w*|skills?|knowledge|familiar\w*|degree|"
+    r"built|led|developed|designed|managed|improved|delivered)\b",
+    re.IGNORECASE
+)
+
+# Boilerplate that rarely helps any prompt
+_BOILERPLATE = re.compile(
+    r"\b(?:equal opportunity|eeo|affirmative action|without regard to|regardless of|"
+    r"gender identity|sexual orientation|veteran status|national origin|"
+    r"benefits|401\(?k\)?|paid time off|pto|health insurance|dental|"
+    r"perks|snacks|wellness|parental leave|apply now|click apply|"
+    r"privacy (?:policy|notice)|reasonable accommodations?)\b",
+    re.IGNORECASE
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences and bullet lines of text, in order, without bullet markers."""
+    sentences = []
+    for part in _SENTENCE_SPLIT.split(text):
+        part = _BULLET.sub("", part.strip())
+        while len(part) > MAX_SENTENCE_CHARS:
+            cut = part.rfind(" ", 0, MAX_SENTENCE_CHARS)
+            cut = cut if cut > 0 else MAX_SENTENCE_CHARS
+            sentences.append(part[:cut])
+            part = part[cut:].strip()
+        if len(part) > 2:
+            sentences.append(part)
+    return sentences
+
+
+def _relevance(sentences: List[str], reference: str) -> List[float]:
+    """Cosine similarity of each sentence to the reference document."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    try:
+        vectors = TfidfVectorizer(stop_words='english').fit_transform(sentences + [reference])
+    except ValueError:
+        return [0.0] * len(sentences)  # only stop words
+    return (vectors[:-1] @ vectors[-1].T).toarray().ravel().tolist()
+
+
+def compact_text(text: str,
+                 budget_tokens: int,
+                 reference: str = "",
+                 name: str = "text") -> str:
+    """
+    Keep the most informative sentences of text within a token budget.
+
+    Sentences are scored by TF-IDF similarity to the reference document
+    (the other side of the comparison), known skills they mention and
+    requirement cues, and boilerplate such as benefits and EEO notices is
+    pushed to the bottom. The best sentences are then kept in their
+    original order until the budget is full. Text that already fits is
+    returned unchanged.
+
+    Args:
+        text: Document to compact
+        budget_tokens: Maximum approximate tokens to keep
+        reference: Document the text will be compared with, if any
+        name: Label for the tracing span
+
+    Returns:
+        Compacted text
+    """
+    if estimate_tokens(text) <= budget_tokens:
+        return text
+
+    with span(f"compact.{name}", kind="compaction", tokens_before=estimate_tokens(text)) as active:
+        sentences = split_sentences(text)
+        relevance = _relevance(sentences, reference) if reference.strip() else [0.0] * len(sentences)
+        taxonomy = get_skill_taxonomy()
+
+        scores = []
+        for sentence, similarity in zip(sentences, relevance):
+            score = similarity + 0.15 * min(len(taxonomy.find_ids(sentence)), 4)
+            if _REQUIREMENT_CUES.search(sentence):
+                score += 0.1
+            if _BOILERPLATE.search(sentence):
+                score -= 1.0
+            scores.append(score)
+
+        ranked = sorted(range(len(sentences)), key=lambda i: (-scores[i], i))
+        kept: List[int] = []
+        seen = set()
+        used = 0
+        for i in ranked:
+            cost = estimate_tokens(sentences[i]) + 1
+            if sentences[i] not in seen and used + cost <= budget_tokens:
+                kept.append(i)
+                seen.add(sentences[i])
+                used += cost
+
+        compacted = "\n".join(sentences[i] for i in sorted(kept))
+        active.set(tokens_after=estimate_tokens(compacted), sentences=len(sentences), kept=len(kept))
+        return compacted
+
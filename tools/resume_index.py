@@ -0,0 +1,303 @@
+"""Resume Index - on-disk BM25 inverted index over ingested resumes"""
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from config import Config
+from .pdf_tools import extract_text_from_pdf, extract_text_from_docx
+import heapq
+import math
+import os
+import re
+import sqlite3
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id INTEGER PRIMARY KEY,
+    resume_id TEXT NOT NULL UNIQUE,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL,
+    max_tf INTEGER NOT NULL,
+    min_len INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+INSERT OR IGNORE INTO meta (key, value) VALUES ('doc_count', 0), ('total_length', 0);
+"""
+
+
+@lru_cache(maxsize=1)
+def _stop_words() -> frozenset:
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+    return ENGLISH_STOP_WORDS
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with English stop words removed."""
+    stop_words = _stop_words()
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in stop_words]
+
+
+class ResumeIndex:
+    """
+    BM25 inverted index stored in SQLite.
+
+    Postings are kept per term in doc-id order together with the document
+    length, and every term records its maximum tf and minimum document
+    length so a per-term score upper bound is available. Search uses
+    MaxScore: low-impact terms are only probed for documents that can
+    still enter the top-k, and scanning stops once no unseen document can.
+    """
+
+    def __init__(self, index_path: Optional[str] = None, k1: float = 1.2, b: float = 0.75):
+        self.index_path = index_path or Config.RESUME_INDEX_PATH
+        self.k1 = k1
+        self.b = b
+
+        index_dir = os.path.dirname(self.index_path)
+        if index_dir:
+            os.makedirs(index_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.index_path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _stats(self) -> Tuple[int, float]:
+        rows = dict(self._conn.execute("SELECT key, value FROM meta"))
+        doc_count = rows["doc_count"]
+        avg_length = rows["total_length"] / doc_count if doc_count else 0.0
+        return doc_count, avg_length
+
+    def _insert(self, resume_id: str, text: str) -> bool:
+        """Insert one document inside the current transaction."""
+        if self._conn.execute("SELECT 1 FROM docs WHERE resume_id = ?", (resume_id,)).fetchone():
+            return False
+
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+
+        cursor = self._conn.execute(
+            "INSERT INTO docs (resume_id, length) VALUES (?, ?)", (resume_id, length)
+        )
+        doc_id = cursor.lastrowid
+
+        self._conn.executemany(
+            "INSERT INTO postings (term, doc_id, tf, length) VALUES (?, ?, ?, ?)",
+            [(term, doc_id, tf, length) for term, tf in counts.items()]
+        )
+        self._conn.executemany(
+            """INSERT INTO terms (term, df, max_tf, min_len) VALUES (?, 1, ?, ?)
+               ON CONFLICT(term) DO UPDATE SET
+                   df = df + 1,
+                   max_tf = MAX(max_tf, excluded.max_tf),
+                   min_len = MIN(min_len, excluded.min_len)""",
+            [(term, tf, length) for term, tf in counts.items()]
+        )
+        self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'doc_count'")
+        self._conn.execute("UPDATE meta SET value = value + ? WHERE key = 'total_length'", (length,))
+        return True
+
+    def add_resumes(self, resumes: Iterable[Tuple[str, str]]) -> Dict:
+        """
+        Append resumes to the index in one transaction.
+
+        Args:
+            resumes: (resume_id, text) pairs; ids already indexed are skipped
+
+        Returns:
+            Dictionary with added and skipped counts
+        """
+        added = skipped = 0
+        try:
+            with self._conn:
+                for resume_id, text in resumes:
+                    if self._insert(resume_id, text):
+                        added += 1
+                    else:
+                        skipped += 1
+
+            return {"success": True, "added": added, "skipped": skipped}
+        except Exception as e:
+            return {"success": False, "added": 0, "skipped": 0, "error": str(e)}
+
+    def add_resume(self, resume_id: str, text: str) -> Dict:
+        """
+        Append one resume to the index.
+
+        Args:
+            resume_id: Caller-chosen unique id
+            text: Resume text
+
+        Returns:
+            Dictionary with added and skipped counts
+        """
+        return self.add_resumes([(resume_id, text)])
+
+    def add_resume_file(self, file_path: str, resume_id: Optional[str] = None) -> Dict:
+        """
+        Extract a PDF/DOCX resume and append it to the index.
+
+        Args:
+            file_path: Path to resume file
+            resume_id: Unique id (defaults to the file path)
+
+        Returns:
+            Dictionary with added and skipped counts
+        """
+        file_extension = file_path.lower().split('.')[-1]
+
+        if file_extension == 'pdf':
+            result = extract_text_from_pdf(file_path)
+        elif file_extension in ['docx', 'doc']:
+            result = extract_text_from_docx(file_path)
+        else:
+            return {"success": False, "error": f"Unsupported file type: {file_extension}"}
+
+        if not result.get("success", False):
+            return {"success": False, "error": result.get("error", "Unknown error")}
+
+        return self.add_resume(resume_id or file_path, result["text"])
+
+    def _term_weight(self, tf: int, length: int, idf: float, avg_length: float) -> float:
+        norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+        return idf * tf * (self.k1 + 1) / (tf + norm)
+
+    def search(self, job_description: str, top_k: int = 10) -> Dict:
+        """
+        Return the top-k resumes for a job description by BM25.
+
+        Args:
+            job_description: Job description text
+            top_k: Number of results to return (an empty result when not positive)
+
+        Returns:
+            Dictionary with ranked resume ids and scores
+        """
+        if top_k <= 0:
+            return {"success": True, "results": [], "count": 0, "scored_documents": 0}
+
+        try:
+            doc_count, avg_length = self._stats()
+            query_terms = sorted(set(tokenize(job_description)))
+            if not doc_count or not query_terms:
+                return {"success": True, "results": [], "count": 0, "scored_documents": 0}
+
+            placeholders = ",".join("?" * len(query_terms))
+            term_rows = self._conn.execute(
+                f"SELECT term, df, max_tf, min_len FROM terms WHERE term IN ({placeholders})",
+                query_terms
+            ).fetchall()
+
+            # Per-term idf and score upper bound, cheapest terms first
+            terms = []
+            for term, df, max_tf, min_len in term_rows:
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                terms.append((self._term_weight(max_tf, min_len, idf, avg_length), idf, term))
+            terms.sort()
+
+            bounds = [bound for bound, _, _ in terms]
+            prefix = [0.0]
+            for bound in bounds:
+                prefix.append(prefix[-1] + bound)
+
+            # One doc-id ordered cursor per term
+            cursors = [
+                self._conn.execute(
+                    "SELECT doc_id, tf, length FROM postings WHERE term = ? ORDER BY doc_id",
+                    (term,)
+                )
+                for _, _, term in terms
+            ]
+            heads = [cursor.fetchone() for cursor in cursors]
+
+            heap: List[Tuple[float, int]] = []
+            threshold = 0.0
+            # Terms before `first_essential` cannot lift an unseen document into the top-k
+            first_essential = 0
+            scored = 0
+
+            while True:
+                live = [i for i in range(first_essential, len(terms)) if heads[i] is not None]
+                if not live:
+                    break
+                doc_id = min(heads[i][0] for i in live)
+
+                score = 0.0
+                for i in live:
+                    head = heads[i]
+                    if head[0] == doc_id:
+                        score += self._term_weight(head[1], head[2], terms[i][1], avg_length)
+                        heads[i] = cursors[i].fetchone()
+
+                # Probe non-essential terms only while the document can still qualify
+                for i in range(first_essential - 1, -1, -1):
+                    if len(heap) >= top_k and score + prefix[i + 1] <= threshold:
+                        break
+                    row = self._conn.execute(
+                        "SELECT tf, length FROM postings WHERE term = ? AND doc_id = ?",
+                        (terms[i][2], doc_id)
+                    ).fetchone()
+                    if row:
+                        score += self._term_weight(row[0], row[1], terms[i][1], avg_length)
+                scored += 1
+
+                if len(heap) < top_k:
+                    heapq.heappush(heap, (score, -doc_id))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, -doc_id))
+                else:
+                    continue
+
+                if len(heap) >= top_k:
+                    threshold = heap[0][0]
+                    while first_essential < len(terms) and prefix[first_essential + 1] <= threshold:
+                        first_essential += 1
+
+            ranked = sorted(heap, reverse=True)
+            doc_ids = [-neg_id for _, neg_id in ranked]
+            id_rows = dict(self._conn.execute(
+                f"SELECT doc_id, resume_id FROM docs WHERE doc_id IN ({','.join('?' * len(doc_ids))})",
+                doc_ids
+            )) if doc_ids else {}
+
+            results = [
+                {"resume_id": id_rows[-neg_id], "score": round(score, 4)}
+                for score, neg_id in ranked
+            ]
+
+            return {
+                "success": True,
+                "results": results,
+                "count": len(results),
+                "scored_documents": scored,
+                "pool_size": doc_count
+            }
+        except Exception as e:
+            return {"success": False, "results": [], "error": str(e)}
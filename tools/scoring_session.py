@@ -0,0 +1,345 @@
+"""Scoring Session - incremental resume re-scoring as sections are edited"""
+# scikit-learn is imported on first use, like in scoring_tools
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+from config import Config
+from .pdf_tools import segment_resume
+from .scoring_tools import load_tfidf_model
+from .skill_taxonomy import SkillKey, get_skill_taxonomy
+from .tracing import span
+import math
+
+
+# Feature cap of the pairwise vectorizer in scoring_tools
+PAIRWISE_MAX_FEATURES = 1000
+
+
+class _Section:
+    """Cached analysis of one resume section."""
+
+    __slots__ = ("text", "first", "last", "terms", "skill_ids", "covered")
+
+    def __init__(self, text: str, tokens: List[str], skill_ids: List[int], covered: Set[SkillKey]):
+        self.text = text
+        self.first = tokens[0] if tokens else None
+        self.last = tokens[-1] if tokens else None
+        # Unigrams and the bigrams inside the section
+        self.terms = Counter(tokens)
+        self.terms.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        self.skill_ids = skill_ids
+        self.covered = covered
+
+
+class ScoringSession:
+    """
+    Resume-vs-job score that is updated section by section.
+
+    Each section keeps its term counts and skill sets, so replacing one
+    section only tokenizes and skill-scans that section. The resume's term
+    counts and covered skills are updated by the difference, and so are
+    the TF-IDF dot product and norms, term by term. The result equals
+    analyze_skill_gap on the sections joined by newlines. In pairwise
+    TF-IDF mode with more terms than the vectorizer's feature cap, an edit
+    that changes which terms are kept recomputes the similarity from the
+    cached counts (still without re-tokenizing), and terms tied at the cap
+    may be chosen differently from scikit-learn.
+    """
+
+    def __init__(self,
+                 sections: Dict[str, str],
+                 job_description: str,
+                 job_skills: Optional[List[str]] = None,
+                 headings: Optional[Dict[str, str]] = None):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self._taxonomy = get_skill_taxonomy()
+        # Heading lines are scored with their section but never replaced
+        self._headings = dict(headings or {})
+
+        # Same tokens, stop words and bigrams as the scoring vectorizers
+        fitted = load_tfidf_model() if Config.TFIDF_MODE == "fitted" else None
+        vectorizer = fitted or TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
+        self._preprocess = vectorizer.build_preprocessor()
+        self._tokenize = vectorizer.build_tokenizer()
+        self._stop_words = vectorizer.get_stop_words() or frozenset()
+        self._idf: Optional[Dict[str, float]] = None
+        self._sublinear = False
+        if fitted is not None:
+            self._idf = {term: float(fitted.idf_[i]) for term, i in fitted.vocabulary_.items()}
+            self._sublinear = fitted.sublinear_tf
+
+        self._job_terms = _Section(job_description, self._tokens(job_description), [], set()).terms
+        if job_skills is None:
+            job_skills = self._taxonomy.find(job_description)
+        self._job_keys = self._taxonomy.skill_keys(job_skills)
+
+        self._sections: Dict[str, _Section] = {}
+        self._resume_terms: Counter = Counter()
+        self._boundaries: Counter = Counter()
+        self._skill_counts: Counter = Counter()
+        self._covered_counts: Counter = Counter()
+        self._matched = 0
+
+        for name, text in sections.items():
+            self._resume_terms.update(self._replace(name, self._analyze(name, text)))
+        self._boundaries = self._boundary_terms()
+        self._resume_terms.update(self._boundaries)
+        self._recompute_tfidf()
+
+    @classmethod
+    def from_resume_text(cls,
+                         resume_text: str,
+                         job_description: str,
+                         job_skills: Optional[List[str]] = None) -> "ScoringSession":
+        """
+        Session over a whole resume, split at its section headings.
+
+        Sections are named as in segment_resume ("experience", ...); text
+        before the first heading is the summary, or "header" when the
+        resume has a summary heading. Headings stay with the session, so
+        update_section replaces only the content.
+
+        Args:
+            resume_text: Full resume text
+            job_description: Raw job description
+            job_skills: Required skills (extracted from the description if omitted)
+
+        Returns:
+            ScoringSession
+        """
+        segmented = segment_resume(resume_text)
+        starts = sorted(
+            (segmented.heading_starts[name], content_start, name)
+            for name, (content_start, _) in segmented.spans.items()
+        )
+
+        sections: Dict[str, str] = {}
+        if not starts or starts[0][0] > 0:
+            sections["header"] = resume_text[:starts[0][0] if starts else len(resume_text)]
+
+        headings: Dict[str, str] = {}
+        for i, (heading_start, content_start, name) in enumerate(starts):
+            # A section runs to the next kept heading, so repeated headings stay with it
+            end = starts[i + 1][0] if i + 1 < len(starts) else len(resume_text)
+            headings[name] = resume_text[heading_start:content_start]
+            sections[name] = resume_text[content_start:end]
+
+        return cls(sections, job_description, job_skills, headings)
+
+    @property
+    def sections(self) -> Dict[str, str]:
+        """Current section contents, in order."""
+        return {name: section.text for name, section in self._sections.items()}
+
+    @property
+    def resume_text(self) -> str:
+        """The resume being scored: headings and sections joined by newlines."""
+        return "\n".join(self._scored_text(name, section.text) for name, section in self._sections.items())
+
+    def _scored_text(self, name: str, text: str) -> str:
+        heading = self._headings.get(name)
+        return f"{heading}\n{text}" if heading else text
+
+    def _tokens(self, text: str) -> List[str]:
+        return [t for t in self._tokenize(self._preprocess(text)) if t not in self._stop_words]
+
+    def _analyze(self, name: str, text: str) -> _Section:
+        scored = self._scored_text(name, text)
+        skill_ids = self._taxonomy.find_ids(scored)
+        return _Section(text, self._tokens(scored), skill_ids, self._taxonomy.expand(skill_ids))
+
+    def _replace(self, name: str, section: Optional[_Section]) -> Counter:
+        """Swap a section's cached analysis, returning the term count changes."""
+        old = self._sections.pop(name, None) if section is None else self._sections.get(name)
+        delta: Counter = Counter()
+
+        if old is not None:
+            delta.subtract(old.terms)
+            self._skill_counts.subtract(old.skill_ids)
+            for key in old.covered:
+                self._covered_counts[key] -= 1
+                if not self._covered_counts[key]:
+                    del self._covered_counts[key]
+                    self._matched -= key in self._job_keys
+        if section is not None:
+            self._sections[name] = section
+            delta.update(section.terms)
+            self._skill_counts.update(section.skill_ids)
+            for key in section.covered:
+                if not self._covered_counts[key]:
+                    self._matched += key in self._job_keys
+                self._covered_counts[key] += 1
+
+        self._skill_counts = +self._skill_counts
+        return delta
+
+    def _boundary_terms(self) -> Counter:
+        """Bigrams that span two consecutive non-empty sections."""
+        ends = [(s.first, s.last) for s in self._sections.values() if s.first is not None]
+        return Counter(f"{a[1]} {b[0]}" for a, b in zip(ends, ends[1:]))
+
+    def _refresh_boundaries(self) -> Counter:
+        boundaries = self._boundary_terms()
+        delta = Counter(boundaries)
+        delta.subtract(self._boundaries)
+        self._boundaries = boundaries
+        return delta
+
+    def _weights(self, term: str, resume_count: int, job_count: int) -> Tuple[float, float]:
+        """TF-IDF weight of a term in the resume and in the job."""
+        if self._idf is not None:
+            idf = self._idf.get(term)
+            if idf is None:
+                return 0.0, 0.0
+            if self._sublinear:
+                resume_count = 1 + math.log(resume_count) if resume_count else 0
+                job_count = 1 + math.log(job_count) if job_count else 0
+            return resume_count * idf, job_count * idf
+
+        # Smoothed idf over the two documents, as in a pairwise fit
+        idf = math.log(3 / (1 + (resume_count > 0) + (job_count > 0))) + 1
+        return resume_count * idf, job_count * idf
+
+    def _capped(self) -> bool:
+        return self._idf is None and self._vocabulary > PAIRWISE_MAX_FEATURES
+
+    def _recompute_tfidf(self) -> None:
+        """Dot product and squared norms from the cached counts."""
+        terms = set(self._resume_terms) | set(self._job_terms)
+        self._vocabulary = len(terms)
+        # Features kept under the cap, and the total count of the last one kept
+        self._selected: Optional[Set[str]] = None
+        self._cutoff = 0
+        if self._capped():
+            # The pairwise vectorizer keeps the most frequent terms overall
+            terms = sorted(terms, key=lambda t: (-self._total(t), t))[:PAIRWISE_MAX_FEATURES]
+            self._selected = set(terms)
+            self._cutoff = self._total(terms[-1])
+
+        self._dot = self._resume_sq = self._job_sq = 0.0
+        for term in terms:
+            resume_weight, job_weight = self._weights(
+                term, self._resume_terms.get(term, 0), self._job_terms.get(term, 0)
+            )
+            self._dot += resume_weight * job_weight
+            self._resume_sq += resume_weight * resume_weight
+            self._job_sq += job_weight * job_weight
+
+    def _total(self, term: str) -> int:
+        return self._resume_terms.get(term, 0) + self._job_terms.get(term, 0)
+
+    def _apply_term_delta(self, delta: Counter) -> None:
+        """Update counts, and the dot product and norms term by term."""
+        was_capped = self._capped()
+        # Under the cap, the kept features only stay the same while no term
+        # crosses or touches the cutoff count
+        reselect = False
+        for term, change in delta.items():
+            if not change:
+                continue
+            job_count = self._job_terms.get(term, 0)
+            old_count = self._resume_terms.get(term, 0)
+            new_count = old_count + change
+            if new_count:
+                self._resume_terms[term] = new_count
+            else:
+                del self._resume_terms[term]
+            if not job_count:
+                self._vocabulary += (new_count > 0) - (old_count > 0)
+
+            if self._selected is not None:
+                old_total, new_total = old_count + job_count, new_count + job_count
+                if not (min(old_total, new_total) > self._cutoff or max(old_total, new_total) < self._cutoff):
+                    reselect = True
+                if term not in self._selected:
+                    continue
+
+            old_resume, old_job = self._weights(term, old_count, job_count)
+            new_resume, new_job = self._weights(term, new_count, job_count)
+            self._dot += new_resume * new_job - old_resume * old_job
+            self._resume_sq += new_resume * new_resume - old_resume * old_resume
+            self._job_sq += new_job * new_job - old_job * old_job
+
+        if reselect or was_capped != self._capped():
+            self._recompute_tfidf()
+
+    def update_section(self, name: str, text: str) -> Dict:
+        """
+        Replace (or add) one section and re-score.
+
+        Args:
+            name: Section name
+            text: New section content
+
+        Returns:
+            Gap analysis like analyze_skill_gap, plus the change in final score
+        """
+        with span("rescore.section", kind="scoring", section=name, input_size=len(text)):
+            before = self._final_score()
+            delta = self._replace(name, self._analyze(name, text))
+            delta.update(self._refresh_boundaries())
+            self._apply_term_delta(delta)
+
+            result = self.score()
+            result["scores"]["delta"] = round(result["scores"]["final_score"] - before, 2)
+            return result
+
+    def remove_section(self, name: str) -> Dict:
+        """
+        Drop a section and re-score.
+
+        Args:
+            name: Section name
+
+        Returns:
+            Gap analysis like analyze_skill_gap, plus the change in final score
+        """
+        with span("rescore.section", kind="scoring", section=name, input_size=0):
+            before = self._final_score()
+            delta = self._replace(name, None) if name in self._sections else Counter()
+            delta.update(self._refresh_boundaries())
+            self._apply_term_delta(delta)
+
+            result = self.score()
+            result["scores"]["delta"] = round(result["scores"]["final_score"] - before, 2)
+            return result
+
+    def _tfidf_score(self) -> float:
+        if self._resume_sq <= 0 or self._job_sq <= 0:
+            return 0.0
+        return round(max(self._dot, 0.0) / math.sqrt(self._resume_sq * self._job_sq) * 100, 2)
+
+    def _keyword_score(self) -> float:
+        return round(self._matched / len(self._job_keys) * 100, 2) if self._job_keys else 0.0
+
+    def _final_score(self) -> float:
+        return round(Config.TFIDF_WEIGHT * self._tfidf_score() + Config.KEYWORD_WEIGHT * self._keyword_score(), 2)
+
+    def score(self) -> Dict:
+        """
+        Current gap analysis, in the format of analyze_skill_gap.
+
+        Returns:
+            Dictionary with scores and skills_analysis
+        """
+        job_keys = self._job_keys.keys()
+        matched_skills = [
+            self._taxonomy.name(skill_id) for skill_id in sorted(self._skill_counts)
+            if not job_keys.isdisjoint(self._taxonomy.expand([skill_id]))
+        ]
+        missing_skills = [s for key, s in self._job_keys.items() if key not in self._covered_counts]
+
+        return {
+            "scores": {
+                "final_score": self._final_score(),
+                "tfidf_score": self._tfidf_score(),
+                "keyword_score": self._keyword_score()
+            },
+            "skills_analysis": {
+                "matched_skills": matched_skills,
+                "missing_skills": missing_skills,
+                "match_count": len(matched_skills),
+                "total_required": len(self._job_keys)
+            },
+            "status": "gap_analysis_complete"
+        }
@@ -1,8 +1,19 @@
 """Scoring Tools - Pure ADK"""
 # from google.adk.tools import tool
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import Dict, List
+# scikit-learn, SciPy, NumPy and joblib are imported on first use so that
+# importing the tools package does not pay for them
+from typing import TYPE_CHECKING, Dict, List, Optional
+from config import Config
+from .skill_taxonomy import SkillTaxonomy, SkillKey, get_skill_taxonomy
+import os
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+# Corpus-fitted vectorizers, keyed by model path, loaded once per process
+_FITTED_MODELS: Dict[str, "TfidfVectorizer"] = {}
 
 
 # @tool
@@ -17,6 +28,9 @@ def calculate_tfidf_tool(resume_text: str, job_desc: str) -> float:
     Returns:
         Similarity score (0-100)
     """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
     try:
         vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
         vectors = vectorizer.fit_transform([resume_text, job_desc])
@@ -42,16 +56,17 @@ def calculate_keyword_match_tool(resume_skills: list,
     if not job_skills:
         return {"score": 0.0, "matched": 0, "total": 0}
 
-    resume_set = {s.lower() for s in resume_skills}
-    job_set = {s.lower() for s in job_skills}
+    taxonomy = get_skill_taxonomy()
+    job_keys = taxonomy.skill_keys(job_skills)
+    covered = taxonomy.expand(taxonomy.skill_keys(resume_skills))
 
-    matches = resume_set & job_set
-    score = (len(matches) / len(job_set)) * 100
+    matches = [key for key in job_keys if key in covered]
+    score = (len(matches) / len(job_keys)) * 100
 
     return {
         "score": round(score, 2),
         "matched": len(matches),
-        "total": len(job_set)
+        "total": len(job_keys)
     }
 
 # @tool
@@ -88,6 +103,17 @@ def calculate_tfidf_similarity(resume_text: str, job_desc: str) -> Dict:
     Returns:
         Dictionary with TF-IDF score
     """
+    if Config.TFIDF_MODE == "fitted":
+        return calculate_tfidf_similarity_fitted(resume_text, job_desc)
+
+    return _pairwise_tfidf_similarity(resume_text, job_desc)
+
+
+def _pairwise_tfidf_similarity(resume_text: str, job_desc: str) -> Dict:
+    """Fit a throwaway vectorizer on just the two documents."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
     try:
         vectorizer = TfidfVectorizer(
             stop_words='english',
@@ -111,6 +137,118 @@ def calculate_tfidf_similarity(resume_text: str, job_desc: str) -> Dict:
         }
 
 
+def fit_tfidf_model(corpus: List[str],
+                    model_path: Optional[str] = None) -> Dict:
+    """
+    Fit a TF-IDF vectorizer on a reference corpus and save it to disk.
+
+    Args:
+        corpus: Reference job postings and resumes
+        model_path: Where to save the vectorizer (defaults to Config.TFIDF_MODEL_PATH)
+
+    Returns:
+        Dictionary with model statistics
+    """
+    import joblib
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    model_path = model_path or Config.TFIDF_MODEL_PATH
+
+    try:
+        vectorizer = TfidfVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),
+            min_df=2 if len(corpus) >= 50 else 1,
+            max_features=50000,
+            sublinear_tf=True
+        )
+        vectorizer.fit(corpus)
+
+        model_dir = os.path.dirname(model_path)
+        if model_dir:
+            os.makedirs(model_dir, exist_ok=True)
+        joblib.dump(vectorizer, model_path)
+        _FITTED_MODELS[model_path] = vectorizer
+
+        return {
+            "success": True,
+            "model_path": model_path,
+            "document_count": len(corpus),
+            "vocabulary_size": len(vectorizer.vocabulary_)
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "model_path": model_path,
+            "error": str(e)
+        }
+
+
+def load_tfidf_model(model_path: Optional[str] = None) -> Optional["TfidfVectorizer"]:
+    """
+    Load the corpus-fitted vectorizer, caching it for the process.
+
+    Call this once when a worker starts so requests only pay for `transform`.
+
+    Args:
+        model_path: Saved vectorizer path (defaults to Config.TFIDF_MODEL_PATH)
+
+    Returns:
+        Fitted vectorizer, or None if no model has been saved
+    """
+    model_path = model_path or Config.TFIDF_MODEL_PATH
+
+    vectorizer = _FITTED_MODELS.get(model_path)
+    if vectorizer is None and os.path.exists(model_path):
+        import joblib
+
+        vectorizer = joblib.load(model_path)
+        _FITTED_MODELS[model_path] = vectorizer
+
+    return vectorizer
+
+
+def calculate_tfidf_similarity_fitted(resume_text: str,
+                                      job_desc: str,
+                                      model_path: Optional[str] = None) -> Dict:
+    """
+    Calculate TF-IDF cosine similarity with the corpus-fitted vectorizer.
+
+    Falls back to the pairwise fit when no model has been saved yet.
+
+    Args:
+        resume_text: Resume text
+        job_desc: Job description text
+        model_path: Saved vectorizer path (defaults to Config.TFIDF_MODEL_PATH)
+
+    Returns:
+        Dictionary with TF-IDF score
+    """
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    try:
+        vectorizer = load_tfidf_model(model_path)
+        if vectorizer is None:
+            result = _pairwise_tfidf_similarity(resume_text, job_desc)
+            result["warning"] = "No fitted TF-IDF model found, used pairwise fit"
+            return result
+
+        vectors = vectorizer.transform([resume_text, job_desc])
+        similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
+
+        return {
+            "success": True,
+            "tfidf_score": round(similarity * 100, 2),
+            "method": "TF-IDF (corpus-fitted)"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "tfidf_score": 0.0,
+            "error": str(e)
+        }
+
+
 def calculate_keyword_match(resume_skills: List[str],
                             job_skills: List[str]) -> Dict:
     """
@@ -131,18 +269,20 @@ def calculate_keyword_match(resume_skills: List[str],
             "total_required": 0
         }
 
-    resume_set = {s.lower() for s in resume_skills}
-    job_set = {s.lower() for s in job_skills}
+    # Canonical skills: aliases match, and resume skills cover their parents
+    taxonomy = get_skill_taxonomy()
+    job_keys = taxonomy.skill_keys(job_skills)
+    covered = taxonomy.expand(taxonomy.skill_keys(resume_skills))
 
-    matches = resume_set & job_set
-    match_percentage = (len(matches) / len(job_set)) * 100
+    matched_skills = [s for key, s in job_keys.items() if key in covered]
+    match_percentage = (len(matched_skills) / len(job_keys)) * 100
 
     return {
         "success": True,
         "keyword_score": round(match_percentage, 2),
-        "matched_count": len(matches),
-        "total_required": len(job_set),
-        "matched_skills": [s for s in job_skills if s.lower() in matches]
+        "matched_count": len(matched_skills),
+        "total_required": len(job_keys),
+        "matched_skills": matched_skills
     }
 
 
@@ -173,3 +313,155 @@ def calculate_final_score(tfidf_score: float,
             "keyword": keyword_weight
         }
     }
+
+
+def _skill_matrix(skill_lists: List[List[str]],
+                  vocabulary: Dict[SkillKey, int],
+                  taxonomy: SkillTaxonomy,
+                  expand: bool = False) -> "csr_matrix":
+    """
+    Encode skill lists as a sparse 0/1 matrix over shared canonical keys.
+
+    With expand, each row also holds the parents of its skills (used for
+    resumes, so a specific skill covers a broader requirement).
+    """
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    indptr = [0]
+    indices: List[int] = []
+    for skills in skill_lists:
+        keys = taxonomy.skill_keys(skills)
+        if expand:
+            keys = taxonomy.expand(keys)
+        row = {vocabulary.setdefault(key, len(vocabulary)) for key in keys}
+        indices.extend(sorted(row))
+        indptr.append(len(indices))
+
+    data = np.ones(len(indices), dtype=np.float32)
+    return csr_matrix((data, indices, indptr), shape=(len(skill_lists), len(vocabulary)))
+
+
+def _rank_one_to_many(query_text: str,
+                      candidate_texts: List[str],
+                      query_is_job: bool,
+                      query_skills: Optional[List[str]],
+                      candidate_skills: Optional[List[List[str]]],
+                      top_k: int) -> Dict:
+    """Score one document against N candidates with sparse matrix products."""
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    if not candidate_texts or top_k <= 0:
+        return {"success": True, "results": [], "count": 0, "pool_size": len(candidate_texts)}
+
+    try:
+        # TF-IDF: rows are L2-normalised, so one sparse product gives every cosine
+        vectorizer = load_tfidf_model() if Config.TFIDF_MODE == "fitted" else None
+        if vectorizer is not None:
+            vectors = vectorizer.transform([query_text] + candidate_texts)
+        else:
+            vectorizer = TfidfVectorizer(
+                stop_words='english',
+                ngram_range=(1, 2),
+                max_features=50000
+            )
+            vectors = vectorizer.fit_transform([query_text] + candidate_texts)
+        tfidf_scores = (vectors[1:] @ vectors[0].T).toarray().ravel() * 100
+
+        # Keyword match: overlap counts from one sparse product
+        taxonomy = get_skill_taxonomy()
+        if query_skills is None:
+            query_skills = taxonomy.find(query_text)
+        if candidate_skills is None:
+            candidate_skills = [taxonomy.find(text) for text in candidate_texts]
+
+        vocabulary: Dict[SkillKey, int] = {}
+        query_matrix = _skill_matrix([query_skills], vocabulary, taxonomy, expand=not query_is_job)
+        candidate_matrix = _skill_matrix(candidate_skills, vocabulary, taxonomy, expand=query_is_job)
+        query_matrix.resize((1, len(vocabulary)))
+        candidate_matrix.resize((len(candidate_texts), len(vocabulary)))
+
+        matched = (candidate_matrix @ query_matrix.T).toarray().ravel()
+        if query_is_job:
+            required = np.full(len(candidate_texts), query_matrix.nnz, dtype=np.float64)
+        else:
+            required = np.asarray(candidate_matrix.sum(axis=1), dtype=np.float64).ravel()
+        keyword_scores = np.divide(matched * 100, required,
+                                   out=np.zeros_like(required), where=required > 0)
+
+        final_scores = (Config.TFIDF_WEIGHT * tfidf_scores) + (Config.KEYWORD_WEIGHT * keyword_scores)
+
+        # Top-k without sorting the whole pool
+        k = min(top_k, len(candidate_texts))
+        top = np.argpartition(-final_scores, k - 1)[:k]
+        top = top[np.argsort(-final_scores[top], kind='stable')]
+
+        results = [
+            {
+                "index": int(i),
+                "final_score": round(float(final_scores[i]), 2),
+                "tfidf_score": round(float(tfidf_scores[i]), 2),
+                "keyword_score": round(float(keyword_scores[i]), 2),
+                "matched_count": int(matched[i]),
+                "total_required": int(required[i])
+            }
+            for i in top
+        ]
+
+        return {
+            "success": True,
+            "results": results,
+            "count": len(results),
+            "pool_size": len(candidate_texts)
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "results": [],
+            "error": str(e)
+        }
+
+
+def rank_resumes_for_job(job_desc: str,
+                         resume_texts: List[str],
+                         job_skills: Optional[List[str]] = None,
+                         resume_skills: Optional[List[List[str]]] = None,
+                         top_k: int = 10) -> Dict:
+    """
+    Rank N resumes against one job description.
+
+    Args:
+        job_desc: Job description text
+        resume_texts: Candidate resume texts
+        job_skills: Required skills (extracted from job_desc if omitted)
+        resume_skills: Skills per resume (extracted from each resume if omitted)
+        top_k: Number of results to return (none when top_k <= 0)
+
+    Returns:
+        Dictionary with the top-k resumes by final score
+    """
+    return _rank_one_to_many(job_desc, resume_texts, True,
+                             job_skills, resume_skills, top_k)
+
+
+def rank_jobs_for_resume(resume_text: str,
+                         job_descs: List[str],
+                         resume_skills: Optional[List[str]] = None,
+                         job_skills: Optional[List[List[str]]] = None,
+                         top_k: int = 10) -> Dict:
+    """
+    Rank N job descriptions against one resume.
+
+    Args:
+        resume_text: Resume text
+        job_descs: Job description texts
+        resume_skills: Resume skills (extracted from resume_text if omitted)
+        job_skills: Required skills per job (extracted from each job if omitted)
+        top_k: Number of results to return (none when top_k <= 0)
+
+    Returns:
+        Dictionary with the top-k jobs by final score
+    """
+    return _rank_one_to_many(resume_text, job_descs, False,
+                             resume_skills, job_skills, top_k)
@@ -0,0 +1,318 @@
+"""Session Store - SQLite-backed ADK session service with bounded history"""
+from typing import Any, Dict, Optional
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.errors.session_not_found_error import SessionNotFoundError
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session, State
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from config import Config
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    update_time REAL NOT NULL,
+    PRIMARY KEY (app_name, user_id, session_id)
+);
+CREATE INDEX IF NOT EXISTS sessions_update_time ON sessions (update_time);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    event TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_session ON events (app_name, user_id, session_id, seq);
+CREATE TABLE IF NOT EXISTS app_states (
+    app_name TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_states (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id)
+);
+"""
+
+
+def _split_state(delta: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Split a state delta into app, user and session scopes (temp keys are dropped)."""
+    scopes: Dict[str, Dict[str, Any]] = {"app": {}, "user": {}, "session": {}}
+    for key, value in delta.items():
+        if key.startswith(State.APP_PREFIX):
+            scopes["app"][key[len(State.APP_PREFIX):]] = value
+        elif key.startswith(State.USER_PREFIX):
+            scopes["user"][key[len(State.USER_PREFIX):]] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            scopes["session"][key] = value
+    return scopes
+
+
+class SqliteSessionService(BaseSessionService):
+    """
+    ADK session service stored in SQLite.
+
+    Nothing is kept in process memory between calls, every run gets its
+    own session id, and each session keeps at most max_events events (the
+    oldest are dropped). Sessions idle for longer than idle_ttl_seconds are
+    deleted with their events, so a long-running process stays bounded in
+    both memory and disk.
+    """
+
+    def __init__(self,
+                 db_path: Optional[str] = None,
+                 max_events: Optional[int] = None,
+                 idle_ttl_seconds: Optional[int] = None,
+                 evict_interval_seconds: Optional[int] = None):
+        self.db_path = db_path or Config.SESSION_DB_PATH
+        self.max_events = max_events or Config.SESSION_MAX_EVENTS
+        self.idle_ttl_seconds = idle_ttl_seconds or Config.SESSION_IDLE_TTL_SECONDS
+        self.evict_interval_seconds = evict_interval_seconds or Config.SESSION_EVICT_INTERVAL_SECONDS
+        self._last_eviction = 0.0
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def _load_state(self, table: str, where: str, params: tuple) -> Dict[str, Any]:
+        row = self._conn.execute(f"SELECT state FROM {table} WHERE {where}", params).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def _save_scoped_state(self, app_name: str, user_id: str, scopes: Dict[str, Dict[str, Any]]) -> None:
+        """Merge app and user scoped deltas into their tables (inside a transaction)."""
+        if scopes["app"]:
+            state = self._load_state("app_states", "app_name = ?", (app_name,))
+            state.update(scopes["app"])
+            self._conn.execute(
+                "INSERT OR REPLACE INTO app_states (app_name, state) VALUES (?, ?)",
+                (app_name, json.dumps(state))
+            )
+        if scopes["user"]:
+            state = self._load_state("user_states", "app_name = ? AND user_id = ?", (app_name, user_id))
+            state.update(scopes["user"])
+            self._conn.execute(
+                "INSERT OR REPLACE INTO user_states (app_name, user_id, state) VALUES (?, ?, ?)",
+                (app_name, user_id, json.dumps(state))
+            )
+
+    def _merged_state(self, app_name: str, user_id: str, session_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Session state plus prefixed app and user state."""
+        state = dict(session_state)
+        for key, value in self._load_state("app_states", "app_name = ?", (app_name,)).items():
+            state[State.APP_PREFIX + key] = value
+        user_state = self._load_state("user_states", "app_name = ? AND user_id = ?", (app_name, user_id))
+        for key, value in user_state.items():
+            state[State.USER_PREFIX + key] = value
+        return state
+
+    def _maybe_evict(self) -> None:
+        now = time.time()
+        if now - self._last_eviction >= self.evict_interval_seconds:
+            self._last_eviction = now
+            self.evict_idle(now)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Delete sessions idle for longer than idle_ttl_seconds.
+
+        Args:
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Number of sessions deleted
+        """
+        cutoff = (now or time.time()) - self.idle_ttl_seconds
+        with self._lock, self._conn:
+            self._conn.execute(
+                """DELETE FROM events WHERE (app_name, user_id, session_id) IN (
+                       SELECT app_name, user_id, session_id FROM sessions WHERE update_time < ?)""",
+                (cutoff,)
+            )
+            cursor = self._conn.execute("DELETE FROM sessions WHERE update_time < ?", (cutoff,))
+            return cursor.rowcount
+
+    async def create_session(self,
+                             *,
+                             app_name: str,
+                             user_id: str,
+                             state: Optional[Dict[str, Any]] = None,
+                             session_id: Optional[str] = None) -> Session:
+        self._maybe_evict()
+
+        session_id = (session_id or "").strip() or uuid.uuid4().hex
+        scopes = _split_state(state or {})
+        now = time.time()
+
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        """INSERT INTO sessions (app_name, user_id, session_id, state, update_time)
+                           VALUES (?, ?, ?, ?, ?)""",
+                        (app_name, user_id, session_id, json.dumps(scopes["session"]), now)
+                    )
+                    self._save_scoped_state(app_name, user_id, scopes)
+            except sqlite3.IntegrityError:
+                raise AlreadyExistsError(f"Session with id {session_id} already exists.")
+
+            merged = self._merged_state(app_name, user_id, scopes["session"])
+
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=merged,
+            last_update_time=now
+        )
+
+    async def get_session(self,
+                          *,
+                          app_name: str,
+                          user_id: str,
+                          session_id: str,
+                          config: Optional[GetSessionConfig] = None) -> Optional[Session]:
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT state, update_time FROM sessions
+                   WHERE app_name = ? AND user_id = ? AND session_id = ?""",
+                (app_name, user_id, session_id)
+            ).fetchone()
+            if row is None:
+                return None
+
+            query = "SELECT event FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?"
+            params: tuple = (app_name, user_id, session_id)
+            if config and config.after_timestamp is not None:
+                query += " AND timestamp >= ?"
+                params += (config.after_timestamp,)
+            query += " ORDER BY seq DESC"
+            if config and config.num_recent_events is not None:
+                query += " LIMIT ?"
+                params += (config.num_recent_events,)
+
+            events = [Event.model_validate_json(e) for (e,) in self._conn.execute(query, params)]
+            merged = self._merged_state(app_name, user_id, json.loads(row[0]))
+
+        events.reverse()
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=merged,
+            events=events,
+            last_update_time=row[1]
+        )
+
+    async def list_sessions(self, *, app_name: str, user_id: Optional[str] = None) -> ListSessionsResponse:
+        query = "SELECT user_id, session_id, state, update_time FROM sessions WHERE app_name = ?"
+        params: tuple = (app_name,)
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params += (user_id,)
+        query += " ORDER BY update_time, user_id, session_id"
+
+        with self._lock:
+            sessions = [
+                Session(
+                    id=sid,
+                    app_name=app_name,
+                    user_id=uid,
+                    state=self._merged_state(app_name, uid, json.loads(state)),
+                    last_update_time=update_time
+                )
+                for uid, sid, state, update_time in self._conn.execute(query, params).fetchall()
+            ]
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        with self._lock, self._conn:
+            params = (app_name, user_id, session_id)
+            self._conn.execute(
+                "DELETE FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?", params
+            )
+            self._conn.execute(
+                "DELETE FROM sessions WHERE app_name = ? AND user_id = ? AND session_id = ?", params
+            )
+
+    async def get_user_state(self, *, app_name: str, user_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._load_state("user_states", "app_name = ? AND user_id = ?", (app_name, user_id))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            return event
+
+        # Applies the delta to the caller's session object and drops temp keys
+        event = await super().append_event(session=session, event=event)
+        session.last_update_time = event.timestamp
+        # The caller's copy is capped like the stored history
+        if len(session.events) > self.max_events:
+            del session.events[:-self.max_events]
+
+        scopes = _split_state(event.actions.state_delta if event.actions and event.actions.state_delta else {})
+        key = (session.app_name, session.user_id, session.id)
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT state FROM sessions WHERE app_name = ? AND user_id = ? AND session_id = ?", key
+            ).fetchone()
+            if row is None:
+                raise SessionNotFoundError(f"Session {session.id} not found.")
+
+            state = json.loads(row[0])
+            state.update(scopes["session"])
+            self._conn.execute(
+                """UPDATE sessions SET state = ?, update_time = ?
+                   WHERE app_name = ? AND user_id = ? AND session_id = ?""",
+                (json.dumps(state), event.timestamp) + key
+            )
+            self._save_scoped_state(session.app_name, session.user_id, scopes)
+
+            self._conn.execute(
+                """INSERT INTO events (app_name, user_id, session_id, timestamp, event)
+                   VALUES (?, ?, ?, ?, ?)""",
+                key + (event.timestamp, event.model_dump_json(exclude_none=True))
+            )
+            # Keep only the newest max_events events of this session
+            self._conn.execute(
+                """DELETE FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?
+                   AND seq <= (SELECT seq FROM events
+                               WHERE app_name = ? AND user_id = ? AND session_id = ?
+                               ORDER BY seq DESC LIMIT 1 OFFSET ?)""",
+                key + key + (self.max_events,)
+            )
+
+        return event
+
+
+_session_service: Optional[SqliteSessionService] = None
+
+
+def get_session_service() -> SqliteSessionService:
+    """Process-wide session service."""
+    global _session_service
+    if _session_service is None:
+        _session_service = SqliteSessionService()
+    return _session_service
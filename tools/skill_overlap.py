@@ -0,0 +1,200 @@
+"""Skill Overlap - bulk resume x job skill matching with sparse matrices"""
+# NumPy and SciPy are imported on first use, like in scoring_tools
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+from .skill_taxonomy import SkillKey, SkillTaxonomy, get_skill_taxonomy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+
+class SkillOverlap:
+    """
+    Skill overlap between R resumes and J jobs.
+
+    Each job is a sparse 0/1 row over the vocabulary of required skills;
+    each resume is a row over the same vocabulary holding its skills and
+    their parents, so the rules match identify_missing_skills. Match counts
+    for every pair come from one sparse product, R x V times V x J.
+    """
+
+    def __init__(self,
+                 resume_skills: Sequence[Sequence[str]],
+                 job_skills: Sequence[Sequence[str]],
+                 taxonomy: Optional[SkillTaxonomy] = None):
+        import numpy as np
+
+        self.taxonomy = taxonomy or get_skill_taxonomy()
+        # Canonical key -> column, and the first spelling seen per column
+        self.vocabulary: Dict[SkillKey, int] = {}
+        self.skill_names: List[str] = []
+        # Resolve each distinct spelling once, not once per document
+        self._keys: Dict[str, SkillKey] = {}
+
+        self.job_skills = job_skills
+        self.jobs = self._encode(job_skills, expand=False, grow=True)
+        self.resumes = self._encode(resume_skills, expand=True, grow=False)
+        self.required = np.diff(self.jobs.indptr).astype(np.int32)
+
+    def _key(self, skill: str) -> SkillKey:
+        key = self._keys.get(skill)
+        if key is None:
+            key = self._keys[skill] = self.taxonomy.skill_key(skill)
+        return key
+
+    def _encode(self, skill_lists: Sequence[Sequence[str]], expand: bool, grow: bool) -> "csr_matrix":
+        """Sparse 0/1 rows; resume columns outside the job vocabulary are dropped."""
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        indptr = [0]
+        indices: List[int] = []
+        for skills in skill_lists:
+            keys = {self._key(skill): skill for skill in skills}
+            if expand:
+                keys.update({key: "" for key in self.taxonomy.expand(keys) if key not in keys})
+
+            row = set()
+            for key, skill in keys.items():
+                column = self.vocabulary.get(key)
+                if column is None and grow:
+                    column = self.vocabulary[key] = len(self.skill_names)
+                    self.skill_names.append(skill)
+                if column is not None:
+                    row.add(column)
+            indices.extend(sorted(row))
+            indptr.append(len(indices))
+
+        data = np.ones(len(indices), dtype=np.int32)
+        return csr_matrix((data, indices, indptr), shape=(len(skill_lists), len(self.vocabulary)))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.resumes.shape[0], self.jobs.shape[0]
+
+    def matched_counts(self, rows: slice = slice(None)) -> "np.ndarray":
+        """Required skills each resume covers, as an R x J int32 array."""
+        import numpy as np
+
+        return (self.resumes[rows] @ self.jobs.T).toarray().astype(np.int32, copy=False)
+
+    def coverage(self, rows: slice = slice(None), matched: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """Percentage of each job's required skills each resume covers (R x J)."""
+        import numpy as np
+
+        if matched is None:
+            matched = self.matched_counts(rows)
+        required = self.required.astype(np.float64)
+        return np.divide(matched * 100.0, required,
+                         out=np.zeros(matched.shape, dtype=np.float64), where=required > 0)
+
+    def missing_counts(self, rows: slice = slice(None), matched: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """Required skills each resume lacks (R x J)."""
+        if matched is None:
+            matched = self.matched_counts(rows)
+        return self.required - matched
+
+    def missing_mask(self, resume_index: int, job_indexes: Optional[Sequence[int]] = None) -> "np.ndarray":
+        """
+        Boolean mask over the vocabulary of skills a resume lacks per job.
+
+        Args:
+            resume_index: Resume row
+            job_indexes: Jobs to include (all jobs if omitted)
+
+        Returns:
+            len(job_indexes) x V boolean array
+        """
+        jobs = self.jobs if job_indexes is None else self.jobs[list(job_indexes)]
+        has = self.resumes[resume_index].toarray().astype(bool)
+        return jobs.toarray().astype(bool) & ~has
+
+    def missing_skills(self, resume_index: int, job_index: int) -> List[str]:
+        """Required skills of one job that one resume lacks, as the job spells them."""
+        missing = set(self.missing_mask(resume_index, [job_index])[0].nonzero()[0].tolist())
+        names: Dict[int, str] = {}
+        for skill in self.job_skills[job_index]:
+            column = self.vocabulary[self._key(skill)]
+            if column in missing:
+                names.setdefault(column, skill)
+        return list(names.values())
+
+    def iter_blocks(self, block_size: int = 4096) -> Iterator[Dict]:
+        """
+        Stream the R x J results in row blocks to bound memory.
+
+        Args:
+            block_size: Resumes per block
+
+        Yields:
+            Dictionaries with row_start, matched_counts, coverage and missing_counts
+        """
+        for start in range(0, self.shape[0], block_size):
+            rows = slice(start, start + block_size)
+            matched = self.matched_counts(rows)
+            yield {
+                "row_start": start,
+                "matched_counts": matched,
+                "coverage": self.coverage(rows, matched),
+                "missing_counts": self.missing_counts(rows, matched)
+            }
+
+
+def calculate_skill_overlap(resume_skills: List[List[str]],
+                            job_skills: List[List[str]],
+                            top_k: int = 10,
+                            block_size: int = 1024) -> Dict:
+    """
+    Calculate keyword match for every resume against every job.
+
+    The R x J scores are computed in row blocks and only each resume's
+    top_k jobs are kept, so memory stays bounded by block_size x J.
+    Use SkillOverlap.iter_blocks directly for the full matrices.
+
+    Args:
+        resume_skills: Skills per resume
+        job_skills: Required skills per job
+        top_k: Best-covered jobs to return per resume (none when top_k <= 0)
+        block_size: Resumes scored per block
+
+    Returns:
+        Dictionary with, per resume, its top_k jobs by coverage percentage
+        with matched and missing counts, plus each job's required count
+    """
+    import numpy as np
+
+    try:
+        overlap = SkillOverlap(resume_skills, job_skills)
+        rows, jobs = overlap.shape
+        k = max(0, min(top_k, jobs))
+
+        results: List[List[Dict]] = []
+        for block in overlap.iter_blocks(block_size):
+            coverage = block["coverage"]
+            if k == 0:
+                results.extend([] for _ in range(coverage.shape[0]))
+                continue
+            # Top-k per row without sorting every job, then order those k
+            top = np.sort(np.argpartition(-coverage, k - 1, axis=1)[:, :k], axis=1)
+            order = np.argsort(-np.take_along_axis(coverage, top, axis=1), axis=1, kind='stable')
+            top = np.take_along_axis(top, order, axis=1)
+            for row, job_indexes in enumerate(top):
+                results.append([
+                    {
+                        "job_index": int(j),
+                        "coverage": round(float(coverage[row, j]), 2),
+                        "matched_count": int(block["matched_counts"][row, j]),
+                        "missing_count": int(block["missing_counts"][row, j])
+                    }
+                    for j in job_indexes
+                ])
+
+        return {
+            "success": True,
+            "shape": [rows, jobs],
+            "results": results,
+            "count": len(results),
+            "total_required": overlap.required.tolist()
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
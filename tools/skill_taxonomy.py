@@ -0,0 +1,413 @@
+"""Skill Taxonomy - canonical skills with aliases and parents in a memory-mapped table"""
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from config import Config
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+
+
+# File layout (little-endian):
+#   header  magic, counts and the byte offset of every section
+#   names   uint32 offsets[skill_count + 1] + UTF-8 canonical names
+#   parents uint32 offsets[skill_count + 1] + int32 parent ids
+#   keys    uint32 offsets[key_count + 1] + UTF-8 normalized surface forms
+#           int32 skill id per key (-1 for a prefix of a longer key)
+#   table   int32 open-addressing hash table of key indexes (-1 = empty)
+MAGIC = b"SKILLTX1"
+DEFAULT_TAXONOMY_PATH = "models/skill_taxonomy.bin"
+_HEADER = struct.Struct("<8s12I")
+
+# Skills and aliases are compared as space-joined tokens, so "CI/CD",
+# "ci cd" and "CI-CD" are the same key. A leading dot is kept (".NET").
+_TOKEN_PATTERN = re.compile(r"\.?[a-z0-9+#]+")
+
+# Canonical key of a skill: its taxonomy id, or the normalized name when
+# the skill is not in the taxonomy (e.g. free text from the LLM)
+SkillKey = Union[int, str]
+
+
+def normalize_skill(text: str) -> str:
+    """Lowercase, space-joined tokens of a skill name or alias."""
+    return " ".join(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _pad(buffer: bytearray) -> None:
+    buffer.extend(b"\0" * (-len(buffer) % 4))
+
+
+def _strings(values: Sequence[str]) -> Tuple[array, bytes]:
+    offsets = array("I", [0])
+    blob = bytearray()
+    for value in values:
+        blob.extend(value.encode("utf-8"))
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def compile_taxonomy(entries: Iterable[Dict]) -> bytes:
+    """
+    Compile taxonomy entries into the binary table format.
+
+    Parents that are not themselves entries are added as skills. When two
+    skills claim the same alias, the first one keeps it.
+
+    Args:
+        entries: Dicts with "name" and optional "aliases" and "parents" lists
+
+    Returns:
+        The compiled taxonomy
+    """
+    names: List[str] = []
+    ids: Dict[str, int] = {}
+    aliases: List[List[str]] = []
+    parent_names: List[List[str]] = []
+
+    def add(name: str) -> int:
+        if name not in ids:
+            ids[name] = len(names)
+            names.append(name)
+            aliases.append([])
+            parent_names.append([])
+        return ids[name]
+
+    for entry in entries:
+        skill_id = add(entry["name"])
+        aliases[skill_id].extend(entry.get("aliases", []))
+        parent_names[skill_id].extend(entry.get("parents", []))
+
+    # Register parent-only skills first, so every skill (including the
+    # ones added here) gets a parent list
+    for skill_parents in list(parent_names):
+        for parent in skill_parents:
+            add(parent)
+    parents = [
+        list(dict.fromkeys(ids[parent] for parent in skill_parents))
+        for skill_parents in parent_names
+    ]
+
+    # Every surface form, plus each proper token prefix so a scan can stop
+    # extending an n-gram as soon as no key starts with it
+    key_skill: Dict[str, int] = {}
+    for skill_id, name in enumerate(names):
+        for surface in [name] + aliases[skill_id]:
+            key = normalize_skill(surface)
+            if key and key_skill.get(key, -1) < 0:
+                key_skill[key] = skill_id
+            tokens = key.split(" ")
+            for n in range(1, len(tokens)):
+                key_skill.setdefault(" ".join(tokens[:n]), -1)
+
+    keys = list(key_skill)
+    max_ngram = max((key.count(" ") + 1 for key in keys), default=1)
+
+    table_size = 1
+    while table_size < 2 * len(keys) + 1:
+        table_size *= 2
+    table = array("i", [-1]) * table_size
+    mask = table_size - 1
+    for key_index, key in enumerate(keys):
+        slot = zlib.crc32(key.encode("utf-8")) & mask
+        while table[slot] >= 0:
+            slot = (slot + 1) & mask
+        table[slot] = key_index
+
+    name_offsets, name_bytes = _strings(names)
+    key_offsets, key_bytes = _strings(keys)
+    parent_offsets = array("I", [0])
+    parent_ids = array("i")
+    for skill_parents in parents:
+        parent_ids.extend(skill_parents)
+        parent_offsets.append(len(parent_ids))
+
+    sections = [
+        name_offsets, name_bytes,
+        parent_offsets, parent_ids,
+        key_offsets, key_bytes, array("i", [key_skill[key] for key in keys]),
+        table
+    ]
+    if sys.byteorder != "little":
+        for section in sections:
+            if isinstance(section, array):
+                section.byteswap()
+
+    body = bytearray()
+    offsets = []
+    for section in sections:
+        _pad(body)
+        offsets.append(_HEADER.size + len(body))
+        body.extend(section.tobytes() if isinstance(section, array) else section)
+
+    header = _HEADER.pack(MAGIC, len(names), len(keys), table_size, max_ngram, *offsets)
+    return header + bytes(body)
+
+
+def load_taxonomy_entries(source_path: str) -> List[Dict]:
+    """
+    Read taxonomy entries from JSON Lines or a JSON list.
+
+    Args:
+        source_path: File of {"name", "aliases", "parents"} objects
+
+    Returns:
+        List of entries
+    """
+    with open(source_path, encoding="utf-8") as f:
+        if source_path.lower().endswith(".json"):
+            return json.load(f)
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _verify_taxonomy(taxonomy: "SkillTaxonomy", entries: Sequence[Dict]) -> None:
+    """Check that a compiled table holds every entry with its declared parents."""
+    ids = {taxonomy.name(skill_id): skill_id for skill_id in range(len(taxonomy))}
+    for entry in entries:
+        parents = entry.get("parents", [])
+        missing = [name for name in [entry["name"]] + parents if name not in ids]
+        if missing:
+            raise ValueError(f"Compiled taxonomy is missing {missing[0]!r}")
+        # Entries repeating a name merge their parents, so the links are a superset
+        if not {ids[parent] for parent in parents} <= set(taxonomy.parents(ids[entry["name"]])):
+            raise ValueError(f"Compiled taxonomy has wrong parents for {entry['name']!r}")
+    for skill_id in range(len(taxonomy)):
+        if any(not 0 <= parent < len(taxonomy) for parent in taxonomy.parents(skill_id)):
+            raise ValueError(f"Compiled taxonomy has a dangling parent link for {taxonomy.name(skill_id)!r}")
+
+
+def build_taxonomy(source_path: str, output_path: Optional[str] = None) -> Dict:
+    """
+    Compile a taxonomy source file and write the binary table.
+
+    Args:
+        source_path: JSON Lines (or JSON list) taxonomy source
+        output_path: Where to write the table (defaults to Config.SKILL_TAXONOMY_PATH)
+
+    Returns:
+        Dictionary with skill, key and byte counts
+    """
+    output_path = output_path or Config.SKILL_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH
+    try:
+        entries = load_taxonomy_entries(source_path)
+        data = compile_taxonomy(entries)
+
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+
+        # Read the file back through mmap before it replaces the old table
+        taxonomy = SkillTaxonomy.open(tmp_path)
+        _verify_taxonomy(taxonomy, entries)
+        os.replace(tmp_path, output_path)
+        return {
+            "success": True,
+            "taxonomy_path": output_path,
+            "skill_count": len(taxonomy),
+            "key_count": taxonomy.key_count,
+            "size_bytes": len(data)
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+class SkillTaxonomy:
+    """
+    Read-only view over a compiled taxonomy.
+
+    Lookups hash the normalized surface form into an open-addressing table,
+    so alias resolution is O(1). Opened from a file, the table is
+    memory-mapped: worker processes share the same physical pages and
+    nothing is parsed at load time.
+    """
+
+    def __init__(self, buffer):
+        if sys.byteorder != "little":
+            raise RuntimeError("Compiled skill taxonomies require a little-endian platform")
+
+        view = memoryview(buffer)
+        magic, skill_count, key_count, table_size, max_ngram, *offsets = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Not a compiled skill taxonomy")
+
+        (names_at, name_bytes_at, parents_at, parent_ids_at,
+         keys_at, key_bytes_at, key_skill_at, table_at) = offsets
+
+        self._buffer = buffer
+        self._view = view
+        self.key_count = key_count
+        self.max_ngram = max_ngram
+        self._skill_count = skill_count
+        self._name_offsets = view[names_at:names_at + 4 * (skill_count + 1)].cast("I")
+        self._name_base = name_bytes_at
+        self._parent_offsets = view[parents_at:parents_at + 4 * (skill_count + 1)].cast("I")
+        self._parent_ids = view[parent_ids_at:parent_ids_at + 4 * self._parent_offsets[-1]].cast("i")
+        self._key_offsets = view[keys_at:keys_at + 4 * (key_count + 1)].cast("I")
+        self._key_base = key_bytes_at
+        self._key_skill = view[key_skill_at:key_skill_at + 4 * key_count].cast("i")
+        self._table = view[table_at:table_at + 4 * table_size].cast("i")
+        self._mask = table_size - 1
+
+    @classmethod
+    def open(cls, path: str) -> "SkillTaxonomy":
+        """Memory-map a compiled taxonomy file."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return self._skill_count
+
+    def name(self, skill_id: int) -> str:
+        """Canonical name of a skill."""
+        start = self._name_base + self._name_offsets[skill_id]
+        end = self._name_base + self._name_offsets[skill_id + 1]
+        return bytes(self._view[start:end]).decode("utf-8")
+
+    def parents(self, skill_id: int) -> List[int]:
+        """Direct parents of a skill."""
+        return list(self._parent_ids[self._parent_offsets[skill_id]:self._parent_offsets[skill_id + 1]])
+
+    def ancestors(self, skill_id: int) -> Set[int]:
+        """Every skill reachable through parent links."""
+        seen: Set[int] = set()
+        stack = self.parents(skill_id)
+        while stack:
+            parent = stack.pop()
+            if parent not in seen:
+                seen.add(parent)
+                stack.extend(self.parents(parent))
+        return seen
+
+    def _find_key(self, key: bytes) -> int:
+        """Index of a normalized key, or -1."""
+        table = self._table
+        mask = self._mask
+        slot = zlib.crc32(key) & mask
+        while True:
+            key_index = table[slot]
+            if key_index < 0:
+                return -1
+            start = self._key_base + self._key_offsets[key_index]
+            end = self._key_base + self._key_offsets[key_index + 1]
+            if self._view[start:end] == key:
+                return key_index
+            slot = (slot + 1) & mask
+
+    def lookup(self, term: str) -> Optional[int]:
+        """
+        Resolve a skill name or alias to its canonical id.
+
+        Args:
+            term: Any spelling of a skill ("k8s", "Golang", "JS")
+
+        Returns:
+            Skill id, or None when the term is not in the taxonomy
+        """
+        key_index = self._find_key(normalize_skill(term).encode("utf-8"))
+        if key_index < 0:
+            return None
+        skill_id = self._key_skill[key_index]
+        return skill_id if skill_id >= 0 else None
+
+    def find_ids(self, text: str) -> List[int]:
+        """
+        Return the ids of all skills mentioned in text.
+
+        Every token starts an n-gram that is extended only while some key
+        begins with it, so the scan costs about one lookup per token.
+
+        Args:
+            text: Resume or job description text
+
+        Returns:
+            Sorted skill ids
+        """
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        found: Set[int] = set()
+        for i in range(len(tokens)):
+            key = tokens[i]
+            for j in range(i + 1, min(i + self.max_ngram, len(tokens)) + 1):
+                key_index = self._find_key(key.encode("utf-8"))
+                if key_index < 0:
+                    break
+                skill_id = self._key_skill[key_index]
+                if skill_id >= 0:
+                    found.add(skill_id)
+                if j < len(tokens):
+                    key = key + " " + tokens[j]
+        return sorted(found)
+
+    def find(self, text: str) -> List[str]:
+        """Return the canonical names of all skills mentioned in text."""
+        return [self.name(skill_id) for skill_id in self.find_ids(text)]
+
+    def skill_key(self, skill: str) -> SkillKey:
+        """Canonical id for a known skill, normalized name otherwise."""
+        skill_id = self.lookup(skill)
+        return skill_id if skill_id is not None else normalize_skill(skill)
+
+    def skill_keys(self, skills: Iterable[str]) -> Dict[SkillKey, str]:
+        """Canonical key -> first spelling seen, in input order."""
+        keys: Dict[SkillKey, str] = {}
+        for skill in skills:
+            keys.setdefault(self.skill_key(skill), skill)
+        return keys
+
+    def expand(self, keys: Iterable[SkillKey]) -> Set[SkillKey]:
+        """Keys plus the ancestors of every known skill among them."""
+        expanded: Set[SkillKey] = set()
+        for key in keys:
+            expanded.add(key)
+            if isinstance(key, int):
+                expanded |= self.ancestors(key)
+        return expanded
+
+
+def _default_entries(skills: Sequence[str]) -> List[Dict]:
+    """Entries for a flat skill list, with Config aliases and parents applied."""
+    known = set(skills)
+    return [
+        {
+            "name": skill,
+            "aliases": Config.SKILL_ALIASES.get(skill, []),
+            "parents": [p for p in Config.SKILL_PARENTS.get(skill, []) if p in known]
+        }
+        for skill in skills
+    ]
+
+
+@lru_cache(maxsize=8)
+def _compile_vocabulary(skills: Tuple[str, ...]) -> SkillTaxonomy:
+    return SkillTaxonomy(compile_taxonomy(_default_entries(skills)))
+
+
+@lru_cache(maxsize=4)
+def _open(path: str) -> SkillTaxonomy:
+    return SkillTaxonomy.open(path)
+
+
+def get_skill_taxonomy(skill_database: Optional[Sequence[str]] = None) -> SkillTaxonomy:
+    """
+    Get the taxonomy for a skill vocabulary.
+
+    The configured vocabulary uses the compiled file at
+    Config.SKILL_TAXONOMY_PATH when one is set; otherwise (and for any
+    other list) the list is compiled in memory once per process.
+
+    Args:
+        skill_database: List of known skills (defaults to Config.SKILL_DATABASE)
+
+    Returns:
+        Cached SkillTaxonomy
+    """
+    if skill_database is None or skill_database is Config.SKILL_DATABASE:
+        if Config.SKILL_TAXONOMY_PATH:
+            return _open(Config.SKILL_TAXONOMY_PATH)
+        skill_database = Config.SKILL_DATABASE
+    return _compile_vocabulary(tuple(skill_database))
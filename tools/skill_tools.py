@@ -1,6 +1,7 @@
 """Skill Extraction Tools - Pure ADK"""
 # from google.adk.tools import tool
 from typing import List, Dict
+from .skill_taxonomy import get_skill_taxonomy
 
 
 # @tool
@@ -15,13 +16,7 @@ def extract_skills_tool(text: str, skill_database: List[str]) -> List[str]:
     Returns:
         List of found skills
     """
-    text_lower = text.lower()
-    found_skills = []
-    for skill in skill_database:
-        if skill.lower() in text_lower:
-            found_skills.append(skill)
-
-    return list(dict.fromkeys(found_skills))
+    return get_skill_taxonomy(skill_database).find(text)
 
 
 # @tool
@@ -37,12 +32,10 @@ def identify_missing_skills_tool(resume_skills: List[str],
     Returns:
         List of missing skills
     """
-    resume_set = {s.lower() for s in resume_skills}
-    job_set = {s.lower() for s in job_skills}
-    
-    missing = job_set - resume_set
-    
-    return [s for s in job_skills if s.lower() in missing]
+    taxonomy = get_skill_taxonomy()
+    covered = taxonomy.expand(taxonomy.skill_keys(resume_skills))
+
+    return [s for key, s in taxonomy.skill_keys(job_skills).items() if key not in covered]
 
 
 def extract_skills(text: str, skill_database: List[str]) -> Dict:
@@ -54,21 +47,16 @@ def extract_skills(text: str, skill_database: List[str]) -> Dict:
         skill_database: List of known skills
 
     Returns:
-        Dictionary with found skills
+        Dictionary with canonical skill names and their taxonomy ids
     """
-    text_lower = text.lower()
-    found_skills = []
-
-    for skill in skill_database:
-        if skill.lower() in text_lower:
-            found_skills.append(skill)
-
-    # Remove duplicates while preserving order
-    unique_skills = list(dict.fromkeys(found_skills))
+    # Aliases ("k8s", "Golang") resolve to the same canonical skill
+    taxonomy = get_skill_taxonomy(skill_database)
+    skill_ids = taxonomy.find_ids(text)
 
     return {
-        "skills": unique_skills,
-        "count": len(unique_skills)
+        "skills": [taxonomy.name(skill_id) for skill_id in skill_ids],
+        "skill_ids": skill_ids,
+        "count": len(skill_ids)
     }
 
 
@@ -84,15 +72,18 @@ def identify_missing_skills(resume_skills: List[str],
     Returns:
         Dictionary with missing skills analysis
     """
-    resume_set = {s.lower() for s in resume_skills}
-    job_set = {s.lower() for s in job_skills}
-
-    missing = job_set - resume_set
-    matched = resume_set & job_set
-
-    # Return with original casing from job_skills
-    missing_skills = [s for s in job_skills if s.lower() in missing]
-    matched_skills = [s for s in resume_skills if s.lower() in matched]
+    # Compare canonical skills: aliases are the same skill, and a resume
+    # skill also covers its broader parents (PyTorch -> Deep Learning)
+    taxonomy = get_skill_taxonomy()
+    resume_keys = taxonomy.skill_keys(resume_skills)
+    job_keys = taxonomy.skill_keys(job_skills)
+    covered = taxonomy.expand(resume_keys)
+
+    missing_skills = [s for key, s in job_keys.items() if key not in covered]
+    matched_skills = [
+        s for key, s in resume_keys.items()
+        if not job_keys.keys().isdisjoint(taxonomy.expand([key]))
+    ]
 
     return {
         "missing_skills": missing_skills,
@@ -100,5 +91,5 @@ def identify_missing_skills(resume_skills: List[str],
         "missing_count": len(missing_skills),
         "matched_count": len(matched_skills),
         "total_required": len(job_skills),
-        "gap_percentage": round((len(missing) / len(job_set) * 100) if job_set else 0, 2)
-    }
\ No newline at end of file
+        "gap_percentage": round((len(missing_skills) / len(job_keys) * 100) if job_keys else 0, 2)
+    }
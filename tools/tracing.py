@@ -0,0 +1,507 @@
+"""Tracing - per-stage spans, JSON traces and Prometheus metrics"""
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+from config import Config
+import functools
+import inspect
+import json
+import threading
+import time
+import uuid
+
+
+# Histogram buckets in seconds, from fast local tools up to slow LLM calls
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_current_request: ContextVar[Optional[str]] = ContextVar("trace_request_id", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("trace_span", default=None)
+# Spans finished in a worker process, shipped back to the parent's tracer
+_captured_spans: ContextVar[Optional[List["Span"]]] = ContextVar("trace_captured_spans", default=None)
+
+
+class Span:
+    """One timed stage inside a request."""
+
+    def __init__(self, name: str, request_id: str, parent_id: Optional[str]):
+        self.name = name
+        self.request_id = request_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start_time = time.time()
+        self.duration_ms = 0.0
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    def set(self, **attributes) -> None:
+        """Attach attributes such as sizes, token counts or cache result."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "request_id": self.request_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error
+        }
+
+
+class Tracer:
+    """
+    Collects finished spans and aggregates them into metrics.
+
+    Finished spans are kept in a bounded buffer. Counters and duration
+    histograms are kept per stage for Prometheus export.
+    """
+
+    def __init__(self, buffer_size: int = 10000):
+        self._lock = threading.Lock()
+        self._spans: deque = deque(maxlen=buffer_size)
+        self._calls: Dict[tuple, int] = defaultdict(int)
+        self._cache: Dict[tuple, int] = defaultdict(int)
+        self._tokens: Dict[tuple, int] = defaultdict(int)
+        self._bucket_counts: Dict[str, List[int]] = {}
+        self._duration_sum: Dict[str, float] = defaultdict(float)
+        self._duration_count: Dict[str, int] = defaultdict(int)
+        # Time to first chunk of streamed generations
+        self._first_chunk_counts: Dict[str, List[int]] = {}
+        self._first_chunk_sum: Dict[str, float] = defaultdict(float)
+        self._first_chunk_count: Dict[str, int] = defaultdict(int)
+        self._responses: Dict[tuple, int] = defaultdict(int)
+
+    def record(self, span: Span) -> None:
+        seconds = span.duration_ms / 1000
+        with self._lock:
+            self._spans.append(span)
+            self._calls[(span.name, "error" if span.error else "ok")] += 1
+
+            buckets = self._bucket_counts.setdefault(span.name, [0] * len(DURATION_BUCKETS))
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    buckets[i] += 1
+            self._duration_sum[span.name] += seconds
+            self._duration_count[span.name] += 1
+
+            first_chunk_ms = span.attributes.get("first_chunk_ms")
+            if first_chunk_ms is not None:
+                first_chunk = first_chunk_ms / 1000
+                buckets = self._first_chunk_counts.setdefault(span.name, [0] * len(DURATION_BUCKETS))
+                for i, bound in enumerate(DURATION_BUCKETS):
+                    if first_chunk <= bound:
+                        buckets[i] += 1
+                self._first_chunk_sum[span.name] += first_chunk
+                self._first_chunk_count[span.name] += 1
+
+            status_code = span.attributes.get("status_code")
+            if status_code is not None:
+                self._responses[(span.name, status_code)] += 1
+
+            cache = span.attributes.get("cache")
+            if cache in ("hit", "miss"):
+                self._cache[(span.name, cache)] += 1
+            for kind in ("prompt_tokens", "output_tokens"):
+                if span.attributes.get(kind):
+                    self._tokens[(span.name, kind)] += int(span.attributes[kind])
+
+    def spans(self, request_id: Optional[str] = None) -> List[Dict]:
+        """Finished spans as dictionaries, optionally for one request."""
+        with self._lock:
+            spans = list(self._spans)
+        return [s.to_dict() for s in spans if request_id is None or s.request_id == request_id]
+
+    def trace(self, request_id: str) -> Dict:
+        """
+        Nested trace for one request.
+
+        Args:
+            request_id: Request to export
+
+        Returns:
+            Dictionary with the request id and its span tree
+        """
+        spans = self.spans(request_id)
+        children: Dict[Optional[str], List[Dict]] = defaultdict(list)
+        for span in sorted(spans, key=lambda s: s["start_time"]):
+            children[span["parent_id"]].append(span)
+
+        known = {span["span_id"] for span in spans}
+
+        def build(span: Dict) -> Dict:
+            return {**span, "children": [build(child) for child in children[span["span_id"]]]}
+
+        roots = [span for span in spans if span["parent_id"] not in known]
+        return {"request_id": request_id, "spans": [build(root) for root in roots]}
+
+    def prometheus_text(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP resume_optimizer_stage_calls_total Stage invocations by status",
+            "# TYPE resume_optimizer_stage_calls_total counter",
+        ]
+        with self._lock:
+            for (stage, status), count in sorted(self._calls.items()):
+                lines.append(f'resume_optimizer_stage_calls_total{{stage="{stage}",status="{status}"}} {count}')
+
+            lines += [
+                "# HELP resume_optimizer_stage_duration_seconds Stage duration",
+                "# TYPE resume_optimizer_stage_duration_seconds histogram",
+            ]
+            for stage in sorted(self._bucket_counts):
+                for bound, count in zip(DURATION_BUCKETS, self._bucket_counts[stage]):
+                    lines.append(
+                        f'resume_optimizer_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}'
+                    )
+                lines.append(
+                    f'resume_optimizer_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} '
+                    f'{self._duration_count[stage]}'
+                )
+                lines.append(
+                    f'resume_optimizer_stage_duration_seconds_sum{{stage="{stage}"}} {self._duration_sum[stage]:.6f}'
+                )
+                lines.append(
+                    f'resume_optimizer_stage_duration_seconds_count{{stage="{stage}"}} {self._duration_count[stage]}'
+                )
+
+            lines += [
+                "# HELP resume_optimizer_stage_first_chunk_seconds Time to first streamed chunk",
+                "# TYPE resume_optimizer_stage_first_chunk_seconds histogram",
+            ]
+            for stage in sorted(self._first_chunk_counts):
+                for bound, count in zip(DURATION_BUCKETS, self._first_chunk_counts[stage]):
+                    lines.append(
+                        f'resume_optimizer_stage_first_chunk_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}'
+                    )
+                lines.append(
+                    f'resume_optimizer_stage_first_chunk_seconds_bucket{{stage="{stage}",le="+Inf"}} '
+                    f'{self._first_chunk_count[stage]}'
+                )
+                lines.append(
+                    f'resume_optimizer_stage_first_chunk_seconds_sum{{stage="{stage}"}} '
+                    f'{self._first_chunk_sum[stage]:.6f}'
+                )
+                lines.append(
+                    f'resume_optimizer_stage_first_chunk_seconds_count{{stage="{stage}"}} '
+                    f'{self._first_chunk_count[stage]}'
+                )
+
+            lines += [
+                "# HELP resume_optimizer_http_responses_total HTTP responses by status code",
+                "# TYPE resume_optimizer_http_responses_total counter",
+            ]
+            for (stage, code), count in sorted(self._responses.items()):
+                lines.append(f'resume_optimizer_http_responses_total{{stage="{stage}",code="{code}"}} {count}')
+
+            lines += [
+                "# HELP resume_optimizer_cache_lookups_total Cache lookups by result",
+                "# TYPE resume_optimizer_cache_lookups_total counter",
+            ]
+            for (stage, result), count in sorted(self._cache.items()):
+                lines.append(f'resume_optimizer_cache_lookups_total{{stage="{stage}",result="{result}"}} {count}')
+
+            lines += [
+                "# HELP resume_optimizer_llm_tokens_total LLM tokens by kind",
+                "# TYPE resume_optimizer_llm_tokens_total counter",
+            ]
+            for (stage, kind), count in sorted(self._tokens.items()):
+                lines.append(f'resume_optimizer_llm_tokens_total{{stage="{stage}",kind="{kind}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+
+tracer = Tracer(Config.TRACE_BUFFER_SIZE)
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+@contextmanager
+def request_context(request_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Group every span opened inside this block under one request id.
+
+    Args:
+        request_id: Id to use (a new one is generated if omitted)
+
+    Yields:
+        The request id
+    """
+    request_id = request_id or new_request_id()
+    token = _current_request.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _current_request.reset(token)
+
+
+def current_request_id() -> Optional[str]:
+    return _current_request.get()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def worker_context(request_id: Optional[str], parent_id: Optional[str]) -> Iterator[List[Span]]:
+    """
+    Continue a caller's trace in a worker process.
+
+    Spans opened inside the block belong to the caller's request and
+    span, and are collected instead of recorded in the worker's own
+    tracer; pass them back and feed them to tracer.record in the caller
+    so they reach its metrics and traces.
+
+    Args:
+        request_id: Caller's request id
+        parent_id: Caller's current span id
+
+    Yields:
+        List that receives every span finished inside the block
+    """
+    parent = None
+    if parent_id is not None:
+        parent = Span("remote", request_id or "", None)
+        parent.span_id = parent_id
+
+    captured: List[Span] = []
+    request_token = _current_request.set(request_id)
+    span_token = _current_span.set(parent)
+    captured_token = _captured_spans.set(captured)
+    try:
+        yield captured
+    finally:
+        _captured_spans.reset(captured_token)
+        _current_span.reset(span_token)
+        _current_request.reset(request_token)
+
+
+def _export(span: Span) -> None:
+    """Append a finished root span's trace to Config.TRACE_EXPORT_PATH."""
+    if not Config.TRACE_EXPORT_PATH:
+        return
+    try:
+        with open(Config.TRACE_EXPORT_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(tracer.trace(span.request_id), default=str) + "\n")
+    except OSError:
+        pass
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Span]:
+    """
+    Time a stage and record it under the current request.
+
+    Args:
+        name: Stage name
+        **attributes: Initial span attributes
+
+    Yields:
+        The open Span, so callers can attach more attributes
+    """
+    if not Config.TRACING_ENABLED:
+        yield Span(name, "", None)
+        return
+
+    parent = _current_span.get()
+    request_id = _current_request.get() or (parent.request_id if parent else None) or new_request_id()
+    current = Span(name, request_id, parent.span_id if parent else None)
+    current.set(**attributes)
+
+    span_token = _current_span.set(current)
+    request_token = _current_request.set(request_id)
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration_ms = (time.perf_counter() - start) * 1000
+        _current_request.reset(request_token)
+        _current_span.reset(span_token)
+        captured = _captured_spans.get()
+        if captured is not None:
+            captured.append(current)
+        else:
+            tracer.record(current)
+            if current.parent_id is None:
+                _export(current)
+
+
+def record_cache(hit: bool) -> None:
+    """Mark the current span as a cache hit or miss."""
+    active = _current_span.get()
+    if active is not None:
+        active.set(cache="hit" if hit else "miss")
+
+
+def _payload_size(value: Any) -> int:
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _finish_tool_span(active: Span, result: Any) -> None:
+    active.set(output_size=_payload_size(result))
+    if isinstance(result, dict) and result.get("success") is False:
+        active.error = str(result.get("error", "tool reported failure"))
+
+
+def traced_tool(func: Callable, stage: Optional[str] = None) -> Callable:
+    """
+    Wrap a tool function so every call is recorded as a span.
+
+    The wrapper keeps the function's name, docstring and signature, so it
+    can be passed straight to FunctionTool.
+
+    Args:
+        func: Tool function (sync or async)
+        stage: Span name (defaults to the function name)
+
+    Returns:
+        Wrapped function
+    """
+    name = stage or func.__name__
+
+    def input_size(args, kwargs) -> int:
+        return sum(_payload_size(v) for v in list(args) + list(kwargs.values()))
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with span(name, kind="tool", input_size=input_size(args, kwargs)) as active:
+                result = await func(*args, **kwargs)
+                _finish_tool_span(active, result)
+                return result
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with span(name, kind="tool", input_size=input_size(args, kwargs)) as active:
+            result = func(*args, **kwargs)
+            _finish_tool_span(active, result)
+            return result
+    return wrapper
+
+
+def _record_usage(active: Span, response: Any) -> None:
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        active.set(
+            prompt_tokens=getattr(usage, "prompt_token_count", 0) or 0,
+            output_tokens=getattr(usage, "candidates_token_count", 0) or 0
+        )
+    try:
+        active.set(output_size=len(response.text))
+    except Exception:
+        pass
+
+
+def traced_generate(model: Any, prompt: str, stage: str, **kwargs) -> Any:
+    """
+    Call model.generate_content inside a span with size and token counts.
+
+    Args:
+        model: Gemini GenerativeModel
+        prompt: Prompt text
+        stage: Span name
+        **kwargs: Passed through to generate_content
+
+    Returns:
+        The Gemini response
+    """
+    with span(stage, kind="llm", model=Config.GEMINI_MODEL, input_size=len(prompt)) as active:
+        response = model.generate_content(prompt, **kwargs)
+        if not kwargs.get("stream"):
+            _record_usage(active, response)
+        return response
+
+
+async def traced_generate_async(model: Any, prompt: str, stage: str, **kwargs) -> Any:
+    """Async counterpart of traced_generate."""
+    with span(stage, kind="llm", model=Config.GEMINI_MODEL, input_size=len(prompt)) as active:
+        response = await model.generate_content_async(prompt, **kwargs)
+        if not kwargs.get("stream"):
+            _record_usage(active, response)
+        return response
+
+
+def _stream_span(stage: str, prompt: str) -> Span:
+    """
+    Span for a streamed generation.
+
+    Generators are suspended between chunks, so the span is created
+    without becoming the current span and recorded when the stream ends.
+    """
+    parent = _current_span.get()
+    request_id = _current_request.get() or (parent.request_id if parent else None) or new_request_id()
+    active = Span(stage, request_id, parent.span_id if parent else None)
+    active.set(kind="llm", model=Config.GEMINI_MODEL, input_size=len(prompt), stream=True)
+    return active
+
+
+def _finish_stream_span(active: Span, start: float, size: int, chunks: int) -> None:
+    active.duration_ms = (time.perf_counter() - start) * 1000
+    active.set(output_size=size, chunks=chunks)
+    if Config.TRACING_ENABLED:
+        tracer.record(active)
+
+
+def traced_stream(model: Any, prompt: str, stage: str, **kwargs) -> Iterator[str]:
+    """
+    Stream generated text chunks, recording time to first chunk.
+
+    Args:
+        model: Gemini GenerativeModel
+        prompt: Prompt text
+        stage: Span name
+        **kwargs: Passed through to generate_content
+
+    Yields:
+        Text chunks as they arrive
+    """
+    active = _stream_span(stage, prompt)
+    start = time.perf_counter()
+    size = chunks = 0
+    try:
+        for chunk in model.generate_content(prompt, stream=True, **kwargs):
+            text = chunk.text
+            if not chunks:
+                active.set(first_chunk_ms=round((time.perf_counter() - start) * 1000, 3))
+            size += len(text)
+            chunks += 1
+            yield text
+    except BaseException as e:
+        active.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _finish_stream_span(active, start, size, chunks)
+
+
+async def traced_stream_async(model: Any, prompt: str, stage: str, **kwargs) -> AsyncIterator[str]:
+    """Async counterpart of traced_stream."""
+    active = _stream_span(stage, prompt)
+    start = time.perf_counter()
+    size = chunks = 0
+    try:
+        async for chunk in await model.generate_content_async(prompt, stream=True, **kwargs):
+            text = chunk.text
+            if not chunks:
+                active.set(first_chunk_ms=round((time.perf_counter() - start) * 1000, 3))
+            size += len(text)
+            chunks += 1
+            yield text
+    except BaseException as e:
+        active.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _finish_stream_span(active, start, size, chunks)